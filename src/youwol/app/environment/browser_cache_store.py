@@ -1,12 +1,14 @@
 # standard library
-import base64
-import binascii
+import asyncio
 import dataclasses
 import datetime
 import json
+import mmap
+import os
 import re
 import time
 
+from collections import OrderedDict
 from inspect import isawaitable
 from pathlib import Path
 
@@ -16,13 +18,19 @@ from typing import NamedTuple, TextIO
 # third parties
 from pydantic import BaseModel
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import FileResponse, Response
 
 # Youwol application
 from youwol.app.environment.models.models_config import Configuration
 
 # Youwol utilities
-from youwol.utils import Context, YouwolHeaders, log_info
+from youwol.utils import (
+    Context,
+    YouwolHeaders,
+    is_not_modified,
+    log_info,
+    not_modified_response,
+)
 from youwol.utils.crypto.digest import compute_digest
 
 
@@ -47,6 +55,14 @@ class BrowserCacheItem(BaseModel):
     """
     Expiration time (EPOCH).
     """
+    size: int | None = None
+    """
+    Size in bytes of the associated file when the item has been cached.
+    """
+    mtime: float | None = None
+    """
+    Last modification time (EPOCH) of the associated file when the item has been cached.
+    """
 
 
 class BrowserCacheResponse(NamedTuple):
@@ -73,6 +89,16 @@ class BrowserCacheStore:
     :class:`BrowserCache <youwol.app.environment.models.models_config.BrowserCache>` class,
     its documentation provides the rationales and overall explanations of this layer.
 
+    The store is a LRU cache bounded by
+    :attr:`BrowserCache.maxCount <youwol.app.environment.models.models_config.BrowserCache.maxCount>` and
+    :attr:`BrowserCache.maxSize <youwol.app.environment.models.models_config.BrowserCache.maxSize>`,
+    both enforced each time an item is written.
+    When `mode` is `disk`, the index is persisted as an append-only JSON-lines file (one record per written or
+    evicted item), compacted when it grows over twice the number of live entries.
+    It is loaded lazily in a background thread when the cache is first initialized: requests received in the meantime
+    are not served from the cache, but they can still populate it.
+    Validity of an item is checked from the size and modification time of its file (no read of the content involved).
+
     Caching a resource within this store is an opt-in feature chosen by the backend that initially serves the resource.
     This functionality operates by modifying a `Response` accordingly, utilizing a specific header. Here's an example:
 
@@ -95,7 +121,12 @@ class BrowserCacheStore:
         self._file_key: str | None = None
         self._output_file: TextIO | None = None
         self._output_file_path: Path | None = None
-        self._items: dict[str, BrowserCacheItem] = {}
+        self._items: OrderedDict[str, BrowserCacheItem] = OrderedDict()
+        self._total_size = 0
+        self._records_count = 0
+        self._loading: asyncio.Task | None = None
+        self._compacting: asyncio.Task | None = None
+        self._pending_records: list[str] = []
 
     async def cache_if_needed(
         self, request: Request, response: Response, context: Context
@@ -161,6 +192,19 @@ class BrowserCacheStore:
 
             key = self._get_key(request=request)
             info = YouwolHeaders.get_youwol_browser_cache_info(response=response)
+            try:
+                stat = os.stat(info.filepath)
+            except FileNotFoundError:
+                await ctx.warning(
+                    "The file referenced by the response does not exist",
+                    data={"file": info.filepath},
+                )
+                return
+
+            if stat.st_size > self.yw_config.system.browserEnvironment.cache.maxSize:
+                await ctx.info("The resource is larger than the cache's 'maxSize'.")
+                return
+
             item = BrowserCacheItem(
                 key=key,
                 file=info.filepath,
@@ -168,11 +212,14 @@ class BrowserCacheStore:
                 expirationTime=self._get_expiration_time(
                     response.headers.get("cache-control")
                 ),
+                size=stat.st_size,
+                mtime=stat.st_mtime,
             )
-            self._items[key] = item
-            if self._output_file:
-                self._write_items(items=[item], fp=self._output_file)
-                await ctx.info("Item written successfully.")
+            evicted = self._put(item)
+            self._persist(items=[item], evicted=evicted)
+            if evicted:
+                await ctx.info(f"{len(evicted)} least recently used item(s) evicted.")
+            await ctx.info("Item written successfully.")
 
             return item
 
@@ -188,8 +235,12 @@ class BrowserCacheStore:
         *  the :attr:`BrowserCache.ignore <youwol.app.environment.models.models_config.BrowserCache.ignore>` attribute
            does not resolve to `True`.
         *  The key computed from the incoming request is associated to an item in the cache.
+        *  The item is not expired.
         *  The file associated to the item does exist on the disk.
-        *  The content-length of the file did not change since the original publication.
+        *  The size & modification time of the file did not change since the original publication.
+
+        If the request is conditional and the validators of the cached item (`ETag`, `Last-Modified`) match,
+        a `304 Not Modified` response is returned.
 
         Parameters:
             request: The incoming request.
@@ -222,10 +273,34 @@ class BrowserCacheStore:
 
             item = self._items[key]
             file_path = Path(item.file)
-            if not file_path.exists():
-                self._items.pop(key)
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                self._remove(key)
+                return
+
+            if time.time() > item.expirationTime:
+                await ctx.info("Item expired", data={"key": key})
+                self._remove(key)
                 return
 
+            if not self._is_up_to_date(item=item, stat=stat):
+                await ctx.warning(
+                    text=f"The resource at {file_path} was initially chosen for caching, "
+                    f"but its content has since changed",
+                    data=item,
+                )
+                self._remove(key)
+                return
+
+            self._items.move_to_end(key)
+
+            if is_not_modified(request=request, headers=item.headers):
+                await ctx.info("Item not modified since the browser's cached version")
+                response = not_modified_response(headers=item.headers)
+                response.headers[YouwolHeaders.youwol_origin] = "browser-cache"
+                return BrowserCacheResponse(response=response, item=item)
+
             range_header = request.headers.get("Range")
             if range_header:
                 # If Range header is present, serve the requested range of bytes
@@ -242,27 +317,15 @@ class BrowserCacheStore:
                     status_code=206,
                     headers={
                         **item.headers,
-                        "Content-Range": f"bytes {start}-{end}/{file_path.stat().st_size}",
+                        "Content-Range": f"bytes {start}-{end}/{stat.st_size}",
                         YouwolHeaders.youwol_origin: "browser-cache",
                     },
                 )
                 return BrowserCacheResponse(response=response, item=item)
 
-            content = file_path.read_bytes()
-            if (
-                "content-length" in item.headers
-                and str(len(content)) != item.headers["content-length"]
-            ):
-                await ctx.warning(
-                    text=f"The resource at {file_path} was initially chosen for caching, "
-                    f"but its content has since changed",
-                    data=item,
-                )
-                return
-
-            response = Response(
-                status_code=200,
-                content=content,
+            response = FileResponse(
+                path=file_path,
+                stat_result=stat,
                 headers={**item.headers, YouwolHeaders.youwol_origin: "browser-cache"},
             )
             return BrowserCacheResponse(response=response, item=item)
@@ -272,6 +335,10 @@ class BrowserCacheStore:
         Closes the underlying file on disk if
         :attr:`BrowserCache.mode <youwol.app.environment.models.models_config.BrowserCache.mode>` is `disk`.
         """
+        if self._loading:
+            self._loading.cancel()
+        if self._compacting:
+            self._compacting.cancel()
         if self._output_file:
             log_info("BrowserCacheStore: close file")
             self._output_file.close()
@@ -308,6 +375,10 @@ class BrowserCacheStore:
             Number of items deleted.
         """
         async with context.start(action="BrowserCacheStore.clear") as ctx:
+            if self._loading:
+                await self._loading
+            if self._compacting:
+                await self._compacting
             items_count = len(self._items)
             await ctx.info(
                 text=f"Clear {items_count} cached items in memory",
@@ -316,11 +387,21 @@ class BrowserCacheStore:
             if memory:
                 await ctx.info(text="Clear in-memory items")
                 self._items.clear()
+                self._total_size = 0
 
-            if file and self.yw_config.system.browserEnvironment.cache.mode == "disk":
+            if (
+                file
+                and self._output_file
+                and self.yw_config.system.browserEnvironment.cache.mode == "disk"
+            ):
                 await ctx.info(text="Clear file")
                 self._output_file.truncate(0)
                 self._output_file.write(self._headline())
+                self._output_file.flush()
+                self._records_count = 0
+                if not memory:
+                    # Remaining in-memory items are still expected to be found in the file.
+                    self._persist(items=list(self._items.values()), evicted=[])
 
             return items_count
 
@@ -343,89 +424,189 @@ class BrowserCacheStore:
                 # The initialization is OK, no output file is needed here.
                 return True
 
-            log_info(
-                message="BrowserCacheStore: recover cached entries from persisted file..."
-            )
-            await ctx.info(text="Recover cached entries from persisted file...")
             cache_dir = Path(
                 self.yw_config.system.browserEnvironment.cache.cachesFolder
             )
             cache_dir.mkdir(parents=True, exist_ok=True)
             self._output_file_path = (
                 cache_dir / self._get_session_key(request)
-            ).with_suffix(".txt")
-            if not self._output_file_path.exists():
-
-                await ctx.info(
-                    text="Output file does not exist, proceed to creation",
-                    data={"file": self._output_file_path},
-                )
-
-                with open(self._output_file_path, "a", encoding="UTF-8") as fp:
-                    fp.write(self._headline())
-
-            corrupted = []
-            expired = []
-            duplicates = False
-
-            def sanity_check(item: BrowserCacheItem | None):
-                if not item or not Path(item.file).exists():
-                    corrupted.append(item)
-                    return False
-
-                if time.time() > item.expirationTime:
-                    expired.append(item)
-                    return False
-                return True
-
-            max_count = self.yw_config.system.browserEnvironment.cache.maxCount
+            ).with_suffix(".jsonl")
+            await ctx.info(
+                text="Recover cached entries from persisted file in background",
+                data={"file": self._output_file_path},
+            )
+            self._loading = asyncio.create_task(self._load())
+            return True
 
-            with open(self._output_file_path, encoding="UTF-8") as file:
-                content = file.read()
-                lines = content.split("\n")[1:]
-                items = [BrowserCacheStore._decode_line(line) for line in lines if line]
-                items = [item for item in items if sanity_check(item)]
-                self._items = {**self._items, **{item.key: item for item in items}}
-                log_info(
-                    message=f"BrowserCacheStore: loaded {len(items)} documents from {self._output_file_path}"
-                )
+    async def _load(self):
+        """
+        Loads the persisted index in a background thread, then merges it with the items cached in the meantime.
+        The file is compacted if needed before being opened in append mode.
+        """
+        log_info(
+            message="BrowserCacheStore: recover cached entries from persisted file..."
+        )
+        path = self._output_file_path
+        try:
+            loaded, records_count = await asyncio.to_thread(self._read_index, path)
+        except Exception as e:
+            # The index is re-written from the items cached in the meantime.
+            log_info(
+                f"BrowserCacheStore: reading of index file {path} failed, start a new one: {e}"
+            )
+            loaded, records_count = OrderedDict(), -1
+
+        # Items cached while loading are more recent than the persisted ones.
+        for key, item in self._items.items():
+            loaded.pop(key, None)
+            loaded[key] = item
+        self._items = loaded
+        self._total_size = sum(item.size or 0 for item in self._items.values())
+        self._evict()
+        log_info(
+            message=f"BrowserCacheStore: loaded {len(self._items)} documents from {path}"
+        )
+        self._records_count = records_count
+        if records_count != len(self._items) or self._pending_records:
+            log_info(
+                message=f"BrowserCacheStore: compact index file {path} "
+                f"({len(self._items)} items)"
+            )
+            self._pending_records.clear()
+            items = list(self._items.values())
+            await asyncio.to_thread(self._compact, path, items)
+            self._records_count = len(items)
+        # The pointer is kept in memory to avoid extra opening each time writing is needed.
+        # The 'stop()' method is required to be called each time a config. is reloaded
+        # or when py-youwol is terminated.
+        # This is executed in `YouwolEnvironmentFactory`.
+        self._output_file = open(  # pylint: disable=consider-using-with
+            path, "a", encoding="UTF-8"
+        )
+        self._loading = None
+        # Records of items cached during the compaction.
+        self._output_file.writelines(self._pending_records)
+        self._output_file.flush()
+        self._records_count += len(self._pending_records)
+        self._pending_records.clear()
+
+    def _read_index(self, path: Path) -> tuple[OrderedDict[str, BrowserCacheItem], int]:
+        """
+        Reads the persisted index (executed off the event loop).
 
-                await ctx.info(
-                    text="loaded {len(items)} documents from {self._output_file_path}"
+        Returns:
+            The valid items in LRU order & the count of records found in the file.
+        """
+        items: OrderedDict[str, BrowserCacheItem] = OrderedDict()
+        if not path.exists() or not path.stat().st_size:
+            return items, -1
+
+        records_count = 0
+        with open(path, "rb") as fp, mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if mm.readline() != self._headline().encode():
+                # Outdated format: the file will be re-written.
+                return items, -1
+            for line in iter(mm.readline, b""):
+                records_count += 1
+                key, item = BrowserCacheStore._decode_line(line)
+                if key is None:
+                    continue
+                items.pop(key, None)
+                if item:
+                    items[key] = item
+
+        now = time.time()
+        for key, item in list(items.items()):
+            try:
+                stat = os.stat(item.file)
+            except FileNotFoundError:
+                items.pop(key)
+                continue
+            if now > item.expirationTime or not self._is_up_to_date(item, stat):
+                items.pop(key)
+
+        return items, records_count
+
+    def _compact(self, path: Path, items: list[BrowserCacheItem]):
+        """
+        Re-writes the persisted index with only the provided items (executed off the event loop).
+        """
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="UTF-8") as fp:
+            fp.write(self._headline())
+            fp.writelines(self._encode_line(item) + "\n" for item in items)
+        os.replace(tmp_path, path)
+
+    def _put(self, item: BrowserCacheItem) -> list[BrowserCacheItem]:
+        previous = self._items.pop(item.key, None)
+        if previous:
+            self._total_size -= previous.size or 0
+        self._items[item.key] = item
+        self._total_size += item.size or 0
+        return self._evict()
+
+    def _remove(self, key: str):
+        item = self._items.pop(key, None)
+        if item:
+            self._total_size -= item.size or 0
+            self._persist(items=[], evicted=[item])
+
+    def _evict(self) -> list[BrowserCacheItem]:
+        config = self.yw_config.system.browserEnvironment.cache
+        evicted = []
+        while len(self._items) > config.maxCount or (
+            self._total_size > config.maxSize and len(self._items) > 1
+        ):
+            _, item = self._items.popitem(last=False)
+            self._total_size -= item.size or 0
+            evicted.append(item)
+        return evicted
+
+    def _persist(self, items: list[BrowserCacheItem], evicted: list[BrowserCacheItem]):
+        if self.yw_config.system.browserEnvironment.cache.mode != "disk":
+            return
+        records = [self._encode_line(item) + "\n" for item in items] + [
+            self._encode_deletion(item.key) + "\n" for item in evicted
+        ]
+        if not self._output_file:
+            # Still loading or compacting: records are appended once the index is compacted.
+            self._pending_records.extend(records)
+            return
+        self._output_file.writelines(records)
+        self._output_file.flush()
+        self._records_count += len(records)
+        if self._records_count > 2 * max(len(self._items), 1) + 100:
+            self._output_file.close()
+            self._output_file = None
+            self._compacting = asyncio.ensure_future(
+                self._compact_in_background(
+                    self._output_file_path, list(self._items.values())
                 )
-
-                if len(self._items.keys()) != len(items):
-                    log_info(
-                        message=f"BrowserCacheStore: found {len(items) - len(self._items.keys())} duplicated items, "
-                        f"only the latest will be kept."
-                    )
-                    duplicates = True
-
-                if len(self._items.keys()) > max_count:
-                    log_info(
-                        message=f"BrowserCacheStore: maximum count of cached items reached "
-                        f"({self._items.keys()}/{max_count})."
-                    )
-
-                if corrupted:
-                    log_info(
-                        message=f"BrowserCacheStore: found {len(corrupted)} corrupted items, proceed to remove them"
-                    )
-
-            if duplicates or corrupted or expired or len(items) > max_count:
-                with open(self._output_file_path, "w", encoding="UTF-8") as fp:
-                    fp.write(self._headline())
-                    items_to_keep = list(self._items.values())[-max_count:]
-                    self._write_items(items=items_to_keep, fp=fp)
-
-            # The pointer is kept in memory to avoid extra opening each time writing is needed.
-            # The 'stop()' method is required to be called each time a config. is reloaded
-            # or when py-youwol is terminated.
-            # This is executed in `YouwolEnvironmentFactory`.
-            self._output_file = open(  # pylint: disable=consider-using-with
-                self._output_file_path, "a", encoding="UTF-8"
             )
-            return True
+
+    async def _compact_in_background(self, path: Path, items: list[BrowserCacheItem]):
+        """
+        Compacts the persisted index off the event loop, records persisted meanwhile are then appended.
+        """
+        try:
+            await asyncio.to_thread(self._compact, path, items)
+            self._records_count = len(items)
+        except asyncio.CancelledError:
+            # Stopped: the file is not re-opened.
+            self._compacting = None
+            raise
+        except Exception as e:
+            log_info(f"BrowserCacheStore: compaction of index file {path} failed: {e}")
+        self._compacting = None
+        self._output_file = open(  # pylint: disable=consider-using-with
+            path, "a", encoding="UTF-8"
+        )
+        self._output_file.writelines(self._pending_records)
+        self._output_file.flush()
+        self._records_count += len(self._pending_records)
+        self._pending_records.clear()
 
     def _get_session_key(self, request: Request):
         if self._file_key:
@@ -466,13 +647,16 @@ class BrowserCacheStore:
         # This branch should not occur because 'max-age=' is explicitly asserted in `persist_if_needed`
         return datetime.datetime.now(datetime.timezone.utc).timestamp()
 
-    def _write_items(self, items: list[BrowserCacheItem], fp: TextIO):
-        for item in items:
-            line = self._encode_line(item)
-            fp.write(line + "\n")
-
     def _headline(self) -> str:
-        return f"BrowserCacheStore V0 {self._file_key} \n"
+        return f"BrowserCacheStore V1 {self._file_key} \n"
+
+    @staticmethod
+    def _is_up_to_date(item: BrowserCacheItem, stat: os.stat_result) -> bool:
+        if item.size is None or item.mtime is None:
+            return item.headers.get("content-length", str(stat.st_size)) == str(
+                stat.st_size
+            )
+        return item.size == stat.st_size and item.mtime == stat.st_mtime
 
     @staticmethod
     def _is_get_request_from_browser(request: Request) -> bool:
@@ -487,20 +671,32 @@ class BrowserCacheStore:
 
     @staticmethod
     def _encode_line(item: BrowserCacheItem) -> str:
-        json_txt = json.dumps(item.dict())
-        return base64.urlsafe_b64encode(str.encode(json_txt)).decode()
+        return json.dumps(item.dict(), separators=(",", ":"))
+
+    @staticmethod
+    def _encode_deletion(key: str) -> str:
+        return json.dumps({"key": key, "deleted": True}, separators=(",", ":"))
 
     @staticmethod
-    def _decode_line(line: str) -> BrowserCacheItem | None:
+    def _decode_line(line: bytes) -> tuple[str | None, BrowserCacheItem | None]:
+        """
+        Decodes a line of the persisted index.
+
+        Returns:
+            The key of the record (`None` if the line is corrupted), and the item (`None` for a deletion record).
+        """
         try:
-            json_txt = base64.urlsafe_b64decode(str.encode(line)).decode()
-        except binascii.Error:
-            return None
+            record = json.loads(line)
+        except ValueError:
+            return None, None
+        if not isinstance(record, dict) or "key" not in record:
+            return None, None
+        if record.get("deleted"):
+            return record["key"], None
         try:
-            decoded = BrowserCacheItem(**json.loads(json_txt))
-            return decoded
+            return record["key"], BrowserCacheItem(**record)
         except ValueError:
-            return None
+            return None, None
 
     async def _ignore(self, request: Request, context: Context) -> bool:
         ignore_config = self.yw_config.system.browserEnvironment.cache.ignore
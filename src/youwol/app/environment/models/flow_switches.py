@@ -6,7 +6,7 @@ This file gathers :class:`configuration <youwol.app.environment.models.models_co
 # typing
 
 # third parties
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError
 from aiohttp.web_request import Request
 from pydantic import BaseModel
 from starlette.middleware.base import RequestResponseEndpoint
@@ -24,8 +24,9 @@ from youwol.utils import (
     YouWolException,
     YouwolHeaders,
     encode_id,
-    is_server_http_alive,
+    liveness_registry,
     redirect_request,
+    reverse_proxy,
     youwol_exception_handler,
 )
 
@@ -255,7 +256,7 @@ class CdnSwitch(FlowSwitch):
     async def info(self):
         return DispatchInfo(
             name=self.packageName,
-            activated=is_server_http_alive(f"http://localhost:{self.port}"),
+            activated=await liveness_registry.is_alive(self.destination_url()),
             parameters={
                 "package": self.packageName,
                 "redirected to": f"localhost:{self.port}",
@@ -282,13 +283,16 @@ class CdnSwitch(FlowSwitch):
             )
             return False
 
-        if not is_server_http_alive(f"http://localhost:{self.port}"):
+        if not await liveness_registry.is_alive(self.destination_url()):
             await context.info(text=f"CdnSwitch[{self}]: ws not listening")
             return False
 
         await context.info(text=f"CdnSwitch[{self}]: MATCHING")
         return True
 
+    def destination_url(self) -> str:
+        return f"http://localhost:{self.port}"
+
     async def switch(
         self, incoming_request: Request, context: Context
     ) -> Response | None:
@@ -313,17 +317,19 @@ class CdnSwitch(FlowSwitch):
     async def _forward_request(
         self, rest_of_path: str, headers: dict[str, str]
     ) -> Response | None:
-        dest_url = f"http://localhost:{self.port}/{rest_of_path}"
-
-        async with ClientSession(auto_decompress=False) as session:
-            async with await session.get(url=dest_url, headers=headers) as resp:
-                if resp.status < 400:
-                    content = await resp.read()
-                    return Response(
-                        status_code=resp.status,
-                        content=content,
-                        headers=dict(resp.headers.items()),
-                    )
+        dest_url = f"{self.destination_url()}/{rest_of_path}"
+
+        try:
+            resp = await reverse_proxy.request(
+                method="GET", url=dest_url, headers=headers
+            )
+        except ClientConnectionError:
+            liveness_registry.report_failure(self.destination_url())
+            raise
+        if resp.status < 400:
+            return reverse_proxy.streaming_response(resp)
+        resp.release()
+        return None
 
     def __str__(self):
         return f"serving cdn package '{self.packageName}' from local port '{self.port}'"
@@ -375,13 +381,13 @@ class RedirectSwitch(FlowSwitch):
     Corresponding destination, e.g. 'http://localhost:2001'
     """
 
-    def is_listening(self):
-        return is_server_http_alive(url=self.destination)
+    async def is_listening(self) -> bool:
+        return await liveness_registry.is_alive(self.destination)
 
     async def info(self) -> DispatchInfo:
         return DispatchInfo(
             name=self.origin,
-            activated=self.is_listening(),
+            activated=await self.is_listening(),
             parameters={"from url": self.origin, "redirected to": self.destination},
         )
 
@@ -393,7 +399,7 @@ class RedirectSwitch(FlowSwitch):
             )
             return False
 
-        if not self.is_listening():
+        if not await self.is_listening():
             await context.info(
                 f"RedirectSwitch[{self}]: destination not listening -> proceed with no dispatch"
             )
@@ -416,12 +422,16 @@ class RedirectSwitch(FlowSwitch):
             data={"origin": incoming_request.url.path, "destination": self.destination},
         )
 
-        resp = await redirect_request(
-            incoming_request=incoming_request,
-            origin_base_path=self.origin,
-            destination_base_path=self.destination,
-            headers=headers,
-        )
+        try:
+            resp = await redirect_request(
+                incoming_request=incoming_request,
+                origin_base_path=self.origin,
+                destination_base_path=self.destination,
+                headers=headers,
+            )
+        except ClientConnectionError:
+            liveness_registry.report_failure(self.destination)
+            raise
         await context.info(
             "Got response from dispatch",
             data={
@@ -155,7 +155,8 @@ class BrowserCache(BaseModel):
         *  the caching key for the session match
         *  the target URL match
 
-        When a response is cached, any associated `Cache-Control` header is replaced by `no-cache, no-store`.
+        When a response is cached, any associated `Cache-Control` header is replaced by `no-cache, no-store`
+        (or `no-cache` if it includes an `ETag` validator: the browser then revalidates it on each request).
 
         Implementation details can be found in the
         :class:`BrowserCacheStore <youwol.app.environment.browser_cache_store.BrowserCacheStore>` documentation.
@@ -200,7 +201,13 @@ class BrowserCache(BaseModel):
 
     maxCount: int = 1000
     """
-    Approximate maximum items count in the persisted file (the max-count is ensured only when YouWol start).
+    Maximum count of cached items. When reached, the least recently used items are evicted.
+    """
+
+    maxSize: int = 2 * 1024**3
+    """
+    Maximum cumulated size (in bytes) of the resources referenced by the cached items.
+    When reached, the least recently used items are evicted.
     """
 
     cachesFolder: ConfigPath = Path(tempfile.gettempdir()) / "yw" / "browser-caches"
@@ -449,6 +456,12 @@ class Command(BaseModel):
         </code-snippet>
         In the above example, two commands (one `GET` and one `POST`) are defined,
          both exposed from `/admin/custom-commands/example`.
+
+    Functions that are not coroutine functions are executed in worker threads: they can block (*e.g.* run a
+    process or parse files) without stalling the server.
+    They are executed by the
+    :class:`CommandsExecutor <youwol.app.routers.custom_commands.implementation.CommandsExecutor>`, see also
+    the query parameter `background` of the end-points.
     """
 
     name: str
@@ -476,6 +489,12 @@ class Command(BaseModel):
     The function to trigger on `DELETE`.
     """
 
+    max_concurrency: int | None = None
+    """
+    If provided, maximum count of simultaneous executions of the command (whatever the method),
+    additional invocations wait for a slot.
+    """
+
 
 class CustomEndPoints(BaseModel):
     """
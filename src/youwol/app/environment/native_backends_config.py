@@ -17,6 +17,8 @@ import youwol.backends.flux as yw_flux_backend
 import youwol.backends.stories as yw_stories_backend
 import youwol.backends.tree_db as yw_tree_db_backend
 
+from youwol.backends.cdn.resolutions_table import ResolutionsTable
+
 # Youwol utilities
 from youwol.utils import AioHttpExecutor, CdnClient, LocalStorageClient
 from youwol.utils.clients.assets.assets import AssetsClient
@@ -85,6 +87,7 @@ class BackendConfigurations:
     def reset_databases(self):
         for db in self.no_sql_databases:
             db.reset()
+        self.cdn_backend.resolutions_table.clear()
 
         for folder in self.storage_folders:
             shutil.rmtree(folder, ignore_errors=True)
@@ -97,6 +100,8 @@ def native_backends_config(
     request_executor = AioHttpExecutor(
         client_session=lambda: ClientSession(auto_decompress=False)
     )
+    # Shared by the cdn-backend & cdn-apps-server: publications invalidate the resolutions of both.
+    resolutions_table = ResolutionsTable()
 
     return BackendConfigurations(
         assets_gtw=yw_assets_gtw.Configuration(
@@ -137,6 +142,7 @@ def native_backends_config(
                 table_body=yw_cdn_backend.Constants.schema_docdb,
                 secondary_indexes=[],
             ),
+            resolutions_table=resolutions_table,
         ),
         tree_db_backend=yw_tree_db_backend.Configuration(
             doc_dbs=create_doc_dbs(
@@ -222,6 +228,7 @@ def native_backends_config(
                 url_base=f"{url_base}/assets-gateway",
                 request_executor=request_executor,
             ),
+            resolutions_table=resolutions_table,
         ),
         cdn_sessions_storage=yw_cdn_sessions_storage.Configuration(
             storage=LocalStorageClient(
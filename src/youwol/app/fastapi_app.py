@@ -28,6 +28,7 @@ from youwol.app.middlewares import (
     LocalCloudHybridizerMiddleware,
 )
 from youwol.app.routers import admin, backends, native_backends, python
+from youwol.app.routers.custom_commands.implementation import commands_executor
 from youwol.app.routers.environment import AssetsDownloader
 from youwol.app.routers.environment.download_assets import (
     DownloadDataTask,
@@ -40,6 +41,9 @@ from youwol.app.routers.environment.download_assets.custom_asset import (
 )
 from youwol.app.routers.projects import ProjectLoader
 
+# Youwol backends
+from youwol.backends.assets.thumbnails import thumbnails_generator
+
 # Youwol utilities
 from youwol.utils import (
     CleanerThread,
@@ -48,6 +52,7 @@ from youwol.utils import (
     YouwolHeaders,
     encode_id,
     factory_local_cache,
+    reverse_proxy,
     unexpected_exception_handler,
     youwol_exception_handler,
     yw_doc_version,
@@ -89,6 +94,7 @@ assets_downloader = AssetsDownloader(
         "custom-asset": DownloadCustomAssetTask,
     },
     worker_count=4,
+    prefetch_parallelism=4,
 )
 
 cleaner_thread = CleanerThread()
@@ -364,6 +370,9 @@ async def shutdown_event():
     ProjectLoader.stop()
     YouwolEnvironmentFactory.stop_current_env()
     await assets_downloader.stop_workers()
+    await reverse_proxy.close()
+    commands_executor.shutdown()
+    thumbnails_generator.shutdown()
 
 
 async def create_app():
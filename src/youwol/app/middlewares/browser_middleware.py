@@ -112,7 +112,8 @@ class BrowserMiddleware(BaseHTTPMiddleware):
         Middleware logic to control interaction with browser:
             *  Eventually retrieves/caches responses from the
             :class:`BrowserCacheStore <youwol.app.environment.browser_cache_store.BrowserCacheStore>`.
-            If a response is cached with `BrowserCacheStore`, `Cache-Control` header is set to `no-cache, no-store`.
+            If a response is cached with `BrowserCacheStore`, `Cache-Control` header is set to `no-cache, no-store`
+            (or `no-cache` if the response includes an `ETag` validator, enabling revalidation).
             *  Set up the :class:``youwol` cookie <LocalYouwolCookie>`.
             *  Apply `onEnter` and `onExit` user defined callbacks
              (see :class:`BrowserCache <youwol.app.environment.models.models_config.BrowserCache>`)
@@ -130,7 +131,11 @@ class BrowserMiddleware(BaseHTTPMiddleware):
             if browser_env.onExit:
                 resp = browser_env.onExit(request, resp, ctx)
             if is_cached:
-                resp.headers["Cache-Control"] = "no-cache, no-store"
+                # With validators, the browser can keep the response but needs to revalidate it (served by the
+                # `BrowserCacheStore`).
+                resp.headers["Cache-Control"] = (
+                    "no-cache" if "etag" in resp.headers else "no-cache, no-store"
+                )
             return resp
 
         async with Context.from_request(request).start_middleware(
@@ -89,7 +89,16 @@ class Download(AbstractLocalCloudDispatch):
         def apply_from_remote_headers(response: Response):
             response.headers[YouwolHeaders.youwol_origin] = env.get_remote_info().host
             if match[0] == "package":
-                response.headers.update({"cache-control": "no-cache, no-store"})
+                # Validators are forwarded: the browser can keep the response but needs to revalidate it.
+                response.headers.update(
+                    {
+                        "cache-control": (
+                            "no-cache"
+                            if "etag" in response.headers
+                            else "no-cache, no-store"
+                        )
+                    }
+                )
 
         async with context.start(action="Download.apply") as ctx:
             assets_downloader = await ctx.get("assets_downloader", AssetsDownloader)
@@ -0,0 +1,224 @@
+# standard library
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import time
+import uuid
+
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# typing
+from typing import Any
+
+# Youwol application
+from youwol.app.environment import Command
+
+# Youwol utilities
+from youwol.utils import JSON, Coalescer
+from youwol.utils.context import Context
+
+# relative
+from .models import CmdMethod, CommandJob, CommandJobStatus
+
+
+class CommandsExecutor:
+    """
+    Executes the :class:`custom commands <youwol.app.environment.models.models_config.Command>`:
+
+    *  Coroutine functions are executed on the event loop, other callables in a pool of worker threads
+       (awaitables they return are then awaited on the event loop): synchronous commands do not block the server.
+    *  Simultaneous executions of a command are limited to its
+       :attr:`max_concurrency <youwol.app.environment.models.models_config.Command.max_concurrency>`.
+    *  Simultaneous `GET` invocations of a command are executed once; invocations using other methods are not
+       coalesced, they may not be idempotent.
+    *  Executions can be submitted as background jobs, their status is polled using
+       :meth:`job <youwol.app.routers.custom_commands.implementation.CommandsExecutor.job>`.
+    """
+
+    def __init__(self, max_workers: int = 8, max_jobs: int = 100):
+        """
+        Initializes a new instance, the pool is started on first use.
+
+        Parameters:
+            max_workers: Count of worker threads.
+            max_jobs: Maximum count of completed jobs kept, the oldest ones are removed first.
+        """
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__semaphores: dict[tuple[str, int], asyncio.Semaphore] = {}
+        self.__coalescer: Coalescer[JSON] = Coalescer()
+        self.__jobs: dict[str, CommandJob] = {}
+        self.__tasks: dict[str, asyncio.Future[JSON]] = {}
+
+    async def execute(
+        self,
+        command: Command,
+        method: CmdMethod,
+        body: JSON | None,
+        context: Context,
+    ) -> JSON:
+        """
+        Executes a command.
+
+        Parameters:
+            command: The command.
+            method: The method, the corresponding callable of the command is expected to be defined.
+            body: Body of the request for `POST` & `PUT` methods.
+            context: Current context, provided to the command.
+
+        Returns:
+            The result of the command.
+        """
+        if method != CmdMethod.GET:
+            return await self.__execute(
+                command=command, method=method, body=body, context=context
+            )
+        if command.name in self.__coalescer:
+            await context.info(
+                "Identical invocation in progress, waiting for its result"
+            )
+        result, _ = await self.__coalescer.run(
+            command.name,
+            lambda: self.__execute(
+                command=command, method=method, body=body, context=context
+            ),
+        )
+        return result
+
+    def submit(
+        self,
+        command: Command,
+        method: CmdMethod,
+        body: JSON | None,
+        context: Context,
+    ) -> CommandJob:
+        """
+        Executes a command in the background, see
+        :meth:`execute <youwol.app.routers.custom_commands.implementation.CommandsExecutor.execute>`.
+
+        Parameters:
+            command: The command.
+            method: The method.
+            body: Body of the request for `POST` & `PUT` methods.
+            context: Current context, provided to the command.
+
+        Returns:
+            The job, with status `running`.
+        """
+        job = CommandJob(
+            jobId=str(uuid.uuid4()),
+            command=command.name,
+            method=method,
+            status=CommandJobStatus.RUNNING,
+            startedAt=time.time(),
+        )
+        task = asyncio.ensure_future(
+            self.execute(command=command, method=method, body=body, context=context)
+        )
+        self.__jobs[job.jobId] = job
+        self.__tasks[job.jobId] = task
+        task.add_done_callback(functools.partial(self.__job_done, job))
+        completed = [
+            job_id
+            for job_id, other in self.__jobs.items()
+            if other.status != CommandJobStatus.RUNNING
+        ]
+        excess = len(self.__jobs) - self.max_jobs
+        if excess > 0:
+            for job_id in completed[:excess]:
+                del self.__jobs[job_id]
+        return job
+
+    def job(self, job_id: str) -> CommandJob | None:
+        """
+        Retrieves a job.
+
+        Parameters:
+            job_id: ID of the job.
+
+        Returns:
+            The job, `None` if not found.
+        """
+        return self.__jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker threads once their current executions are completed, pending ones are cancelled.
+        """
+        if self.__executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    async def __execute(
+        self, command: Command, method: CmdMethod, body: JSON | None, context: Context
+    ) -> JSON:
+        fct, args = self.__callable(command=command, method=method, body=body)
+        fct = functools.partial(fct, *args, context)
+        semaphore = self.__semaphore(command)
+        async with semaphore or contextlib.nullcontext():
+            if inspect.iscoroutinefunction(fct):
+                result = fct()
+            else:
+                # Like `asyncio.to_thread`, but using the dedicated pool: long commands do not starve it.
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self.__get_executor(),
+                    functools.partial(contextvars.copy_context().run, fct),
+                )
+            return await result if isinstance(result, Awaitable) else result
+
+    @staticmethod
+    def __callable(
+        command: Command, method: CmdMethod, body: JSON | None
+    ) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+        dos: dict[CmdMethod, tuple[Callable[..., Any] | None, tuple[Any, ...]]] = {
+            CmdMethod.GET: (command.do_get, ()),
+            CmdMethod.POST: (command.do_post, (body,)),
+            CmdMethod.PUT: (command.do_put, (body,)),
+            CmdMethod.DELETE: (command.do_delete, ()),
+        }
+        fct, args = dos[method]
+        if fct is None:
+            raise ValueError(
+                f"Method {method} not defined for command '{command.name}'"
+            )
+        return fct, args
+
+    def __semaphore(self, command: Command) -> asyncio.Semaphore | None:
+        if not command.max_concurrency:
+            return None
+        key = (command.name, command.max_concurrency)
+        if key not in self.__semaphores:
+            self.__semaphores[key] = asyncio.Semaphore(command.max_concurrency)
+        return self.__semaphores[key]
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if not self.__executor:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="custom-commands"
+            )
+        return self.__executor
+
+    def __job_done(self, job: CommandJob, task: "asyncio.Future[JSON]") -> None:
+        self.__tasks.pop(job.jobId, None)
+        job.endedAt = time.time()
+        if task.cancelled():
+            job.status = CommandJobStatus.FAILED
+            job.error = "Cancelled"
+            return
+        error = task.exception()
+        if error:
+            job.status = CommandJobStatus.FAILED
+            job.error = f"{type(error).__name__}: {error}"
+            return
+        job.status = CommandJobStatus.SUCCEEDED
+        job.result = task.result()
+
+
+commands_executor = CommandsExecutor()
+"""
+Executor of the custom commands of the environment, its worker threads are stopped when the application shuts down.
+"""
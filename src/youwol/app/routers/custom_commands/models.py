@@ -0,0 +1,72 @@
+# standard library
+from enum import Enum
+
+# typing
+from typing import Any
+
+# third parties
+from pydantic import BaseModel
+
+
+class CmdMethod(Enum):
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    DELETE = "DELETE"
+
+
+class CommandJobStatus(Enum):
+    """
+    Status of a command executed in the background.
+    """
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class CommandJob(BaseModel):
+    """
+    Execution of a command in the background, see
+    :meth:`CommandsExecutor.submit <youwol.app.routers.custom_commands.implementation.CommandsExecutor.submit>`.
+    """
+
+    jobId: str
+    """
+    ID of the job.
+    """
+
+    command: str
+    """
+    Name of the command.
+    """
+
+    method: CmdMethod
+    """
+    Method of the command.
+    """
+
+    status: CommandJobStatus
+    """
+    Status of the job.
+    """
+
+    result: Any = None
+    """
+    Result of the command, if succeeded.
+    """
+
+    error: str | None = None
+    """
+    Description of the error, if failed.
+    """
+
+    startedAt: float
+    """
+    Timestamp (in seconds) of the start of the job.
+    """
+
+    endedAt: float | None = None
+    """
+    Timestamp (in seconds) of the end of the job, if completed.
+    """
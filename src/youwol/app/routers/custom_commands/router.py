@@ -1,9 +1,5 @@
-# standard library
-from collections.abc import Awaitable
-from enum import Enum
-
 # third parties
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette.requests import Request
 
 # Youwol application
@@ -14,14 +10,11 @@ from youwol.app.web_socket import LogsStreamer
 from youwol.utils import JSON
 from youwol.utils.context import Context
 
-router = APIRouter()
-
+# relative
+from .implementation import commands_executor
+from .models import CmdMethod, CommandJob
 
-class CmdMethod(Enum):
-    GET = "GET"
-    POST = "POST"
-    PUT = "PUT"
-    DELETE = "DELETE"
+router = APIRouter()
 
 
 def get_command(command_name: str, method: CmdMethod, env: YouwolEnvironment):
@@ -47,16 +40,60 @@ def get_command(command_name: str, method: CmdMethod, env: YouwolEnvironment):
     return command
 
 
+async def run_command(
+    command_name: str,
+    method: CmdMethod,
+    body: JSON | None,
+    background: bool,
+    env: YouwolEnvironment,
+    ctx: Context,
+) -> JSON | CommandJob:
+    command = get_command(command_name, method, env)
+    if background:
+        job = commands_executor.submit(
+            command=command, method=method, body=body, context=ctx
+        )
+        await ctx.info("Command submitted", data=job)
+        return job
+    return await commands_executor.execute(
+        command=command, method=method, body=body, context=ctx
+    )
+
+
+@router.get(
+    "/jobs/{job_id}", summary="status of a custom command executed in background"
+)
+async def get_job(job_id: str) -> CommandJob:
+    """
+    Retrieves the status of a command executed in the background.
+
+    Parameters:
+        job_id: ID of the job, as returned when the command has been executed with `background=true`.
+
+    Returns:
+        The job, including the command's result when completed.
+    """
+    job = commands_executor.job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job
+
+
 @router.get("/{command_name}", summary="execute a GET custom command")
 async def execute_command(
-    request: Request, command_name: str, env: YouwolEnvironment = Depends(yw_config)
-) -> JSON:
+    request: Request,
+    command_name: str,
+    background: bool = Query(default=False),
+    env: YouwolEnvironment = Depends(yw_config),
+) -> JSON | CommandJob:
     """
     Execute a `GET` command.
 
     Parameters:
         request: Incoming request.
         command_name: Command name.
+        background: If `true`, the command is executed in the background and the job is returned,
+            see :func:`get_job <youwol.app.routers.custom_commands.router.get_job>`.
         env: Current environment.
 
     Returns:
@@ -71,21 +108,26 @@ async def execute_command(
         },
         with_reporters=[LogsStreamer()],
     ) as ctx:
-        command = get_command(command_name, CmdMethod.GET, env)
-        result = command.do_get(ctx)
-        return await result if isinstance(result, Awaitable) else result
+        return await run_command(
+            command_name, CmdMethod.GET, None, background, env, ctx
+        )
 
 
 @router.post("/{command_name}", summary="execute a POST custom command")
 async def execute_post_command(
-    request: Request, command_name: str, env: YouwolEnvironment = Depends(yw_config)
-) -> JSON:
+    request: Request,
+    command_name: str,
+    background: bool = Query(default=False),
+    env: YouwolEnvironment = Depends(yw_config),
+) -> JSON | CommandJob:
     """
     Execute a `POST` command.
 
     Parameters:
         request: Incoming request.
         command_name: Command name.
+        background: If `true`, the command is executed in the background and the job is returned,
+            see :func:`get_job <youwol.app.routers.custom_commands.router.get_job>`.
         env: Current environment.
 
     Returns:
@@ -101,21 +143,26 @@ async def execute_post_command(
         with_reporters=[LogsStreamer()],
     ) as ctx:
         body = await request.json()
-        command = get_command(command_name, CmdMethod.POST, env)
-        result = command.do_post(body, ctx)
-        return await result if isinstance(result, Awaitable) else result
+        return await run_command(
+            command_name, CmdMethod.POST, body, background, env, ctx
+        )
 
 
 @router.put("/{command_name}", summary="execute a PUT custom command")
 async def execute_put_command(
-    request: Request, command_name: str, env: YouwolEnvironment = Depends(yw_config)
-) -> JSON:
+    request: Request,
+    command_name: str,
+    background: bool = Query(default=False),
+    env: YouwolEnvironment = Depends(yw_config),
+) -> JSON | CommandJob:
     """
     Execute a `PUT` command.
 
     Parameters:
         request: Incoming request.
         command_name: Command name.
+        background: If `true`, the command is executed in the background and the job is returned,
+            see :func:`get_job <youwol.app.routers.custom_commands.router.get_job>`.
         env: Current environment.
 
     Returns:
@@ -131,21 +178,26 @@ async def execute_put_command(
         with_reporters=[LogsStreamer()],
     ) as ctx:
         body = await request.json()
-        command = get_command(command_name, CmdMethod.PUT, env)
-        result = command.do_put(body, ctx)
-        return await result if isinstance(result, Awaitable) else result
+        return await run_command(
+            command_name, CmdMethod.PUT, body, background, env, ctx
+        )
 
 
 @router.delete("/{command_name}", summary="execute a DELETE custom command")
 async def execute_delete_command(
-    request: Request, command_name: str, env: YouwolEnvironment = Depends(yw_config)
-) -> JSON:
+    request: Request,
+    command_name: str,
+    background: bool = Query(default=False),
+    env: YouwolEnvironment = Depends(yw_config),
+) -> JSON | CommandJob:
     """
     Execute a `DELETE` command.
 
     Parameters:
         request: Incoming request.
         command_name: Command name.
+        background: If `true`, the command is executed in the background and the job is returned,
+            see :func:`get_job <youwol.app.routers.custom_commands.router.get_job>`.
         env: Current environment.
 
     Returns:
@@ -160,6 +212,6 @@ async def execute_delete_command(
         },
         with_reporters=[LogsStreamer()],
     ) as ctx:
-        command = get_command(command_name, CmdMethod.DELETE, env)
-        result = command.do_delete(ctx)
-        return await result if isinstance(result, Awaitable) else result
+        return await run_command(
+            command_name, CmdMethod.DELETE, None, background, env, ctx
+        )
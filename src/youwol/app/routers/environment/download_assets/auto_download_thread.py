@@ -2,6 +2,7 @@
 import asyncio
 import uuid
 
+from collections.abc import Awaitable
 from enum import Enum
 
 # typing
@@ -190,19 +191,28 @@ class AssetsDownloader:
     and report on their completion status. It utilizes an `asyncio.Queue` to handle concurrent downloads.
     """
 
-    def __init__(self, factories: DownloadTaskFactory, worker_count: int):
+    def __init__(
+        self,
+        factories: DownloadTaskFactory,
+        worker_count: int,
+        prefetch_parallelism: int = 4,
+    ):
         """
         Initializes the instance.
 
         Parameters:
             factories: the factory for download task creation (w/ asset's kind).
             worker_count: the number of workers.
+            prefetch_parallelism: the maximum number of concurrent downloads when prefetching the dependencies
+                of an asset (e.g. the packages of an application's loading graph).
         """
         self.queue = asyncio.Queue()
         self.workers = []
         self.factories: DownloadTaskFactory = factories
         self.pbar = tqdm(total=0, colour="green")
         self.worker_count = worker_count
+        self.prefetch_parallelism = prefetch_parallelism
+        self.background_tasks: set[asyncio.Task] = set()
 
     def is_downloading(
         self, url: str, kind: str, raw_id: str, env: YouwolEnvironment
@@ -303,6 +313,25 @@ class AssetsDownloader:
                 pbar=self.pbar,
             )
 
+    def run_in_background(self, coroutine: Awaitable[None], name: str) -> None:
+        """
+        Runs a coroutine in the background, without occupying a worker (e.g. the prefetch of the dependencies
+        of a downloaded asset). The task is cancelled when the workers are stopped, failures are logged.
+
+        Parameters:
+            coroutine: The coroutine.
+            name: Name of the task, used when logging failures.
+        """
+        task = asyncio.ensure_future(coroutine)
+        self.background_tasks.add(task)
+
+        def on_done(done: asyncio.Task) -> None:
+            self.background_tasks.discard(done)
+            if not done.cancelled() and done.exception():
+                log_error(f"Background task '{name}' failed: {done.exception()}")
+
+        task.add_done_callback(on_done)
+
     async def start_workers(self):
         """
         Start the workers, their number is defined from the `worker_count` argument of `__init__`.
@@ -313,8 +342,9 @@ class AssetsDownloader:
 
     async def stop_workers(self):
         """
-        Stop the workers.
+        Stop the workers, and the tasks running in the background.
         """
-        for worker in self.workers:
-            worker.cancel()
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        tasks = [*self.workers, *self.background_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
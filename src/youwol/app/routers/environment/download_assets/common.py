@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Awaitable
 
 # typing
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 # third parties
 from fastapi import HTTPException
@@ -17,6 +17,7 @@ from youwol.app.routers.native_backends_config import assets_backend_config_py_y
 from youwol.backends.assets.routers.access import put_access_policy_impl
 
 # Youwol utilities
+from youwol.utils import JSON
 from youwol.utils.clients.assets.assets import AssetsClient
 from youwol.utils.clients.assets_gateway.assets_gateway import AssetsGatewayClient
 from youwol.utils.clients.treedb.treedb import TreeDbClient
@@ -95,32 +96,51 @@ async def ensure_drive(
         raise e
 
 
-async def sync_asset_data(
+class RemoteAssetData(NamedTuple):
+    """
+    Asset's metadata & access info retrieved from the remote environment.
+    """
+
+    metadata: JSON
+    access_info: JSON
+
+
+async def fetch_asset_data(
     asset_id: str, remote_gtw: AssetsGatewayClient, context: Context
+) -> RemoteAssetData:
+    async with context.start(action="Fetch remote asset data") as ctx:
+        assets_remote = remote_gtw.get_assets_backend_router()
+        metadata, access_info = await asyncio.gather(
+            assets_remote.get_asset(asset_id=asset_id, headers=ctx.headers()),
+            assets_remote.get_access_info(asset_id=asset_id, headers=ctx.headers()),
+        )
+        await ctx.info(text="asset's metadata retrieved from remote", data=metadata)
+        await ctx.info(
+            text="asset's access info retrieved from remote", data=access_info
+        )
+        return RemoteAssetData(metadata=metadata, access_info=access_info)
+
+
+async def sync_asset_data(
+    asset_id: str,
+    remote_gtw: AssetsGatewayClient,
+    context: Context,
+    remote_data: RemoteAssetData | None = None,
 ):
     async with context.start(action="Sync. asset data") as ctx:
-        assets_remote = remote_gtw.get_assets_backend_router()
+        remote_data = remote_data or await fetch_asset_data(
+            asset_id=asset_id, remote_gtw=remote_gtw, context=ctx
+        )
         assets_local = LocalClients.get_assets_client(
             await ctx.get("env", YouwolEnvironment)
         )
-        metadata = await assets_remote.get_asset(
-            asset_id=asset_id, headers=ctx.headers()
+        await assets_local.create_asset(
+            body=remote_data.metadata, headers=ctx.headers()
         )
-        await ctx.info(text="asset's metadata retrieved from remote", data=metadata)
-        await assets_local.create_asset(body=metadata, headers=ctx.headers())
         await ctx.info(text="asset created successfully locally")
 
-        access_info = await assets_remote.get_access_info(
-            asset_id=asset_id, headers=ctx.headers()
-        )
-
-        await ctx.info(
-            text="asset's access info retrieved from remote", data=access_info
-        )
-
-        access_info = access_info["ownerInfo"]
+        access_info = remote_data.access_info["ownerInfo"]
         assets_backend_config = await assets_backend_config_py_youwol()
-
         await asyncio.gather(
             put_access_policy_impl(
                 asset_id=asset_id,
@@ -142,24 +162,46 @@ async def sync_asset_data(
         )
 
 
-async def sync_explorer_data(
-    asset_id: str, remote_gtw: AssetsGatewayClient, context: Context
-):
-    env = await context.get("env", YouwolEnvironment)
+class RemoteExplorerData(NamedTuple):
+    """
+    Explorer's item & path retrieved from the remote environment.
+    """
 
-    async with context.start(action="Sync. explorer data") as ctx:
+    item: ItemResponse
+    path: PathResponse
+
+
+async def fetch_explorer_data(
+    asset_id: str, remote_gtw: AssetsGatewayClient, context: Context
+) -> RemoteExplorerData:
+    async with context.start(action="Fetch remote explorer data") as ctx:
         remote_treedb = remote_gtw.get_treedb_backend_router()
-        local_treedb = LocalClients.get_treedb_client(env)
         remote_item = await remote_treedb.get_item(
             item_id=asset_id, headers=ctx.headers()
         )
         remote_item = ItemResponse(**remote_item)
         path_item = await remote_treedb.get_path(
-            remote_item.itemId, headers=context.headers()
+            remote_item.itemId, headers=ctx.headers()
+        )
+        return RemoteExplorerData(item=remote_item, path=PathResponse(**path_item))
+
+
+async def sync_explorer_data(
+    asset_id: str,
+    remote_gtw: AssetsGatewayClient,
+    context: Context,
+    remote_data: RemoteExplorerData | None = None,
+):
+    env = await context.get("env", YouwolEnvironment)
+
+    async with context.start(action="Sync. explorer data") as ctx:
+        remote_data = remote_data or await fetch_explorer_data(
+            asset_id=asset_id, remote_gtw=remote_gtw, context=ctx
         )
-        path_item = PathResponse(**path_item)
+        local_treedb = LocalClients.get_treedb_client(env)
+        remote_item = remote_data.item
         await ensure_local_path(
-            path_item=path_item, local_treedb=local_treedb, context=ctx
+            path_item=remote_data.path, local_treedb=local_treedb, context=ctx
         )
 
         body = {
@@ -191,10 +233,26 @@ async def create_asset_local(
     ) as ctx:
         env: YouwolEnvironment = await ctx.get("env", YouwolEnvironment)
         remote_gtw = await RemoteClients.get_twin_assets_gateway_client(env=env)
-        await sync_raw_data(
-            asset_id=asset_id, remote_gtw=remote_gtw, caller_context=ctx
+        # Remote metadata are fetched while the raw data are transferred, they are written locally only
+        # once the raw data have been successfully synchronized.
+        _, explorer_data, asset_data = await asyncio.gather(
+            sync_raw_data(asset_id=asset_id, remote_gtw=remote_gtw, caller_context=ctx),
+            fetch_explorer_data(asset_id=asset_id, remote_gtw=remote_gtw, context=ctx),
+            fetch_asset_data(asset_id=asset_id, remote_gtw=remote_gtw, context=ctx),
+        )
+        await asyncio.gather(
+            sync_explorer_data(
+                asset_id=asset_id,
+                remote_gtw=remote_gtw,
+                context=ctx,
+                remote_data=explorer_data,
+            ),
+            sync_asset_data(
+                asset_id=asset_id,
+                remote_gtw=remote_gtw,
+                context=ctx,
+                remote_data=asset_data,
+            ),
         )
-        await sync_explorer_data(asset_id=asset_id, remote_gtw=remote_gtw, context=ctx)
-        await sync_asset_data(asset_id=asset_id, remote_gtw=remote_gtw, context=ctx)
 
         await ctx.info(text="Asset metadata uploaded successfully")
@@ -1,11 +1,13 @@
 # standard library
+import asyncio
+
 from dataclasses import dataclass
 
 # third parties
 from fastapi import HTTPException
 
 # Youwol application
-from youwol.app.environment import LocalClients, YouwolEnvironment
+from youwol.app.environment import LocalClients, RemoteClients, YouwolEnvironment
 from youwol.app.routers.commons import Label
 from youwol.app.routers.local_cdn.implementation import download_package
 
@@ -13,18 +15,49 @@ from youwol.app.routers.local_cdn.implementation import download_package
 from youwol.utils import CdnClient, Context, decode_id, encode_id
 
 # relative
+from .auto_download_thread import CACHE_DOWNLOADING_KEY, AssetsDownloader
 from .models import DownloadTask
 
 
+async def is_package_in_local(package_name: str, version: str, context: Context):
+    env: YouwolEnvironment = await context.get("env", YouwolEnvironment)
+    local_cdn: CdnClient = LocalClients.get_cdn_client(env=env)
+    try:
+        await local_cdn.get_version_info(
+            library_id=encode_id(package_name),
+            version=version,
+            headers=context.headers(),
+        )
+        return True
+    except HTTPException as e:
+        if e.status_code == 404:
+            return False
+        raise e
+
+
+def error_detail(error: Exception) -> str:
+    if isinstance(error, HTTPException):
+        return f"{error.status_code}: {error.detail}"
+    return f"{type(error).__name__}: {error}"
+
+
 @dataclass
 class DownloadPackageTask(DownloadTask):
     def __post_init__(self):
+        # Whether the download is triggered by the entry point of the package (e.g. initial GET of an application).
+        self.from_entry_point = False
         if "/api/assets-gateway/raw/" in self.url:
-            self.version = self.url.split("/api/assets-gateway/raw/")[1].split("/")[2]
+            # rest_of_path is like 'package/${raw_id}/${version}/**'
+            rest_of_path = self.url.split("/api/assets-gateway/raw/")[1].split("/")
+            self.version = rest_of_path[2]
+            self.from_entry_point = not any(rest_of_path[3:])
         if "/api/assets-gateway/cdn-backend/resources/" in self.url:
-            self.version = self.url.split("/api/assets-gateway/cdn-backend/resources/")[
+            # rest_of_path is like '${raw_id}/${version}/**'
+            rest_of_path = self.url.split("/api/assets-gateway/cdn-backend/resources/")[
                 1
-            ].split("/")[1]
+            ].split("/")
+            self.version = rest_of_path[1]
+            self.from_entry_point = not any(rest_of_path[2:])
         if "/backends/" in self.url:
             rest_of_path = self.url.split("/backends/")[1]
             # rest_of_path is like '${backend_name}/${version}/**'
@@ -36,20 +69,9 @@ class DownloadPackageTask(DownloadTask):
         return self.package_name + "/" + self.version
 
     async def is_local_up_to_date(self, context: Context):
-        env: YouwolEnvironment = await context.get("env", YouwolEnvironment)
-        local_cdn: CdnClient = LocalClients.get_cdn_client(env=env)
-        headers = context.headers()
-        try:
-            await local_cdn.get_version_info(
-                library_id=encode_id(self.package_name),
-                version=self.version,
-                headers=headers,
-            )
-            return True
-        except HTTPException as e:
-            if e.status_code == 404:
-                return False
-            raise e
+        return await is_package_in_local(
+            package_name=self.package_name, version=self.version, context=context
+        )
 
     async def create_local_asset(self, context: Context):
         async with context.start(
@@ -60,9 +82,96 @@ class DownloadPackageTask(DownloadTask):
                 "packageVersion": self.version,
             },
         ) as ctx:
-            await download_package(
+            response = await download_package(
                 package_name=self.package_name,
                 version=self.version,
                 check_update_status=False,
                 context=ctx,
             )
+            if self.from_entry_point:
+                # The download of the entry point is completed: dependencies are prefetched without delaying it
+                # (nor occupying a download worker).
+                assets_downloader = await ctx.get("assets_downloader", AssetsDownloader)
+                assets_downloader.run_in_background(
+                    self.prefetch_dependencies(version=response.version, context=ctx),
+                    name=f"prefetch dependencies of {self.package_name}#{response.version}",
+                )
+
+    async def prefetch_dependencies(self, version: str, context: Context):
+        """
+        Downloads the dependencies of the package not available locally, as defined by the lock of its
+        loading graph resolved in the remote environment.
+
+        At most :attr:`AssetsDownloader.prefetch_parallelism
+        <youwol.app.routers.environment.download_assets.auto_download_thread.AssetsDownloader.prefetch_parallelism>`
+        dependencies are downloaded concurrently; failures are reported as warnings.
+        It is executed in the background once the package is downloaded, see :meth:`AssetsDownloader.run_in_background
+        <youwol.app.routers.environment.download_assets.auto_download_thread.AssetsDownloader.run_in_background>`.
+
+        Parameters:
+            version: Explicit version of the package.
+            context: Current context.
+        """
+        async with context.start(
+            action=f"Prefetch dependencies of {self.package_name}#{version}"
+        ) as ctx:
+            env: YouwolEnvironment = await ctx.get("env", YouwolEnvironment)
+            assets_downloader = await ctx.get("assets_downloader", AssetsDownloader)
+            remote_gtw = await RemoteClients.get_twin_assets_gateway_client(env=env)
+            try:
+                loading_graph = (
+                    await remote_gtw.get_cdn_backend_router().query_loading_graph(
+                        body={"libraries": {self.package_name: version}},
+                        headers=ctx.headers(),
+                    )
+                )
+            except Exception as e:
+                await ctx.warning(
+                    text="Failed to resolve the loading graph, no prefetch",
+                    data={"error": error_detail(e)},
+                )
+                return
+            dependencies = [
+                (lib["name"], lib["version"])
+                for lib in loading_graph["lock"]
+                if lib["name"] != self.package_name
+            ]
+            await ctx.info(
+                text=f"Found {len(dependencies)} dependencies in the lock",
+                data={"dependencies": [f"{n}#{v}" for n, v in dependencies]},
+            )
+            if CACHE_DOWNLOADING_KEY not in env.cache_py_youwol:
+                env.cache_py_youwol[CACHE_DOWNLOADING_KEY] = set()
+            downloading_ids = env.cache_py_youwol[CACHE_DOWNLOADING_KEY]
+            semaphore = asyncio.Semaphore(assets_downloader.prefetch_parallelism)
+
+            async def prefetch(package_name: str, package_version: str):
+                download_id = f"{package_name}/{package_version}"
+                async with semaphore:
+                    if download_id in downloading_ids:
+                        return
+                    downloading_ids.add(download_id)
+                    try:
+                        if await is_package_in_local(
+                            package_name=package_name,
+                            version=package_version,
+                            context=ctx,
+                        ):
+                            return
+                        await download_package(
+                            package_name=package_name,
+                            version=package_version,
+                            check_update_status=False,
+                            context=ctx,
+                        )
+                    except Exception as e:
+                        await ctx.warning(
+                            text=f"Failed to prefetch {package_name}#{package_version}",
+                            data={"error": error_detail(e)},
+                        )
+                    finally:
+                        downloading_ids.discard(download_id)
+
+            await asyncio.gather(
+                *[prefetch(name, version) for name, version in dependencies]
+            )
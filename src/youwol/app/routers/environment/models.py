@@ -192,3 +192,30 @@ class ClearBrowserCacheResponse(BaseModel):
     """
     Number of entries deleted.
     """
+
+
+class UploadAssetsBody(BaseModel):
+    """
+    Body model of the endpoint :func:``POST:/admin/environment/upload` <router.upload_assets>`.
+    """
+
+    assetIds: list[str]
+    """
+    IDs of the assets to upload.
+    """
+
+
+class UploadAssetsResponse(BaseModel):
+    """
+    Response model of the endpoint :func:``POST:/admin/environment/upload` <router.upload_assets>`.
+    """
+
+    uploaded: list[str]
+    """
+    IDs of the assets uploaded.
+    """
+
+    failed: dict[str, str]
+    """
+    Description of the error, by ID of the assets for which the upload failed.
+    """
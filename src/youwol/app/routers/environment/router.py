@@ -57,9 +57,12 @@ from .models import (
     CustomDispatchesResponse,
     LoginBody,
     SwitchConfigurationBody,
+    UploadAssetsBody,
+    UploadAssetsResponse,
     UserInfo,
 )
 from .upload_assets.upload import upload_asset
+from .upload_assets.upload import upload_assets as upload_assets_impl
 
 router = APIRouter()
 flatten = itertools.chain.from_iterable
@@ -570,6 +573,49 @@ async def upload(
         )
 
 
+@router.post(
+    "/upload",
+    summary="upload assets",
+    response_model=UploadAssetsResponse,
+)
+async def upload_assets(
+    request: Request,
+    body: UploadAssetsBody,
+    config: YouwolEnvironment = Depends(yw_config),
+) -> UploadAssetsResponse:
+    """
+    Uploads assets to the remote environment, in parallel (see
+    :class:`UploadOrchestrator <youwol.app.routers.environment.upload_assets.orchestrator.UploadOrchestrator>`).
+
+    Parameters:
+        request: Incoming request.
+        body: The assets to upload.
+        config: Current environment.
+
+    Returns:
+        The assets uploaded, and the errors of the assets that failed.
+    """
+    async with Context.start_ep(
+        request=request,
+        with_attributes={"assetsCount": len(body.assetIds)},
+        with_reporters=[LogsStreamer()],
+    ) as ctx:
+        errors = await upload_assets_impl(
+            remote_assets_gtw=await RemoteClients.get_twin_assets_gateway_client(
+                env=config
+            ),
+            asset_ids=body.assetIds,
+            options=None,
+            context=ctx,
+        )
+        return UploadAssetsResponse(
+            uploaded=[asset_id for asset_id, error in errors.items() if not error],
+            failed={
+                asset_id: str(error) for asset_id, error in errors.items() if error
+            },
+        )
+
+
 @router.get(
     "/browser-cache",
     summary="upload an asset",
@@ -0,0 +1,38 @@
+# standard library
+import asyncio
+
+
+class UploadOrchestrator:
+    """
+    Bounds the parallelism of the uploads of local assets to a remote environment:
+
+    *  assets uploaded simultaneously, see
+       :func:`upload_assets <youwol.app.routers.environment.upload_assets.upload.upload_assets>`.
+    *  versions of packages published simultaneously (over all the assets being uploaded), see
+       :class:`UploadPackageTask <youwol.app.routers.environment.upload_assets.package.UploadPackageTask>`.
+    """
+
+    def __init__(self, max_assets: int = 4, max_versions: int = 4):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            max_assets: Maximum count of assets uploaded simultaneously.
+            max_versions: Maximum count of versions of packages published simultaneously.
+        """
+        self.max_assets = max_assets
+        self.max_versions = max_versions
+        self.assets = asyncio.Semaphore(max_assets)
+        """
+        Semaphore acquired during the upload of an asset.
+        """
+        self.versions = asyncio.Semaphore(max_versions)
+        """
+        Semaphore acquired during the publication of a package's version.
+        """
+
+
+upload_orchestrator = UploadOrchestrator()
+"""
+Bounds shared by all the uploads of the process: they apply over simultaneous requests, not per request.
+"""
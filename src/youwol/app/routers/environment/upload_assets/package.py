@@ -1,4 +1,6 @@
 # standard library
+import asyncio
+
 from dataclasses import dataclass
 
 # typing
@@ -11,6 +13,9 @@ from pydantic import BaseModel
 # Youwol application
 from youwol.app.environment import YouwolEnvironment
 from youwol.app.routers.environment.upload_assets.models import UploadTask
+from youwol.app.routers.environment.upload_assets.orchestrator import (
+    upload_orchestrator,
+)
 
 # Youwol utilities
 from youwol.utils import decode_id
@@ -94,11 +99,13 @@ def get_local_package(asset_id: str, config: YouwolEnvironment) -> Library:
     """
     Not populated with tree items
     """
-    data_packages = config.backends_configuration.cdn_backend.doc_db.data
+    doc_db = config.backends_configuration.cdn_backend.doc_db
     raw_id = decode_id(asset_id)
     library_name = decode_id(raw_id)
     releases = [
-        d for d in data_packages["documents"] if d["library_name"] == library_name
+        d
+        for d in doc_db.index_lookup(column="library_name", value=library_name)
+        if d["library_name"] == library_name
     ]
     if not releases:
         raise HTTPException(
@@ -198,7 +205,11 @@ class UploadPackageTask(UploadTask):
         remote_cdn = self.remote_assets_gtw.get_cdn_backend_router()
         env = await context.get("env", YouwolEnvironment)
         async with context.start(action="UploadPackageTask.publish_version") as ctx:
-            if self.options.versions and version not in self.options.versions:
+            if (
+                self.options
+                and self.options.versions
+                and version not in self.options.versions
+            ):
                 await ctx.info(
                     text=f"Version '{version}' not in explicit versions provided",
                     data={"explicit versions": self.options.versions},
@@ -210,23 +221,30 @@ class UploadPackageTask(UploadTask):
             )
 
             try:
-                await remote_cdn.publish(
-                    zip_content=zip_path.read_bytes(),
-                    params={"folder-id": folder_id},
-                    timeout=60000,
-                    headers=ctx.headers(),
-                )
+                async with upload_orchestrator.versions:
+                    # The zip file is streamed from the disk.
+                    with zip_path.open("rb") as zip_file:
+                        await remote_cdn.publish(
+                            zip_content=zip_file,
+                            params={"folder-id": folder_id},
+                            timeout=60000,
+                            headers=ctx.headers(),
+                        )
             finally:
                 await ctx.info(text=f"{library_name}#{version}: synchronization done")
                 # await check_package_status(package=local_package, context=context, target_versions=[version])
 
     async def create_raw(self, data: list[str], folder_id: str, context: Context):
         async with context.start(action="UploadPackageTask.create_raw") as ctx:
-            versions = data
-            for version in versions:
-                await self.publish_version(
-                    folder_id=folder_id, version=version, context=ctx
-                )
+            # Parallelism is bounded by `upload_orchestrator.versions`.
+            await asyncio.gather(
+                *[
+                    self.publish_version(
+                        folder_id=folder_id, version=version, context=ctx
+                    )
+                    for version in data
+                ]
+            )
 
     async def update_raw(self, data: list[str], folder_id: str, context: Context):
         async with context.start(action="UploadPackageTask.update_raw") as ctx:
@@ -22,6 +22,9 @@ from youwol.app.routers.environment.upload_assets.flux_project import (
     UploadFluxProjectTask,
 )
 from youwol.app.routers.environment.upload_assets.models import UploadTask
+from youwol.app.routers.environment.upload_assets.orchestrator import (
+    upload_orchestrator,
+)
 from youwol.app.routers.environment.upload_assets.package import UploadPackageTask
 from youwol.app.routers.environment.upload_assets.story import UploadStoryTask
 
@@ -107,9 +110,11 @@ async def create_borrowed_items(
         action="create_borrowed_items",
         with_attributes={"assetId": asset_id, "treeId": tree_id},
     ) as ctx:
-        items_treedb = env.backends_configuration.tree_db_backend.doc_dbs.items_db.data
+        items_treedb = env.backends_configuration.tree_db_backend.doc_dbs.items_db
         tree_items = [
-            item for item in items_treedb["documents"] if item["related_id"] == asset_id
+            item
+            for item in items_treedb.index_lookup(column="related_id", value=asset_id)
+            if item["related_id"] == asset_id
         ]
         borrowed_items = [
             item for item in tree_items if json.loads(item["metadata"])["borrowed"]
@@ -356,3 +361,51 @@ async def upload_asset(
         )
 
     return {}
+
+
+async def upload_assets(
+    remote_assets_gtw: AssetsGatewayClient,
+    asset_ids: list[str],
+    options: Any | None,
+    context: Context,
+) -> dict[str, Exception | None]:
+    """
+    Uploads assets to a remote environment, see
+    :func:`upload_asset <youwol.app.routers.environment.upload_assets.upload.upload_asset>`.
+
+    Assets are uploaded in parallel, bounded by
+    :glob:`upload_orchestrator <youwol.app.routers.environment.upload_assets.orchestrator.upload_orchestrator>`.
+
+    Parameters:
+        remote_assets_gtw: Assets gateway client of the remote environment.
+        asset_ids: IDs of the assets.
+        options: Options forwarded to the upload tasks.
+        context: Current context.
+
+    Returns:
+        By asset ID, the error raised by the upload or `None` if it succeeded.
+    """
+
+    async def upload_one(asset_id: str, ctx: Context) -> Exception | None:
+        async with upload_orchestrator.assets:
+            try:
+                await upload_asset(
+                    remote_assets_gtw=remote_assets_gtw,
+                    asset_id=asset_id,
+                    options=options,
+                    context=ctx,
+                )
+            except Exception as e:
+                await ctx.error(
+                    text=f"Upload of asset '{asset_id}' failed", data={"error": str(e)}
+                )
+                return e
+            return None
+
+    async with context.start(
+        action="upload_assets", with_attributes={"assetsCount": len(asset_ids)}
+    ) as ctx:
+        errors = await asyncio.gather(
+            *[upload_one(asset_id=asset_id, ctx=ctx) for asset_id in asset_ids]
+        )
+        return dict(zip(asset_ids, errors))
@@ -1,6 +1,7 @@
 # standard library
 import asyncio
 import itertools
+import tempfile
 
 from itertools import groupby
 
@@ -8,6 +9,7 @@ from itertools import groupby
 from typing import NamedTuple
 
 # third parties
+from aiohttp import ClientResponse
 from fastapi import HTTPException
 
 # Youwol application
@@ -22,10 +24,11 @@ from youwol.backends.cdn import (
     list_versions,
     to_package_id,
 )
+from youwol.backends.cdn.utils import publish_package
 from youwol.backends.cdn.utils_indexing import get_version_number
 
 # Youwol utilities
-from youwol.utils import encode_id
+from youwol.utils import encode_id, upstream_exception_from_response
 from youwol.utils.clients.assets_gateway.assets_gateway import AssetsGatewayClient
 from youwol.utils.context import Context
 from youwol.utils.http_clients.cdn_backend import Library
@@ -48,6 +51,11 @@ from .models import (
     UpdateStatus,
 )
 
+DOWNLOAD_CHUNK_SIZE = 2**16
+"""
+Size of the chunks when streaming the zip file of a package from the remote environment.
+"""
+
 
 class TargetPackage(NamedTuple):
     library_name: str
@@ -211,7 +219,22 @@ async def download_packages_from_queue(
 
 async def download_package(
     package_name: str, version: str, check_update_status: bool, context: Context
-):
+) -> DownloadedPackageResponse:
+    """
+    Downloads a package from the remote environment into the local one.
+
+    The zip file of the package is streamed from the remote CDN to the local publication step,
+    the remote metadata of the asset are retrieved meanwhile.
+
+    Parameters:
+        package_name: Name of the package.
+        version: Version of the package, semantic versioning ranges are allowed.
+        check_update_status: Whether to check the update status once downloaded.
+        context: Current context.
+
+    Returns:
+        The description of the downloaded package.
+    """
     env: YouwolEnvironment = await context.get("env", YouwolEnvironment)
 
     async def on_exit(ctx_exit):
@@ -235,13 +258,28 @@ async def download_package(
             with_attributes={"asset_id": asset_id},
         ) as ctx:
             library_id = encode_id(package_name)
-            resp = await remote_gtw.get_cdn_backend_router().download_library(
-                library_id=library_id, version=version, headers=ctx.headers()
-            )
-
-            await LocalClients.get_cdn_client(env=env).publish(
-                zip_content=resp, headers=ctx.headers()
-            )
+            with tempfile.TemporaryFile() as fp:
+
+                async def stream_to_file(resp: ClientResponse):
+                    if resp.status >= 300:
+                        raise await upstream_exception_from_response(resp, url=resp.url)
+                    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        fp.write(chunk)
+
+                await remote_gtw.get_cdn_backend_router().download_library(
+                    library_id=library_id,
+                    version=version,
+                    headers=ctx.headers(),
+                    custom_reader=stream_to_file,
+                )
+                await ctx.info(text=f"Zip file downloaded, size={fp.tell() / 1000}ko")
+                fp.seek(0)
+                await publish_package(
+                    file=fp,
+                    filename=library_id,
+                    configuration=env.backends_configuration.cdn_backend,
+                    context=ctx,
+                )
 
     async with context.start(
         action=f"download package {package_name}#{version}",
@@ -290,6 +328,7 @@ async def download_package(
         await asyncio.gather(
             ctx_download.send(response), emit_local_cdn_status(ctx_download)
         )
+        return response
 
 
 async def get_version_info(version_data, env: YouwolEnvironment, context: Context):
@@ -10,13 +10,19 @@ import time
 from collections.abc import Callable, Coroutine
 from fnmatch import fnmatch
 from pathlib import Path
-from threading import Thread
+from threading import Lock, Thread
 
 # typing
 from typing import Any
 
 # third parties
-from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_DELETED,
+    EVENT_TYPE_MOVED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 # Youwol
@@ -27,7 +33,7 @@ from youwol.app.environment import ProjectsFinder
 from youwol.app.environment.paths import PathsBook
 
 # Youwol utilities
-from youwol.utils import log_info
+from youwol.utils import log_error, log_info
 
 OnProjectsCountUpdate = Callable[
     [tuple[str, list[Path], list[Path]]], Coroutine[None, Any, None]
@@ -51,6 +57,7 @@ def auto_detect_projects(
     root_folder: Path | str,
     ignore: list[str] | None = None,
     max_depth: int | None = None,
+    sub_folder: Path | str | None = None,
 ) -> list[Path]:
     """
     Automatically detects projects within a specified root folder, excluding specified paths and system directories.
@@ -69,6 +76,8 @@ def auto_detect_projects(
             `fnmatch(relative_folder_path, pattern)`  returns `True` for one of the pattern.
         max_depth: The maximum depth of recursion during the directory search. If None, the search
             will explore directories recursively without limit. Defaults to None.
+        sub_folder: If provided, the search is restricted to this folder (included) of `root_folder`;
+            `ignore` patterns and `max_depth` remain relative to `root_folder`.
 
     Returns:
         A list of `Path` objects, each representing a project directory (containing a
@@ -82,16 +91,29 @@ def auto_detect_projects(
     return directories_finder(
         folder=root_folder,
         ignore=ignore or [],
-        condition=lambda path: (path / ".yw_pipeline" / "yw_pipeline.py").exists(),
+        condition=is_project,
         max_depth=max_depth,
+        sub_folder=sub_folder,
     )
 
 
+def is_project(path: Path) -> bool:
+    """
+    Parameters:
+        path: Path of a folder.
+
+    Returns:
+        Whether the folder is a project (it contains a `.yw_pipeline/yw_pipeline.py` file).
+    """
+    return (path / ".yw_pipeline" / "yw_pipeline.py").exists()
+
+
 def directories_finder(
     folder: Path | str,
     condition: Callable[[Path], bool],
     ignore: list[str] | None = None,
     max_depth: int | None = None,
+    sub_folder: Path | str | None = None,
 ) -> list[Path]:
     """
     Searches recursively through a directory tree, starting from a given folder, and selects directories that
@@ -110,6 +132,8 @@ def directories_finder(
             `fnmatch(relative_folder_path, pattern)`  returns `True` for one of the pattern.
         max_depth: The maximum depth of subdirectories to traverse. A value of None indicates no limit
             on the depth of the search. The depth is calculated relative to the `folder`.
+        sub_folder: If provided, the search is restricted to this folder (included) of `folder`;
+            `ignore` patterns and `max_depth` remain relative to `folder`.
 
     Returns:
         A list of Path objects, each representing a directory that satisfies the condition.
@@ -118,7 +142,7 @@ def directories_finder(
     folder = Path(folder)
     ignore = ignore or []
     selected: list[Path] = []
-    for root, dirs, _ in os.walk(folder):
+    for root, dirs, _ in os.walk(sub_folder or folder):
         current_depth = len(Path(root).relative_to(folder).parts)
         if max_depth and current_depth > max_depth:
             dirs.clear()
@@ -137,84 +161,166 @@ def directories_finder(
     return selected
 
 
-class ProjectsWatcherEventsHandler(PatternMatchingEventHandler):
+class ProjectsChanges:
+    """
+    Thread-safe aggregator of the folders impacted by file-system events.
+
+    Events usually come in bursts (*e.g.* `git checkout`, `npm install`): the folders are coalesced and
+    released for processing once no event happened for a short time.
     """
-    An event handler designed for watching project directories and triggering actions on project creation and deletion.
 
-    Projects are identified by the presence of a `.yw_pipeline/yw_pipeline.py` file;
-    it notifies an
+    def __init__(self, debounce: float = 0.5, max_delay: float = 5.0):
+        """
+        Initialize a new instance.
+
+        Parameters:
+            debounce: Duration (in seconds) without event before the folders are released.
+            max_delay: Maximum duration (in seconds) between the first event and the release of the folders,
+                even if events keep coming.
+        """
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.__lock = Lock()
+        self.__folders: set[Path] = set()
+        self.__first_event = 0.0
+        self.__last_event = 0.0
+
+    def push(self, folder: Path) -> None:
+        """
+        Records a folder impacted by an event.
+
+        Parameters:
+            folder: The folder.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            if not self.__folders:
+                self.__first_event = now
+            self.__folders.add(folder)
+            self.__last_event = now
+
+    def pop(self) -> set[Path]:
+        """
+        Releases the folders recorded, if the debounce period (or the maximum delay) has elapsed.
+
+        Returns:
+            The folders released, an empty set if none.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            if not self.__folders or (
+                now - self.__last_event < self.debounce
+                and now - self.__first_event < self.max_delay
+            ):
+                return set()
+            folders, self.__folders = self.__folders, set()
+            return folders
+
+
+class ProjectsWatcherEventsHandler(FileSystemEventHandler):
+    """
+    An event handler designed for watching project directories and recording the folders in which projects may
+    have been created or deleted.
+
+    Projects are identified by the presence of a `.yw_pipeline/yw_pipeline.py` file; events on other files,
+    in ignored or hidden folders, or deeper than the look-up depth of the
     :class:`owner <youwol.app.routers.projects.projects_resolver.projects_finder_handlers.ProjectsFinderImpl>`
-    object about changes in the projects' count.
+    are discarded before being recorded.
     """
 
     def __init__(
-        self, owner: ProjectsFinderImpl, ignored_patterns: list[str], from_path: Path
+        self,
+        owner: ProjectsFinderImpl,
+        ignored_patterns: list[str],
+        from_path: Path,
+        changes: ProjectsChanges,
     ):
         """
         Initialize a new instance.
 
         Parameters:
             owner: The owner instance responsible for handling updates on project counts.
-            ignored_patterns: A list of glob patterns to ignore regarding folders.
+            ignored_patterns: A list of glob patterns to ignore regarding folders (relative to `from_path`).
                 Folders matching these patterns will not trigger events.
             from_path: The path from which projects' paths are expressed.
                 E.g., if referencing a symbolic link, notifications to the owning
                 :class:`youwol.app.routers.projects.projects_resolver.projects_finder_handlers.ProjectsFinderImpl`
                 are expressed with it (and not from its absolute counterpart).
+            changes: Aggregator in which the impacted folders are recorded.
 
         Parameters are set as class attributes.
         """
-        super().__init__(ignore_patterns=ignored_patterns)
+        super().__init__()
         self.owner = owner
+        self.ignored_patterns = ignored_patterns
         self.from_path = from_path
         self.from_path_absolute = self.from_path.resolve()
+        self.changes = changes
 
-    def on_created(self, event: FileSystemEvent):
-        """
-        Handles project creation events. It determines if the created file is a `yw_pipeline.py` within a
-        `.yw_pipeline` directory, indicating a project creation, and notifies the owner.
-
-        Parameters:
-            event: source event
-        """
-        super().on_created(event)
-        project_path = self.project_path(event)
-        if project_path:
-            log_info(f"ProjectsWatcherEventsHandler: project created: {project_path}")
-            asyncio.run(self.owner.trigger_update(([project_path], [])))
-
-    def on_deleted(self, event: FileSystemEvent):
+    def on_any_event(self, event: FileSystemEvent):
         """
-        Similar to `on_created` but handles project deletion events.
+        Records the folders impacted by creation, deletion & move events.
 
         Parameters:
             event: source event
         """
-        super().on_deleted(event)
-        project_path = self.project_path(event)
-        if project_path:
-            log_info(f"ProjectsWatcherEventsHandler project deleted: {project_path}")
-            asyncio.run(self.owner.trigger_update(([], [project_path])))
+        if event.event_type not in [
+            EVENT_TYPE_CREATED,
+            EVENT_TYPE_DELETED,
+            EVENT_TYPE_MOVED,
+        ]:
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        for path in paths:
+            folder = path and self.impacted_folder(
+                Path(os.fsdecode(path)), event.is_directory
+            )
+            if folder:
+                self.changes.push(folder)
 
-    def project_path(self, event: FileSystemEvent) -> Path | None:
+    def impacted_folder(self, path: Path, is_directory: bool) -> Path | None:
         """
-        A utility method to extract the project path from the event's source path if the event represents
-        a project creation or deletion. Returned paths are expressed using the `from_path` attribute provided at
-        initialization (which can involved symbolic link).
+        Returns the folder to re-scan following an event on a path. Returned paths are expressed using the
+        `from_path` attribute provided at initialization (which can involved symbolic link).
 
         Parameters:
-            event: source event
+            path: Path of the event.
+            is_directory: Whether the path is a directory.
 
         Returns:
-            A `Path` if the event is associated to a project creation, `None` otherwise.
-        """
-        path = Path(event.src_path)
-        if path.name == "yw_pipeline.py" and path.parent.name == ".yw_pipeline":
-            project_absolute_path = path.parent.parent
-            return self.from_path / project_absolute_path.relative_to(
-                self.from_path_absolute
-            )
-
+            The folder if the event may be associated to a project creation or deletion, `None` otherwise.
+        """
+        relative = self.relative_path(path)
+        if relative is None:
+            return None
+        if not is_directory:
+            if (
+                relative.name != "yw_pipeline.py"
+                or relative.parent.name != ".yw_pipeline"
+            ):
+                return None
+            relative = relative.parent.parent
+        elif relative.name == ".yw_pipeline":
+            relative = relative.parent
+
+        if len(relative.parts) > self.owner.look_up_depth:
+            return None
+        if any(part.startswith(".") for part in relative.parts):
+            return None
+        if any(
+            fnmatch(str(folder), pattern)
+            for folder in [relative, *relative.parents]
+            for pattern in self.ignored_patterns
+        ):
+            return None
+        return self.from_path / relative
+
+    def relative_path(self, path: Path) -> Path | None:
+        for base in [self.from_path_absolute, self.from_path]:
+            try:
+                return path.relative_to(base)
+            except ValueError:
+                continue
         return None
 
 
@@ -226,13 +332,17 @@ class ProjectsWatcher(Thread):
     project has been created or deleted.
     It uses an instance of
     :class:`youwol.app.routers.projects.projects_resolver.projects_finder_handlers.ProjectsWatcherEventsHandler`
-    to handle these events and notify an
+    to record the impacted folders, and hands them in batches to an
     :class:`owner <youwol.app.routers.projects.projects_resolver.projects_finder_handlers.ProjectsFinderImpl>`
-    of the changes.
+    (within the server's event loop).
     """
 
     def __init__(
-        self, owner: ProjectsFinderImpl, from_path: Path, ignored_patterns: list[str]
+        self,
+        owner: ProjectsFinderImpl,
+        from_path: Path,
+        ignored_patterns: list[str],
+        loop: asyncio.AbstractEventLoop,
     ):
         """
         Initialize a new instance.
@@ -242,6 +352,7 @@ class ProjectsWatcher(Thread):
             from_path: The root path from which to start monitoring for project-related changes.
             ignored_patterns: A list of glob patterns to ignore regarding folders.
                 Folders matching these patterns will not trigger events.
+            loop: The event loop in which the changes are processed by the owner.
 
         Parameters are set as class attributes.
         """
@@ -249,8 +360,10 @@ class ProjectsWatcher(Thread):
         self.owner = owner
         self.from_path = from_path
         self.ignored_patterns = ignored_patterns
+        self.loop = loop
         self.stopped = False
-        self.event_handler = None
+        self.changes = ProjectsChanges()
+        self.event_handler: ProjectsWatcherEventsHandler | None = None
 
     def go(self):
         """
@@ -274,6 +387,7 @@ class ProjectsWatcher(Thread):
             owner=self.owner,
             ignored_patterns=self.ignored_patterns,
             from_path=self.from_path,
+            changes=self.changes,
         )
         observer.schedule(self.event_handler, str(self.from_path), recursive=True)
         observer.start()
@@ -282,13 +396,37 @@ class ProjectsWatcher(Thread):
             f"Look-up thread started for projects-finder '{self.owner.name}' (from folder '{self.from_path}')"
         )
         while not self.stopped:
-            time.sleep(1)
+            time.sleep(0.1)
+            folders = self.changes.pop()
+            if folders:
+                self.dispatch(folders)
         log_info(
             f"Look-up thread stopped for projects-finder '{self.owner.name}' (from folder '{self.from_path}')"
         )
         observer.stop()
         observer.join()
 
+    def dispatch(self, folders: set[Path]) -> None:
+        """
+        Processes a batch of impacted folders within the owner's event loop, and waits for completion
+        (batches are processed sequentially).
+
+        Parameters:
+            folders: The impacted folders.
+        """
+        if self.loop.is_closed():
+            return
+        future = asyncio.run_coroutine_threadsafe(
+            self.owner.process_changes(folders), self.loop
+        )
+        # noinspection PyBroadException
+        try:
+            future.result()
+        except Exception as e:
+            log_error(
+                f"Projects-finder '{self.owner.name}' failed to process changes: {e}"
+            )
+
 
 @dataclasses.dataclass
 class ProjectsFinderImpl:
@@ -340,6 +478,10 @@ class ProjectsFinderImpl:
     """
     An optional background thread that monitors filesystem events for dynamic updates if `watch` is True.
     """
+    projects: set[Path] = dataclasses.field(default_factory=set)
+    """
+    The projects currently found.
+    """
 
     def __post_init__(self):
 
@@ -377,7 +519,10 @@ class ProjectsFinderImpl:
             return
         self.release()
         self.watcher = ProjectsWatcher(
-            owner=self, from_path=self.from_path, ignored_patterns=self.look_up_ignore
+            owner=self,
+            from_path=self.from_path,
+            ignored_patterns=self.look_up_ignore,
+            loop=asyncio.get_running_loop(),
         )
         self.watcher.go()
 
@@ -385,6 +530,7 @@ class ProjectsFinderImpl:
         """
         Forces a re-scan of the `from_path` to update the list of projects.
         """
+        self.projects = set()
         if not self.look_up_depth:
             await self.trigger_update(([self.from_path], []))
             return
@@ -395,6 +541,49 @@ class ProjectsFinderImpl:
         )
         await self.trigger_update((project_paths, []))
 
+    async def process_changes(self, folders: set[Path]):
+        """
+        Re-scans the sub-trees of the folders impacted by file-system events, and triggers an update with the
+        projects added & removed. It is called by the
+        :class:`youwol.app.routers.projects.projects_resolver.projects_finder_handlers.ProjectsWatcher`.
+
+        Parameters:
+            folders: The impacted folders.
+        """
+        roots = [
+            folder
+            for folder in folders
+            if not any(parent in folders for parent in folder.parents)
+        ]
+
+        def scan(root: Path) -> list[Path]:
+            if not root.is_dir():
+                return []
+            if not self.look_up_depth:
+                return [root] if is_project(root) else []
+            return auto_detect_projects(
+                root_folder=self.from_path,
+                ignore=self.look_up_ignore,
+                max_depth=self.look_up_depth,
+                sub_folder=root,
+            )
+
+        found = await asyncio.to_thread(
+            lambda: {path for root in roots for path in scan(root)}
+        )
+        previous = {
+            path
+            for path in self.projects
+            if any(path == root or root in path.parents for root in roots)
+        }
+        added, removed = found - previous, previous - found
+        if not added and not removed:
+            return
+        log_info(
+            f"Projects-finder '{self.name}': {len(added)} project(s) created, {len(removed)} deleted"
+        )
+        await self.trigger_update((list(added), list(removed)))
+
     async def refresh(self):
         """
         Refreshes the project list: it triggers an explicit refresh.
@@ -428,6 +617,7 @@ class ProjectsFinderImpl:
             for p in update[1]
             if len(p.relative_to(self.from_path).parts) <= self.look_up_depth
         ]
+        self.projects = self.projects.union(added).difference(removed)
         await self.on_projects_count_update((self.name, added, removed))
 
 
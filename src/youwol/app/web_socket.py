@@ -7,7 +7,7 @@ from starlette.websockets import WebSocket, WebSocketDisconnect
 
 # Youwol utilities
 from youwol.utils import log_info
-from youwol.utils.context import WsContextReporter
+from youwol.utils.context import WsContextReporter, websocket_sender
 
 
 @dataclass(frozen=False)
@@ -94,6 +94,11 @@ async def start_web_socket(ws: WebSocket, ws_type: WsType):
     The :class:`web socket store <youwol.app.web_socket.WebSocketsStore>` is updated appropriately when
     accepting the connection as well as at disconnection.
 
+    Messages are sent by the :class:`sender <youwol.utils.context.reporter.WebSocketSender>` of the channel; for
+    `Log` channels, the oldest messages are dropped if the client falls too far behind.
+    If the query parameter `batched=true` is provided, each frame includes the JSON array of the messages sent
+    within a few milliseconds, rather than a single message.
+
     Parameters:
         ws: the new websocket channel to connect
         ws_type: The type:
@@ -101,10 +106,17 @@ async def start_web_socket(ws: WebSocket, ws_type: WsType):
             * `Log` if coming from `/ws-logs`
     """
     channels = global_ws_store.data if ws_type == WsType.DATA else global_ws_store.logs
-    channels.append(ws)
 
     await ws.accept()
     await ws.send_json({})
+    sender = websocket_sender(
+        ws,
+        batched=ws.query_params.get("batched") == "true",
+        mute_exceptions=ws_type == WsType.LOG,
+        # Messages of 'Data' channels convey state: none of them can be lost.
+        max_pending=10000 if ws_type == WsType.LOG else None,
+    )
+    channels.append(ws)
     while True:
         try:
             _ = await ws.receive_text()
@@ -113,4 +125,5 @@ async def start_web_socket(ws: WebSocket, ws_type: WsType):
                 f'{ws.scope["client"]} - "WebSocket {ws.scope["path"]}" [disconnected]'
             )
             channels.remove(ws)
+            sender.close()
             break
@@ -18,6 +18,10 @@ class Constants:
     namespace of the service
     """
     public_owner = "/youwol-users"
+    add_files_parallelism: int = 16
+    """
+    Maximum count of files of an uploaded zip stored concurrently.
+    """
 
 
 @dataclass(frozen=True)
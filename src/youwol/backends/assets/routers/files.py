@@ -1,10 +1,10 @@
 # standard library
+import asyncio
+import functools
 import io
-import tempfile
-import zipfile
 
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 # third parties
 from fastapi import APIRouter, Depends, File, UploadFile
@@ -12,13 +12,18 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 # Youwol utilities
-from youwol.utils import extract_bytes_ranges, get_content_type
+from youwol.utils import (
+    ZipEntry,
+    extract_bytes_ranges,
+    get_content_type,
+    zip_streaming_response,
+)
 from youwol.utils.context import Context
 from youwol.utils.http_clients.assets_backend import AddFilesResponse
 from youwol.utils.types import AnyDict
 
 # relative
-from ..configurations import Configuration, get_configuration
+from ..configurations import Configuration, Constants, get_configuration
 from ..utils import db_get, get_file_path, log_asset
 
 router = APIRouter(tags=["assets-backend.files"])
@@ -51,27 +56,36 @@ async def add_zip_files(
         await log_asset(asset=asset, context=ctx)
         filesystem = configuration.file_system
         await filesystem.ensure_bucket()
-        content = await file.read()
-        io_stream = io.BytesIO(content)
-        input_zip = ZipFile(io_stream)
-        items = {name: input_zip.read(name) for name in input_zip.namelist()}
-        files = {name: content for name, content in items.items() if name[-1] != "/"}
-
-        await ctx.info(
-            text="Zip file decoded successfully", data={"paths": list(files.keys())}
-        )
-
-        for path, content in files.items():
-            await filesystem.put_object(
-                object_id=get_file_path(
-                    asset_id=asset_id, kind=asset["kind"], file_path=path
-                ),
-                data=io.BytesIO(content),
-                object_name=Path(path).name,
-                content_type=get_content_type(path),
-                content_encoding="identity",
+        # The upload is spooled to a temporary file: the archive is not loaded in memory, the entries are read
+        # (and decompressed) in worker threads.
+        with ZipFile(file.file) as input_zip:
+            files = [info for info in input_zip.infolist() if not info.is_dir()]
+
+            await ctx.info(
+                text="Zip file decoded successfully",
+                data={"paths": [info.filename for info in files]},
             )
-        return AddFilesResponse(filesCount=len(files), totalBytes=len(content))
+            semaphore = asyncio.Semaphore(Constants.add_files_parallelism)
+
+            async def put_file(info: ZipInfo):
+                async with semaphore:
+                    content = await asyncio.to_thread(input_zip.read, info)
+                    await filesystem.put_object(
+                        object_id=get_file_path(
+                            asset_id=asset_id,
+                            kind=asset["kind"],
+                            file_path=info.filename,
+                        ),
+                        data=io.BytesIO(content),
+                        object_name=Path(info.filename).name,
+                        content_type=get_content_type(info.filename),
+                        content_encoding="identity",
+                    )
+
+            await asyncio.gather(*[put_file(info) for info in files])
+        return AddFilesResponse(
+            filesCount=len(files), totalBytes=sum(info.file_size for info in files)
+        )
 
 
 @router.get("/assets/{asset_id}/files/{rest_of_path:path}")
@@ -176,20 +190,14 @@ async def get_zip_files(
         )
         objects = await filesystem.list_objects(prefix=base_arc_name, recursive=True)
         await ctx.info(text="Objects list iterators retrieved successfully")
-        with tempfile.TemporaryDirectory() as tmp_folder:
-            base_path = Path(tmp_folder)
-            with zipfile.ZipFile(
-                base_path / "asset_files.zip", "w", zipfile.ZIP_DEFLATED
-            ) as zipper:
-                for obj in objects:
-                    path = obj.object_id
-                    await ctx.info(text=f"Zip file {path}")
-                    content = await filesystem.get_object(object_id=path)
-                    (base_path / path).parent.mkdir(exist_ok=True, parents=True)
-                    with open(base_path / path, "wb") as fp:
-                        fp.write(content)
-                    arc_name = Path(path).relative_to(base_arc_name)
-                    zipper.write(base_path / path, arcname=arc_name)
-
-            content = (Path(tmp_folder) / "asset_files.zip").read_bytes()
-            return Response(content=content, media_type="application/zip")
+
+        def file_entry(path: str) -> ZipEntry:
+            return ZipEntry(
+                arcname=str(Path(path).relative_to(base_arc_name)),
+                content=functools.partial(filesystem.get_object, object_id=path),
+            )
+
+        # The files are fetched concurrently while the archive is streamed.
+        return zip_streaming_response(
+            entries=[file_entry(obj.object_id) for obj in objects]
+        )
@@ -4,7 +4,7 @@ import asyncio
 from pathlib import Path
 
 # third parties
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -21,13 +21,13 @@ from youwol.utils.context import Context
 from youwol.utils.http_clients.assets_backend import AssetResponse
 
 # relative
-from ..utils import (
-    db_get,
-    db_post,
-    format_image,
-    get_asset_implementation,
-    get_thumbnail,
+from ..thumbnails import (
+    DEFAULT_THUMBNAIL_SIZE,
+    THUMBNAIL_SIZES,
+    thumbnail_path,
+    thumbnails_generator,
 )
+from ..utils import db_get, db_post, format_image, get_asset_implementation
 
 router = APIRouter(tags=["assets-backend"])
 
@@ -45,7 +45,9 @@ async def post_image(
     configuration: Configuration = Depends(get_configuration),
 ) -> AssetResponse:
     """
-    Adds an image to an asset. A thumbnail 200px*200px is also created.
+    Adds an image to an asset. Thumbnails are also created, one for each of the
+    :glob:`THUMBNAIL_SIZES <youwol.backends.assets.thumbnails.THUMBNAIL_SIZES>`; they are generated in worker
+    processes.
 
     Parameters:
         request: Incoming request.
@@ -70,7 +72,9 @@ async def post_image(
             )
 
         image = await format_image(filename, file)
-        thumbnail = get_thumbnail(image, size=(200, 200))
+        thumbnails = await thumbnails_generator.generate(
+            content=image.content, extension=image.extension
+        )
 
         doc = {
             **asset,
@@ -81,7 +85,7 @@ async def post_image(
                 ],
                 "thumbnails": [
                     *asset["thumbnails"],
-                    f"/api/assets-backend/assets/{asset_id}/thumbnails/{thumbnail.name}",
+                    f"/api/assets-backend/assets/{asset_id}/thumbnails/{image.name}",
                 ],
             },
         }
@@ -97,16 +101,21 @@ async def post_image(
             content_encoding="",
         )
 
-        post_thumbnail_body = FileData(
-            objectData=thumbnail.content,
-            objectName=Path(asset["kind"]) / asset_id / "thumbnails" / thumbnail.name,
-            owner=Constants.public_owner,
-            objectSize=len(thumbnail.content),
-            content_type="image/" + thumbnail.extension,
-            content_encoding="",
-        )
+        post_thumbnail_bodies = [
+            FileData(
+                objectData=content,
+                objectName=thumbnail_path(
+                    kind=asset["kind"], asset_id=asset_id, name=image.name, size=size
+                ),
+                owner=Constants.public_owner,
+                objectSize=len(content),
+                content_type="image/" + image.extension,
+                content_encoding="",
+            )
+            for size, content in thumbnails.items()
+        ]
 
-        post_file_bodies = [post_image_body, post_thumbnail_body]
+        post_file_bodies = [post_image_body, *post_thumbnail_bodies]
 
         await asyncio.gather(
             *[
@@ -137,7 +146,7 @@ async def remove_image(
     configuration: Configuration = Depends(get_configuration),
 ) -> AssetResponse:
     """
-    Removes an image of an asset. The associated thumbnail is also removed.
+    Removes an image of an asset. The associated thumbnails are also removed.
 
     Parameters:
         request: Incoming request.
@@ -183,6 +192,21 @@ async def remove_image(
                 headers=ctx.headers(),
             ),
         )
+        # Images added before the introduction of multiple sizes have only the default thumbnail.
+        await asyncio.gather(
+            *[
+                storage.delete(
+                    thumbnail_path(
+                        kind=asset["kind"], asset_id=asset_id, name=filename, size=size
+                    ),
+                    owner=Constants.public_owner,
+                    headers=ctx.headers(),
+                )
+                for size in THUMBNAIL_SIZES
+                if size != DEFAULT_THUMBNAIL_SIZE
+            ],
+            return_exceptions=True,
+        )
         return await get_asset_implementation(
             request=request, asset_id=asset_id, configuration=configuration, context=ctx
         )
@@ -254,6 +278,7 @@ async def get_media_thumbnail(
     request: Request,
     asset_id: str,
     name: str,
+    size: str = Query(DEFAULT_THUMBNAIL_SIZE),
     configuration: Configuration = Depends(get_configuration),
 ) -> Response:
     """
@@ -263,16 +288,25 @@ async def get_media_thumbnail(
         request: Incoming request.
         asset_id: Asset's ID.
         name: Name of the image.
+        size: Size of the thumbnail, a key of
+            :glob:`THUMBNAIL_SIZES <youwol.backends.assets.thumbnails.THUMBNAIL_SIZES>`.
         configuration: Injected :class:`Configuration <youwol.backends.assets.configurations.Configuration>`.
 
     Returns:
-        The image.
+        The thumbnail.
     """
     async with Context.start_ep(request=request) as ctx:  # type: Context
+        if size not in THUMBNAIL_SIZES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Thumbnail size '{size}' not supported, expected one of {list(THUMBNAIL_SIZES)}",
+            )
         return await get_media(
             asset_id=asset_id,
             name=name,
-            media_type="images",
+            media_type=(
+                "thumbnails" if size == DEFAULT_THUMBNAIL_SIZE else f"thumbnails/{size}"
+            ),
             configuration=configuration,
             context=ctx,
         )
@@ -0,0 +1,174 @@
+# standard library
+import asyncio
+import hashlib
+import io
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+# third parties
+from fastapi import HTTPException
+from PIL import Image
+
+# Youwol utilities
+from youwol.utils import Coalescer
+
+THUMBNAIL_SIZES: dict[str, int] = {"small": 64, "medium": 200, "large": 512}
+"""
+Sizes (maximum width & height in pixels) of the thumbnails created for each image of an asset.
+"""
+
+DEFAULT_THUMBNAIL_SIZE = "medium"
+"""
+Size of the thumbnail referenced by the asset's description, stored at `{kind}/{asset_id}/thumbnails/{name}`.
+The other sizes are stored at `{kind}/{asset_id}/thumbnails/{size}/{name}`.
+"""
+
+IMAGE_FORMATS = {"jpg": "JPEG", "jpeg": "JPEG", "png": "PNG"}
+"""
+Formats of images supported, by file extension (case-insensitive).
+"""
+
+
+def thumbnail_path(kind: str, asset_id: str, name: str, size: str) -> Path:
+    """
+    Returns the path of a thumbnail within the storage.
+
+    Parameters:
+        kind: Asset's kind.
+        asset_id: Asset's ID.
+        name: Name of the image.
+        size: Size of the thumbnail, a key of
+            :glob:`THUMBNAIL_SIZES <youwol.backends.assets.thumbnails.THUMBNAIL_SIZES>`.
+
+    Returns:
+        The path.
+    """
+    base = Path(kind) / asset_id / "thumbnails"
+    return base / name if size == DEFAULT_THUMBNAIL_SIZE else base / size / name
+
+
+def render_thumbnails(
+    content: bytes, image_format: str, sizes: dict[str, int]
+) -> dict[str, bytes]:
+    """
+    Creates the thumbnails of an image, the image is decoded once.
+
+    It is executed in a worker process by
+    :class:`ThumbnailsGenerator <youwol.backends.assets.thumbnails.ThumbnailsGenerator>`.
+
+    Parameters:
+        content: The image's bytes.
+        image_format: Format of the image (PIL's naming).
+        sizes: Sizes of the thumbnails.
+
+    Returns:
+        The thumbnails' bytes, by size.
+    """
+    thumbnails: dict[str, bytes] = {}
+    with Image.open(io.BytesIO(content)) as image:
+        # Sizes are processed from the largest: decoding of the original uses the draft mode when available,
+        # the next thumbnails are reduced (in place) from the previous one.
+        for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+            image.thumbnail((size, size))
+            with io.BytesIO() as output:
+                image.save(output, format=image_format)
+                thumbnails[name] = output.getvalue()
+    return thumbnails
+
+
+class ThumbnailsGenerator:
+    """
+    Creates the thumbnails of images in a pool of worker processes, out of the event loop.
+
+    Concurrent generations for the same image (same bytes & format) are executed once.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initializes a new instance, the pool is started on first use.
+
+        Parameters:
+            max_workers: Count of worker processes.
+        """
+        self.max_workers = max_workers
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__coalescer: Coalescer[dict[str, bytes]] = Coalescer()
+
+    async def generate(
+        self, content: bytes, extension: str, sizes: dict[str, int] | None = None
+    ) -> dict[str, bytes]:
+        """
+        Creates the thumbnails of an image.
+
+        Parameters:
+            content: The image's bytes.
+            extension: Extension of the image's file, see
+                :glob:`IMAGE_FORMATS <youwol.backends.assets.thumbnails.IMAGE_FORMATS>`.
+            sizes: Sizes of the thumbnails, default to
+                :glob:`THUMBNAIL_SIZES <youwol.backends.assets.thumbnails.THUMBNAIL_SIZES>`.
+
+        Returns:
+            The thumbnails' bytes, by size.
+        """
+        image_format = IMAGE_FORMATS.get(extension.lower())
+        if not image_format:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Image extension '{extension}' not supported, expected one of {list(IMAGE_FORMATS)}",
+            )
+        sizes = sizes or THUMBNAIL_SIZES
+        digest = hashlib.sha256(content).hexdigest()
+        key = f"{digest}.{image_format}.{sorted(sizes.items())}"
+        try:
+            thumbnails, _ = await self.__coalescer.run(
+                key, lambda: self.__render(content, image_format, sizes)
+            )
+            return thumbnails
+        except BrokenProcessPool as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Thumbnails generation failed, a worker process terminated abruptly: {e}",
+            ) from e
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes once their current generations are completed, pending ones are cancelled.
+        """
+        if self.__executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    async def __render(
+        self, content: bytes, image_format: str, sizes: dict[str, int]
+    ) -> dict[str, bytes]:
+        executor = self.__get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, render_thumbnails, content, image_format, sizes
+            )
+        except BrokenProcessPool:
+            # A broken pool (e.g. a worker killed by the OS) rejects all the submissions: a new one is started on
+            # next use.
+            if self.__executor is executor:
+                self.__executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if not self.__executor:
+            # Forking a process running an event loop & threads is unsafe: workers are spawned.
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self.__executor
+
+
+thumbnails_generator = ThumbnailsGenerator()
+"""
+Generator used by the images endpoints of the assets backend, its worker processes are stopped when the application
+shuts down.
+"""
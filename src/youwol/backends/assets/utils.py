@@ -1,7 +1,6 @@
 # standard library
 import asyncio
 import base64
-import io
 import itertools
 
 from collections.abc import Mapping
@@ -13,11 +12,15 @@ from typing import Any
 
 # third parties
 from fastapi import UploadFile
-from PIL import Image
 from starlette.requests import Request
 
 # Youwol backends
 from youwol.backends.assets.configurations import Configuration, Constants
+from youwol.backends.assets.thumbnails import (
+    DEFAULT_THUMBNAIL_SIZE,
+    THUMBNAIL_SIZES,
+    thumbnail_path,
+)
 
 # Youwol utilities
 from youwol.utils import (
@@ -62,17 +65,6 @@ async def format_image(filename: str, file: UploadFile) -> ParsedFile:
     )
 
 
-def get_thumbnail(file: ParsedFile, size: tuple[int, int]) -> ParsedFile:
-    ext_dict = {"jpg": "JPEG", "JPG": "JPEG", "png": "PNG", "PNG": "PNG"}
-    image = Image.open(io.BytesIO(file.content))
-    image.thumbnail(size)
-    with io.BytesIO() as output:
-        image.save(output, format=ext_dict[file.extension])
-        contents = output.getvalue()
-
-    return ParsedFile(content=contents, name=file.name, extension=file.extension)
-
-
 def to_doc_db_id(related_id: str) -> str:
     b = str.encode(related_id)
     return base64.urlsafe_b64encode(b).decode()
@@ -166,6 +158,28 @@ async def switch_data(
             for file in files
         ]
     )
+    # Images added before the introduction of multiple sizes have only the default thumbnail.
+    sized_thumbnails = [
+        str(
+            thumbnail_path(
+                kind=kind, asset_id=asset_id, name=thumbnail.split("/")[-1], size=size
+            )
+        )
+        for thumbnail in asset["thumbnails"]
+        for size in THUMBNAIL_SIZES
+        if size != DEFAULT_THUMBNAIL_SIZE
+    ]
+    sized_thumbnails_data = await asyncio.gather(
+        *[
+            storage.get_bytes(path=file, owner=from_group, headers=headers)
+            for file in sized_thumbnails
+        ],
+        return_exceptions=True,
+    )
+    for data, file in zip(sized_thumbnails_data, sized_thumbnails):
+        if isinstance(data, bytes):
+            files_data.append(data)
+            files.append(file)
 
     await asyncio.gather(
         *[
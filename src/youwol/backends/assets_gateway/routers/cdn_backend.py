@@ -294,7 +294,13 @@ async def get_resource(
             version=version,
             rest_of_path=rest_of_path,
             custom_reader=aiohttp_to_starlette_response,
-            headers=ctx.headers(),
+            headers=ctx.headers(
+                from_req_fwd=lambda header_keys: [
+                    k
+                    for k in header_keys
+                    if k in ["if-none-match", "if-modified-since"]
+                ]
+            ),
         )
 
 
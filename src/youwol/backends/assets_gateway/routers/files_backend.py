@@ -216,7 +216,11 @@ async def get_file(
 
     async def reader(resp: ClientResponse):
         resp_bytes = await resp.read()
-        return Response(content=resp_bytes, headers=dict(resp.headers.items()))
+        return Response(
+            status_code=resp.status,
+            content=resp_bytes,
+            headers=dict(resp.headers.items()),
+        )
 
     async with Context.start_ep(request=request) as ctx:  # type: Context
         await assert_read_permissions_from_raw_id(
@@ -1,10 +1,13 @@
 # standard library
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # typing
 from typing import Union
 
+# Youwol backends
+from youwol.backends.cdn.resolutions_table import ResolutionsTable
+
 # Youwol utilities
 from youwol.utils.clients.docdb.docdb import DocDbClient as RemoteDocDb
 from youwol.utils.clients.docdb.local_docdb import LocalDocDbClient as LocalDocDb
@@ -64,6 +67,11 @@ class Configuration:
     included in this :attr:`namespace <youwol.backends.cdn.configurations.Constants.namespace>`.
     """
 
+    resolutions_table: ResolutionsTable = field(default_factory=ResolutionsTable)
+    """
+    Table of the versions resolved from semantic versioning ranges.
+    """
+
 
 class Dependencies:
     get_configuration: Callable[[], Configuration | Awaitable[Configuration]]
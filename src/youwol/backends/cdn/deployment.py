@@ -3,6 +3,7 @@ from fastapi import APIRouter
 
 # Youwol backends
 from youwol.backends.cdn import Configuration, Constants, get_router
+from youwol.backends.cdn.resolutions_table import ResolutionsTable
 from youwol.backends.common import BackendDeployment
 from youwol.backends.common.app import get_fastapi_app
 from youwol.backends.common.use_auth_middleware import auth_middleware
@@ -31,6 +32,8 @@ class CdnDeployment(BackendDeployment):
                     table_body=LIBRARIES_TABLE,
                     replication_factor=2,
                 ),
+                # Publications on other replicas do not invalidate the table.
+                resolutions_table=ResolutionsTable(max_age=60),
             )
         )
 
@@ -0,0 +1,130 @@
+# standard library
+import json
+import struct
+
+from collections.abc import Awaitable, Callable, Iterable
+
+# Youwol utilities
+from youwol.utils.http_clients.cdn_backend import ExplorerResponse
+
+EXPLORER_INDEX_FILE = "explorer.idx"
+"""
+Name of the explorer index file, published in the folder `generated/explorer/{library_name}/{version}`.
+"""
+
+_MAGIC = b"YWEXPL01"
+_HEADER = struct.Struct("<8sI")
+"""
+Magic bytes & count of folders.
+"""
+_ENTRY = struct.Struct("<IIII")
+"""
+Offset & length of the folder's path, offset & length of the folder's description.
+"""
+
+
+def encode_explorer_index(folders: Iterable[tuple[str, ExplorerResponse]]) -> bytes:
+    """
+    Encodes the description of the folders of a package into a single indexed file.
+
+    The layout is:
+    *  a header: magic bytes & count of folders.
+    *  a table of fixed size entries sorted by path: offset & length of the path, offset & length of the description.
+    *  the paths, then the descriptions (compact JSON).
+
+    Parameters:
+        folders: Paths (relative to the package's root, `''` for the root) & descriptions of the folders.
+
+    Returns:
+        The encoded index.
+    """
+    items = sorted(
+        (path.encode(), json.dumps(content.dict(), separators=(",", ":")).encode())
+        for path, content in folders
+    )
+    path_offset = _HEADER.size + _ENTRY.size * len(items)
+    data_offset = path_offset + sum(len(path) for path, _ in items)
+    entries = []
+    for path, data in items:
+        entries.append(_ENTRY.pack(path_offset, len(path), data_offset, len(data)))
+        path_offset += len(path)
+        data_offset += len(data)
+
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, len(items)),
+            *entries,
+            *(path for path, _ in items),
+            *(data for _, data in items),
+        ]
+    )
+
+
+class ExplorerIndexReader:
+    """
+    Reads folders' descriptions from an index created by
+    :func:`encode_explorer_index <youwol.backends.cdn.explorer_index.encode_explorer_index>`.
+
+    Only the parts of the file needed are read: a lookup is a binary search over the entries' table.
+    Reads are done by aligned blocks, cached for the lifetime of the reader.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[int, int], Awaitable[bytes]],
+        block_size: int = 64 * 1024,
+    ):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            read: Reads the bytes of the file from a start offset to an end offset (included).
+            block_size: Size of the blocks read.
+        """
+        self._read_range = read
+        self._block_size = block_size
+        self._blocks: dict[int, bytes] = {}
+
+    async def get(self, path: str) -> ExplorerResponse | None:
+        """
+        Retrieves the description of a folder.
+
+        Parameters:
+            path: Path of the folder, relative to the package's root.
+
+        Returns:
+            The description if the folder is referenced in the index, `None` otherwise.
+        """
+        magic, count = _HEADER.unpack(await self._read(0, _HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("The file is not a valid explorer index")
+
+        target = path.strip("/").encode()
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            entry = await self._read(_HEADER.size + middle * _ENTRY.size, _ENTRY.size)
+            path_offset, path_length, data_offset, data_length = _ENTRY.unpack(entry)
+            candidate = await self._read(path_offset, path_length)
+            if candidate == target:
+                data = await self._read(data_offset, data_length)
+                return ExplorerResponse(**json.loads(data))
+            if candidate < target:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    async def _read(self, offset: int, length: int) -> bytes:
+        first = offset // self._block_size
+        last = (offset + length - 1) // self._block_size
+        chunks = []
+        for index in range(first, last + 1):
+            if index not in self._blocks:
+                start = index * self._block_size
+                self._blocks[index] = await self._read_range(
+                    start, start + self._block_size - 1
+                )
+            chunks.append(self._blocks[index])
+        start = offset - first * self._block_size
+        return b"".join(chunks)[start : start + length]
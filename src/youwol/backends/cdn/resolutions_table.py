@@ -0,0 +1,129 @@
+# standard library
+import time
+
+from dataclasses import dataclass, field
+
+# Youwol utilities
+from youwol.utils.http_clients.cdn_backend import ResolutionsTableStatus
+from youwol.utils.http_clients.cdn_backend.utils import to_std_npm_spec
+
+
+@dataclass
+class ResolutionsTable:
+    """
+    Table of the explicit versions resolved from semantic versioning ranges, keyed by package name and
+    normalized range (see :func:`to_std_npm_spec <youwol.utils.http_clients.cdn_backend.utils.to_std_npm_spec>`).
+
+    It is used by :func:`resolve_explicit_version <youwol.backends.cdn.utils.resolve_explicit_version>`,
+    entries of a package are invalidated when one of its versions is published or deleted.
+    A resolution is stored only if the package has not been invalidated while it was computed: the
+    :meth:`generation <youwol.backends.cdn.resolutions_table.ResolutionsTable.generation>` of the package is read
+    before resolving, and provided when storing the result.
+    """
+
+    max_age: float | None = None
+    """
+    If provided, maximum age (in seconds) of an entry.
+    It is relevant when the service is replicated: publications on other replicas do not invalidate the table.
+    """
+
+    hits: int = 0
+    """
+    Number of lookups resolved from the table.
+    """
+
+    misses: int = 0
+    """
+    Number of lookups not resolved from the table.
+    """
+
+    _entries: dict[str, dict[str, tuple[str, float]]] = field(default_factory=dict)
+    _generations: dict[str, int] = field(default_factory=dict)
+    _clock: int = 0
+    _cleared_at: int = 0
+
+    def generation(self, package: str) -> int:
+        """
+        Parameters:
+            package: Name of the package.
+
+        Returns:
+            The generation of the package's entries, it changes each time they are invalidated.
+        """
+        return max(self._generations.get(package, 0), self._cleared_at)
+
+    def get(self, package: str, semver: str) -> str | None:
+        """
+        Retrieves a resolved version.
+
+        Parameters:
+            package: Name of the package.
+            semver: Semantic versioning range.
+
+        Returns:
+            The resolved version if available, `None` otherwise.
+        """
+        entry = self._entries.get(package, {}).get(self._normalize(semver))
+        if entry and (self.max_age is None or time.time() - entry[1] < self.max_age):
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def set(self, package: str, semver: str, version: str, generation: int) -> None:
+        """
+        Stores a resolved version, unless the package has been invalidated since the resolution started.
+
+        Parameters:
+            package: Name of the package.
+            semver: Semantic versioning range.
+            version: The resolved version.
+            generation: The :meth:`generation <youwol.backends.cdn.resolutions_table.ResolutionsTable.generation>`
+                of the package read before resolving the version.
+        """
+        if generation != self.generation(package):
+            return
+        self._entries.setdefault(package, {})[self._normalize(semver)] = (
+            version,
+            time.time(),
+        )
+
+    def invalidate(self, package: str) -> None:
+        """
+        Removes the entries related to a package.
+
+        Parameters:
+            package: Name of the package.
+        """
+        self._entries.pop(package, None)
+        self._clock += 1
+        self._generations[package] = self._clock
+
+    def clear(self) -> None:
+        """
+        Removes all the entries.
+        """
+        self._entries.clear()
+        self._generations.clear()
+        self._clock += 1
+        self._cleared_at = self._clock
+
+    def status(self) -> ResolutionsTableStatus:
+        """
+        Returns:
+            The status of the table.
+        """
+        lookups = self.hits + self.misses
+        return ResolutionsTableStatus(
+            entriesCount=sum(len(entries) for entries in self._entries.values()),
+            hits=self.hits,
+            misses=self.misses,
+            hitRatio=self.hits / lookups if lookups else 0,
+        )
+
+    @staticmethod
+    def _normalize(semver: str) -> str:
+        try:
+            return " ".join(to_std_npm_spec(semver).split())
+        except ValueError:
+            return semver
@@ -3,6 +3,8 @@ import asyncio
 import io
 import json
 
+from collections.abc import Awaitable
+
 # typing
 from typing import Any
 
@@ -12,7 +14,7 @@ from fastapi import Query as QueryParam
 from fastapi import UploadFile
 from semantic_version import NpmSpec, Version
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 # Youwol backends
 from youwol.backends.cdn.configurations import (
@@ -20,6 +22,10 @@ from youwol.backends.cdn.configurations import (
     Constants,
     get_configuration,
 )
+from youwol.backends.cdn.explorer_index import (
+    EXPLORER_INDEX_FILE,
+    ExplorerIndexReader,
+)
 from youwol.backends.cdn.loading_graph_implementation import (
     ExportedKey,
     LibName,
@@ -59,6 +65,7 @@ from youwol.utils.http_clients.cdn_backend import (
     LoadingGraphBody,
     LoadingGraphResponseV1,
     PublishResponse,
+    ResolutionsTableStatus,
     get_exported_symbol,
 )
 from youwol.utils.http_clients.cdn_backend.utils import decode_extra_index
@@ -144,8 +151,12 @@ async def download_library(
             library_id=library_id, version=version, rest_of_path="__original.zip"
         )
         await ctx.info("Original zip path retrieved", data={"path": path})
-        content = await file_system.get_object(object_id=path, headers=ctx.headers())
-        return Response(content, media_type="multipart/form-data")
+        # Raises a 404 before the response starts if the object does not exist.
+        await file_system.get_info(object_id=path, headers=ctx.headers())
+        return StreamingResponse(
+            content=file_system.stream_object(object_id=path, headers=ctx.headers()),
+            media_type="multipart/form-data",
+        )
 
 
 @router.get(
@@ -321,6 +332,7 @@ async def delete_library(
                 for d in resp_query["documents"]
             ]
         )
+        configuration.resolutions_table.invalidate(package=name)
         return DeleteLibraryResponse(deletedVersionsCount=len(resp_query["documents"]))
 
 
@@ -361,6 +373,7 @@ async def delete_version(
         await doc_db.delete_document(
             doc=doc, owner=Constants.owner, headers=ctx.headers()
         )
+        configuration.resolutions_table.invalidate(package=library_name)
 
         path_folder = f"{library_name}/{version}"
 
@@ -379,6 +392,31 @@ async def delete_version(
         return {"deletedCount": 1}
 
 
+@router.get(
+    "/resolutions-table",
+    summary="Status of the table of versions resolved from semantic versioning ranges.",
+    response_model=ResolutionsTableStatus,
+)
+async def get_resolutions_table_status(
+    request: Request,
+    configuration: Configuration = Depends(get_configuration),
+) -> ResolutionsTableStatus:
+    """
+    Retrieves the status of the
+    :attr:`resolutions table <youwol.backends.cdn.configurations.Configuration.resolutions_table>`
+    (entries count & hit ratio).
+
+    Parameters:
+        request: Incoming request.
+        configuration: Injected configuration of the service.
+
+    Returns:
+        The status of the table.
+    """
+    async with Context.start_ep(request=request):
+        return configuration.resolutions_table.status()
+
+
 @router.post(
     "/queries/loading-graph",
     summary="Resolves the loading graph of provided libraries.",
@@ -681,10 +719,26 @@ async def explorer(
                 status_code=400, detail=f"'{library_id}' is not a valid library id"
             ) from exc
 
-        path = f"generated/explorer/{package_name.replace('@', '')}/{version}/{rest_of_path}/".replace(
-            "//", "/"
-        )
+        base_path = f"generated/explorer/{package_name.replace('@', '')}/{version}"
         file_system = configuration.file_system
+
+        def read_index(start: int, end: int) -> Awaitable[bytes]:
+            return file_system.get_object(
+                object_id=f"{base_path}/{EXPLORER_INDEX_FILE}",
+                ranges_bytes=[(start, end)],
+                headers=ctx.headers(),
+            )
+
+        try:
+            content = await ExplorerIndexReader(read=read_index).get(rest_of_path)
+            return content or ExplorerResponse()
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise e
+            await ctx.info("No explorer index, fallback to per-folder explorer files")
+
+        # Packages published before the introduction of the explorer index have one file per folder.
+        path = f"{base_path}/{rest_of_path}/".replace("//", "/")
         try:
             items = await file_system.get_object(
                 object_id=path + "items.json", headers=ctx.headers()
@@ -23,6 +23,10 @@ from starlette.responses import Response
 
 # Youwol backends
 from youwol.backends.cdn.configurations import Configuration, Constants
+from youwol.backends.cdn.explorer_index import (
+    EXPLORER_INDEX_FILE,
+    encode_explorer_index,
+)
 from youwol.backends.cdn.utils_indexing import (
     format_doc_db_record,
     get_version_number_str,
@@ -42,6 +46,9 @@ from youwol.utils import (
     extract_bytes_ranges,
     generate_headers_downstream,
     get_content_type,
+    is_not_modified,
+    not_modified_response,
+    validators_headers,
 )
 from youwol.utils.clients.cdn import files_check_sum
 from youwol.utils.clients.docdb.models import (
@@ -354,6 +361,7 @@ async def publish_package(
             await configuration.doc_db.create_document(
                 record, owner=Constants.owner, headers=headers
             )
+            configuration.resolutions_table.invalidate(package=package_json["name"])
 
         await context.info(text="Create explorer data", data={"record": record})
         explorer_data = await create_explorer_data(
@@ -363,28 +371,16 @@ async def publish_package(
             context=context,
         )
 
-        def put_explorer_object(folder, items):
-            path_base = f"generated/explorer/{library_id}/{version}"
-            path = (
-                f"{path_base}/{folder}/items.json"
-                if folder and folder != "."
-                else f"{path_base}/items.json"
-            )
-
-            return file_system.put_object(
-                object_id=path,
-                object_name=Path(path).name,
-                content_type="application/json",
-                content_encoding="identity",
-                data=io.BytesIO(json.dumps(items.dict()).encode()),
-                headers=headers,
-            )
-
-        await asyncio.gather(
-            *[
-                put_explorer_object(folder, items)
-                for folder, items in explorer_data.items()
-            ]
+        explorer_path = (
+            f"generated/explorer/{library_id}/{version}/{EXPLORER_INDEX_FILE}"
+        )
+        await file_system.put_object(
+            object_id=explorer_path,
+            object_name=EXPLORER_INDEX_FILE,
+            content_type="application/octet-stream",
+            content_encoding="identity",
+            data=io.BytesIO(encode_explorer_index(explorer_data.items())),
+            headers=headers,
         )
 
         return PublishResponse(
@@ -400,27 +396,23 @@ async def publish_package(
 async def create_explorer_data(
     dir_path: Path, root_path: Path, forms: list[FormData], context: Context
 ) -> dict[str, ExplorerResponse]:
-    def compute_attributes_rec(
-        content: ExplorerResponse, all_data: dict[str, ExplorerResponse]
-    ):
-        size_files = sum(file.size for file in content.files)
-        attributes = [
-            compute_attributes_rec(all_data[folder.path], all_data)
-            for folder in content.folders
-        ]
-        size_folders = [attr[0] for attr in attributes]
-        count_folders = [attr[1] for attr in attributes]
-
-        for i, folder in enumerate(content.folders):
-            folder.size = size_folders[i]
-        content.size = size_files + sum(size_folders)
-        content.filesCount = len(content.files) + sum(count_folders)
-        return [content.size, content.filesCount]
+    """
+    Creates the description of the folders of a package, in one pass over its folders (bottom-up, such that
+    sizes & files count of sub-folders are known when describing their parent).
 
+    Parameters:
+        dir_path: Path of the package's root folder on disk.
+        root_path: Path of the package's root folder in the storage.
+        forms: Forms of the files published.
+        context: Current executing context.
+
+    Returns:
+        The folders' descriptions, keyed by paths relative to the package's root (`''` for the root).
+    """
     async with context.start(
         action="create explorer data", with_attributes={"path": str(root_path)}
     ) as ctx:
-        data = {}
+        data: dict[str, ExplorerResponse] = {}
 
         class Attr(NamedTuple):
             size: int
@@ -434,35 +426,38 @@ async def create_explorer_data(
             for form in forms
         }
 
-        for root, folders, files in os.walk(dir_path):
+        for root, folders, files in os.walk(dir_path, topdown=False):
             base_path = f"{Path(root).relative_to(dir_path)}"
             base_path = base_path + "/" if base_path != "." else ""
-            data[base_path.rstrip("/")] = ExplorerResponse(
-                size=-1,
-                filesCount=-1,
+            files_paths = [f"{base_path}{f}" for f in files]
+            if not base_path:
+                files_paths.append(ORIGINAL_ZIP_FILE)
+            sub_folders = [data[f"{base_path}{f}"] for f in folders]
+            content = ExplorerResponse(
+                size=sum(forms_data_dict[f].size for f in files_paths)
+                + sum(folder.size for folder in sub_folders),
+                filesCount=len(files_paths)
+                + sum(folder.filesCount for folder in sub_folders),
                 files=[
                     FileResponse(
-                        name=f,
-                        size=forms_data_dict[f"{base_path}{f}"].size,
-                        encoding=forms_data_dict[f"{base_path}{f}"].encoding,
+                        name=Path(f).name,
+                        size=forms_data_dict[f].size,
+                        encoding=forms_data_dict[f].encoding,
                     )
-                    for f in files
+                    for f in files_paths
                 ],
                 folders=[
                     FolderResponse(
-                        name=f, size=-1, path=f"{base_path.replace('./', '')}{f}"
+                        name=f,
+                        path=f"{base_path}{f}",
+                        size=folder.size,
+                        filesCount=folder.filesCount,
                     )
-                    for f in folders
+                    for f, folder in zip(folders, sub_folders)
                 ],
             )
-        data[""].files.append(
-            FileResponse(
-                name=ORIGINAL_ZIP_FILE,
-                size=forms_data_dict[ORIGINAL_ZIP_FILE].size,
-                encoding=forms_data_dict[ORIGINAL_ZIP_FILE].encoding,
-            )
-        )
-        compute_attributes_rec(data[""], data)
+            data[base_path.rstrip("/")] = content
+
         await ctx.info(
             "folders tree re-constructed",
             data={k: f"{len(d.files)} file(s)" for k, d in data.items()},
@@ -481,6 +476,7 @@ def format_response(
     file_id: str,
     partial_content: bool,
     max_age: str = "31536000",
+    validators: dict[str, str] | None = None,
 ) -> Response:
     content_type = metadata.get("contentType", None)
     content_encoding = metadata.get("contentEncoding", get_content_encoding(file_id))
@@ -496,6 +492,7 @@ def format_response(
             "cache-control": f"public, max-age={max_age}",
             "Cross-Origin-Opener-Policy": "same-origin",
             "Cross-Origin-Embedder-Policy": "require-corp",
+            **(validators or {}),
         },
     )
 
@@ -655,9 +652,38 @@ async def resolve_explicit_version(
     configuration: Configuration,
     context: Context,
 ):
+    """
+    Resolves the explicit version of a package from a semantic versioning query.
+
+    Resolutions of ranges are stored in the
+    :attr:`resolutions table <youwol.backends.cdn.configurations.Configuration.resolutions_table>`
+    of the service: subsequent resolutions of the same range only cost a dictionary lookup until the package is
+    published or deleted.
+
+    Parameters:
+        package_name: Name of the package.
+        input_version: Semantic versioning query.
+        configuration: The service's configuration.
+        context: Current executing context.
+
+    Returns:
+        The resolved version.
+
+    Raises:
+        QueryIndexException: If no version match the query.
+    """
     if is_fixed_version(input_version):
         return input_version
 
+    table = configuration.resolutions_table
+    version = table.get(package=package_name, semver=input_version)
+    if version:
+        await context.info(
+            f"Version of {package_name}#{input_version} resolved from table: {version}"
+        )
+        return version
+
+    generation = table.generation(package=package_name)
     versions_resp = await list_versions(
         name=package_name,
         max_results=1000,
@@ -675,7 +701,12 @@ async def resolve_explicit_version(
             query=f"requesting version {input_version} for {package_name}",
             error="No matching entries found",
         )
-
+    table.set(
+        package=package_name,
+        semver=input_version,
+        version=version,
+        generation=generation,
+    )
     return version
 
 
@@ -684,6 +715,8 @@ async def resolve_caching_max_age(semver: str, context: Context) -> str:
     This function resolves the caching max age based on the provided semantic version. If the version contains "-wip"
     postfix, or it's not a fixed version, indicating a work-in-progress or non-specific version query, the caching
     max age is set to 0; otherwise, it's set to a default value of one year (31536000 seconds).
+    In both cases, responses include validators (see
+    :func:`fetch_resource <youwol.backends.cdn.utils.fetch_resource>`) allowing clients to revalidate them.
 
     Parameters:
         semver: The semantic versioning string for which the caching max age needs to be resolved.
@@ -752,19 +785,63 @@ async def fetch_resource(
     configuration: Configuration,
     context: Context,
 ):
+    """
+    Fetches a resource from the storage, the response includes the validators `ETag` & `Last-Modified` of the stored
+    object.
+
+    If the request is conditional (`If-None-Match` or `If-Modified-Since`), the object's information is retrieved
+    first and a `304 Not Modified` response is returned, without reading the object, if the validators match.
+    Otherwise, the object's content and information are retrieved concurrently.
+
+    Parameters:
+        request: The incoming request.
+        path: The path of the resource in the storage.
+        max_age: The caching max age (see
+            :func:`resolve_caching_max_age <youwol.backends.cdn.utils.resolve_caching_max_age>`).
+        configuration: The service's configuration.
+        context: Current executing context.
+
+    Returns:
+        The response.
+    """
+    file_system = configuration.file_system
     range_bytes = extract_bytes_ranges(request=request)
-    content, file_info = await asyncio.gather(
-        configuration.file_system.get_object(
+
+    def get_validators(info: AnyDict) -> dict[str, str]:
+        return validators_headers(
+            etag=info.get("etag", None), last_modified=info.get("lastModified", None)
+        )
+
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        file_info = await file_system.get_info(
+            object_id=path, headers=context.headers()
+        )
+        headers = {
+            "cache-control": f"public, max-age={max_age}",
+            **get_validators(file_info),
+        }
+        if is_not_modified(request=request, headers=headers):
+            await context.info("Resource not modified", data={"headers": headers})
+            return not_modified_response(headers=headers)
+
+        content = await file_system.get_object(
             object_id=path, ranges_bytes=range_bytes, headers=context.headers()
-        ),
-        configuration.file_system.get_info(object_id=path, headers=context.headers()),
-    )
+        )
+    else:
+        content, file_info = await asyncio.gather(
+            file_system.get_object(
+                object_id=path, ranges_bytes=range_bytes, headers=context.headers()
+            ),
+            file_system.get_info(object_id=path, headers=context.headers()),
+        )
+
     resp = format_response(
         content=content,
         metadata=file_info.get("metadata", {}),
         partial_content=bool(range_bytes),
         file_id=path.split("/")[-1],
         max_age=max_age,
+        validators=get_validators(file_info),
     )
     if isinstance(configuration.file_system, LocalFileSystem):
         directive = YwBrowserCacheDirective(
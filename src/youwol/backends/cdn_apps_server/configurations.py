@@ -1,6 +1,9 @@
 # standard library
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+# Youwol backends
+from youwol.backends.cdn.resolutions_table import ResolutionsTable
 
 # Youwol utilities
 from youwol.utils.clients.assets_gateway.assets_gateway import AssetsGatewayClient
@@ -17,6 +20,17 @@ class Configuration:
     Assets gateway client.
     """
 
+    resolutions_table: ResolutionsTable = field(
+        default_factory=lambda: ResolutionsTable(max_age=60)
+    )
+    """
+    Table of the versions resolved from semantic versioning ranges: entry points requested by range are
+    fetched using the explicit version.
+
+    When the service runs along with the :mod:`cdn-backend <youwol.backends.cdn>`, it can share its table
+    (entries are then invalidated on publication).
+    """
+
 
 class Dependencies:
     get_configuration: Callable[[], Configuration | Awaitable[Configuration]]
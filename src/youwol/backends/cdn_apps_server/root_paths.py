@@ -2,21 +2,43 @@
 import base64
 
 # third parties
-import aiohttp
-
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from starlette.requests import Request
 from starlette.responses import Response
 
 # Youwol backends
-from youwol.backends.cdn_apps_server.configurations import get_configuration
+from youwol.backends.cdn_apps_server.configurations import (
+    Configuration,
+    get_configuration,
+)
 
 # Youwol utilities
 from youwol.utils import upstream_exception_from_response
 from youwol.utils.context import Context
+from youwol.utils.http_clients.cdn_backend.utils import (
+    is_fixed_version,
+    resolve_version,
+    to_std_npm_spec,
+)
+from youwol.utils.reverse_proxy import reverse_proxy
 
 router = APIRouter(tags=["cdn-apps-server"])
 
+FORWARDED_HEADERS = ["if-none-match", "if-modified-since", "range", "if-range"]
+"""
+Headers of the incoming request forwarded to the :mod:`cdn-backend <youwol.backends.cdn>`, in addition to the
+ones forwarded by :meth:`Context.headers <youwol.utils.context.context.Context.headers>`: conditional and
+partial requests are handled upstream.
+"""
+
+CORS_HEADERS = {
+    "cross-origin-opener-policy": "same-origin",
+    "cross-origin-embedder-policy": "require-corp",
+}
+"""
+Headers added to the responses.
+"""
+
 
 def get_info(segments: list[str]):
     namespace = segments[0]
@@ -26,27 +48,95 @@ def get_info(segments: list[str]):
     return namespace, name, version, resource
 
 
+async def resolve_explicit_version(
+    full_name: str, raw_id: str, version: str, config: Configuration, ctx: Context
+) -> str | None:
+    """
+    Resolves the explicit version of a package from a semantic versioning range, resolutions are stored in the
+    :attr:`resolutions table <youwol.backends.cdn_apps_server.configurations.Configuration.resolutions_table>`.
+
+    Parameters:
+        full_name: Name of the package.
+        raw_id: ID of the package.
+        version: Semantic versioning query.
+        config: The service's configuration.
+        ctx: Current context.
+
+    Returns:
+        The resolved version, `None` if the query is an explicit version or can not be resolved here
+        (errors are then reported by the cdn-backend).
+    """
+    try:
+        if is_fixed_version(to_std_npm_spec(version)):
+            return None
+    except ValueError:
+        return None
+
+    table = config.resolutions_table
+    resolved = table.get(package=full_name, semver=version)
+    if resolved:
+        return resolved
+
+    generation = table.generation(package=full_name)
+    try:
+        info = await config.assets_gtw_client.get_cdn_backend_router().get_library_info(
+            library_id=raw_id, headers=ctx.headers()
+        )
+    except HTTPException:
+        return None
+    resolved = await resolve_version(
+        name=full_name, input_semver=version, versions=info["versions"], context=ctx
+    )
+    if resolved:
+        table.set(
+            package=full_name, semver=version, version=resolved, generation=generation
+        )
+    return resolved
+
+
 async def get_raw_resource(
     namespace: str, name: str, version: str, resource: str, ctx: Context
-):
+) -> Response:
+    """
+    Forwards the request of a resource to the cdn-backend, the response's body is streamed.
+
+    Parameters:
+        namespace: Namespace of the package.
+        name: Name of the package (without namespace).
+        version: Semantic versioning query.
+        resource: Path of the resource within the package, empty for the entry point.
+        ctx: Current context.
+
+    Returns:
+        The response.
+    """
     full_name = f"{namespace}/{name}" if namespace else name
     raw_id = base64.urlsafe_b64encode(str.encode(full_name)).decode()
     config = await get_configuration()
-    url = f"{config.assets_gtw_client.url_base}/cdn-backend/resources/{raw_id}/{version}/{resource}"
-
-    cors_headers = {
-        "cross-origin-opener-policy": "same-origin",
-        "cross-origin-embedder-policy": "require-corp",
-    }
-
-    async with aiohttp.ClientSession(auto_decompress=False) as session:
-        async with await session.get(url=url, headers=ctx.headers()) as resp:
-            if resp.status < 400:
-                return Response(
-                    content=await resp.read(),
-                    headers={**dict(resp.headers.items()), **cors_headers},
-                )
+    resolved = await resolve_explicit_version(
+        full_name=full_name, raw_id=raw_id, version=version, config=config, ctx=ctx
+    )
+    url = f"{config.assets_gtw_client.url_base}/cdn-backend/resources/{raw_id}/{resolved or version}/{resource}"
+
+    resp = await reverse_proxy.request(
+        method="GET",
+        url=url,
+        headers=ctx.headers(
+            from_req_fwd=lambda keys: [k for k in keys if k in FORWARDED_HEADERS]
+        ),
+    )
+    if resp.status >= 400:
+        try:
             raise await upstream_exception_from_response(resp)
+        finally:
+            resp.release()
+
+    response = reverse_proxy.streaming_response(resp)
+    response.headers.update(CORS_HEADERS)
+    if resolved:
+        # Responses of explicit versions are cached for long, the ones of ranges need to be revalidated.
+        response.headers["cache-control"] = "public, max-age=0"
+    return response
 
 
 @router.get("/{rest_of_path:path}")
@@ -1,5 +1,4 @@
 # standard library
-import io
 import itertools
 import uuid
 
@@ -7,11 +6,19 @@ import uuid
 from fastapi import APIRouter, Depends
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 # Youwol utilities
-from youwol.utils import JSON, AnyDict, get_content_encoding, get_content_type
-from youwol.utils.clients.file_system.interfaces import Metadata
+from youwol.utils import (
+    JSON,
+    AnyDict,
+    get_content_encoding,
+    get_content_type,
+    is_not_modified,
+    not_modified_response,
+    validators_headers,
+)
+from youwol.utils.clients.file_system.interfaces import DigestReader, Metadata
 from youwol.utils.context import Context
 from youwol.utils.http_clients.files_backend import (
     GetInfoResponse,
@@ -90,7 +97,9 @@ async def upload(
     Returns:
         File information
     """
-    async with Context.start_ep(request=request):
+    async with Context.start_ep(request=request) as ctx:
+        # The fields of the form are needed before storing the file (and may come after it in the body):
+        # the file is spooled to a temporary file while parsing the form, not loaded in memory.
         form = await request.form()
         file = form.get("file")
         if not isinstance(file, UploadFile):
@@ -101,7 +110,6 @@ async def upload(
         filename = form.get("file_name", "default_name")
         if not isinstance(filename, str):
             raise ValueError("Field `filename` of form is not of type `str`")
-        content = await file.read()
         content_type = form.get("content_type", file.content_type) or get_content_type(
             filename
         )
@@ -112,13 +120,18 @@ async def upload(
         )
         if not isinstance(content_encoding, str):
             raise ValueError("Field `content_encoding` of form is not of type `str`")
+        data = DigestReader(file.file)
         await configuration.file_system.put_object(
             object_id=file_id,
             object_name=filename,
-            data=io.BytesIO(content),
+            data=data,
             content_type=content_type,
             content_encoding=content_encoding,
         )
+        await ctx.info(
+            text="File uploaded",
+            data={"fileId": file_id, "size": data.size, "sha256": data.hexdigest()},
+        )
 
         resp = PostFileResponse(
             fileId=file_id,
@@ -190,6 +203,9 @@ async def get_file(
     """
     Retrieve file's content.
 
+    The response includes the validators `ETag` & `Last-Modified`, conditional requests
+    (`If-None-Match`, `If-Modified-Since`) are answered by a `304 Not Modified` response if the file did not change.
+
     Parameters:
         request: Incoming request.
         file_id: File's ID.
@@ -202,16 +218,26 @@ async def get_file(
         request=request, with_attributes={"fileId": file_id}
     ) as ctx:
         stats = await configuration.file_system.get_info(object_id=file_id)
-        content = await configuration.file_system.get_object(object_id=file_id)
         max_age = "31536000"
-        await ctx.info("Retrieved file", data={"stats": stats, "size": len(content)})
-        return Response(
-            content=content,
+        headers = {
+            "cache-control": f"public, max-age={max_age}",
+            **validators_headers(
+                etag=stats.get("etag", None),
+                last_modified=stats.get("lastModified", None),
+            ),
+        }
+        if is_not_modified(request=request, headers=headers):
+            await ctx.info("File not modified", data={"stats": stats})
+            return not_modified_response(headers=headers)
+
+        await ctx.info("Stream file", data={"stats": stats})
+        return StreamingResponse(
+            content=configuration.file_system.stream_object(object_id=file_id),
             headers={
                 "Content-Encoding": stats["metadata"]["contentEncoding"],
                 "Content-Type": stats["metadata"]["contentType"],
-                "cache-control": f"public, max-age={max_age}",
-                "content-length": f"{len(content)}",
+                "content-length": f"{stats['size']}",
+                **headers,
             },
         )
 
@@ -15,7 +15,6 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, File, HTTPException
 from fastapi import Query as QueryParam
 from fastapi import UploadFile
-from starlette.responses import StreamingResponse
 
 # Youwol utilities
 from youwol.utils import (
@@ -32,8 +31,10 @@ from youwol.utils import (
     asyncio,
     check_permission_or_raise,
     get_all_individual_groups,
+    json_entry,
     to_group_id,
     user_info,
+    zip_streaming_response,
 )
 from youwol.utils.context import Context
 from youwol.utils.http_clients.cdn_backend import PublishResponse, patch_loading_graph
@@ -51,7 +52,6 @@ from youwol.utils.http_clients.flux_backend import (
     Requirements,
     RunnerRendering,
 )
-from youwol.utils.utils_paths import write_json
 
 # relative
 from .configurations import Configuration, Constants, get_configuration
@@ -268,35 +268,26 @@ async def download_zip(
         dict_project = project.dict()
         await ctx.info(text="Project retrieved")
 
-        with tempfile.TemporaryDirectory() as tmp_folder:
-            base_path = Path(tmp_folder)
-            with zipfile.ZipFile(
-                base_path / "flux-project.zip", "w", zipfile.ZIP_DEFLATED
-            ) as zipper:
+        description = {
+            "description": dict_project["description"],
+            "name": dict_project["name"],
+            "schemaVersion": dict_project["schemaVersion"],
+        }
+        return zip_streaming_response(
+            entries=[
+                json_entry(
+                    arcname=f"{file}.json",
+                    data=description if file == "description" else dict_project[file],
+                )
                 for file in [
                     "workflow",
                     "runnerRendering",
                     "requirements",
                     "description",
                     "builderRendering",
-                ]:
-                    if file == "description":
-                        description = {
-                            "description": dict_project["description"],
-                            "name": dict_project["name"],
-                            "schemaVersion": dict_project["schemaVersion"],
-                        }
-                        write_json(data=description, path=base_path / f"{file}.json")
-                    else:
-                        write_json(
-                            data=dict_project[file], path=base_path / f"{file}.json"
-                        )
-                    zipper.write(base_path / f"{file}.json", arcname=f"{file}.json")
-
-            content_bytes = (Path(tmp_folder) / "flux-project.zip").read_bytes()
-            return StreamingResponse(
-                io.BytesIO(content_bytes), media_type="application/zip"
-            )
+                ]
+            ]
+        )
 
 
 @router.delete("/projects/{project_id}", summary="delete a project")
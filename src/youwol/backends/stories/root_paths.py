@@ -1,7 +1,6 @@
 # standard library
 import asyncio
 import functools
-import io
 import itertools
 import tempfile
 import uuid
@@ -13,7 +12,6 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, File, HTTPException
 from fastapi import Query as QueryParam
 from fastapi import UploadFile
-from starlette.responses import StreamingResponse
 
 # Youwol backends
 from youwol.backends.stories.configurations import (
@@ -46,8 +44,12 @@ from youwol.utils import (
     Query,
     Request,
     WhereClause,
+    ZipEntry,
     generate_headers_downstream,
+    json_bytes,
+    json_entry,
     user_info,
+    zip_streaming_response,
 )
 from youwol.utils.clients.docdb.models import OrderingClause, QueryBody
 from youwol.utils.context import Context
@@ -73,7 +75,7 @@ from youwol.utils.http_clients.stories_backend import (
     UpgradePluginsBody,
     UpgradePluginsResponse,
 )
-from youwol.utils.utils_paths import extract_zip_file, parse_json, write_json
+from youwol.utils.utils_paths import extract_zip_file, parse_json
 
 router = APIRouter(tags=["stories-backend"])
 flatten = itertools.chain.from_iterable
@@ -198,61 +200,54 @@ async def download_zip(
             story_id=story_id, doc_db_stories=doc_db_stories, context=ctx
         )
         await ctx.info(text="Story found", data=story)
-        documents = await get_children_rec(
-            document_id=story["root_document_id"],
-            start_index=0,
-            chunk_size=10,
-            headers=ctx.headers(),
-            doc_db_docs=doc_db_docs,
-        )
-        root_doc = await query_document(
-            document_id=story["root_document_id"],
-            configuration=configuration,
-            headers=ctx.headers(),
+        documents, root_doc, requirements, global_content = await asyncio.gather(
+            get_children_rec(
+                document_id=story["root_document_id"],
+                start_index=0,
+                chunk_size=10,
+                headers=ctx.headers(),
+                doc_db_docs=doc_db_docs,
+            ),
+            query_document(
+                document_id=story["root_document_id"],
+                configuration=configuration,
+                headers=ctx.headers(),
+            ),
+            get_requirements(story_id=story_id, storage=storage, context=ctx),
+            storage.get_json(
+                path=get_document_path(
+                    story_id=story_id, document_id="global-contents"
+                ),
+                owner=Constants.default_owner,
+                headers=ctx.headers(),
+            ),
         )
         await ctx.info(
             text="Children documents retrieved", data={"count": len(documents)}
         )
-        requirements = await get_requirements(
-            story_id=story_id, storage=storage, context=ctx
-        )
-        global_content = await storage.get_json(
-            path=get_document_path(story_id=story_id, document_id="global-contents"),
-            owner=Constants.default_owner,
-            headers=ctx.headers(),
-        )
         data = {"story": story, "documents": [root_doc, *documents]}
-        with tempfile.TemporaryDirectory() as tmp_folder:
-            base_path = Path(tmp_folder)
-            write_json(data=data, path=base_path / ZIP_DATA_FILENAME)
-            write_json(
-                data=requirements.dict(), path=base_path / ZIP_REQUIREMENTS_FILENAME
-            )
-            write_json(
-                data=global_content, path=base_path / ZIP_GLOBAL_CONTENT_FILENAME
-            )
-            for doc in data["documents"]:
-                storage_path = get_document_path(
-                    story_id=story_id, document_id=doc["content_id"]
-                )
-                content = await storage.get_json(
-                    path=storage_path, owner=owner, headers=ctx.headers()
+        headers = ctx.headers()
+
+        def document_entry(content_id: str) -> ZipEntry:
+            async def content() -> bytes:
+                doc_content = await storage.get_json(
+                    path=get_document_path(story_id=story_id, document_id=content_id),
+                    owner=owner,
+                    headers=headers,
                 )
-                write_json(content, base_path / f"{doc['content_id']}.json")
-
-            zipper = zipfile.ZipFile(base_path / "story.zip", "w", zipfile.ZIP_DEFLATED)
-            all_files = [
-                "data.json",
-                ZIP_REQUIREMENTS_FILENAME,
-                ZIP_GLOBAL_CONTENT_FILENAME,
-            ] + [f"{doc['content_id']}.json" for doc in data["documents"]]
-            for filename in all_files:
-                zipper.write(base_path / filename, arcname=filename)
-            zipper.close()
-            content_bytes = (Path(tmp_folder) / "story.zip").read_bytes()
-            return StreamingResponse(
-                io.BytesIO(content_bytes), media_type="application/zip"
-            )
+                return json_bytes(doc_content)
+
+            return ZipEntry(arcname=f"{content_id}.json", content=content)
+
+        # The documents' contents are fetched concurrently while the archive is streamed.
+        return zip_streaming_response(
+            entries=[
+                json_entry(arcname=ZIP_DATA_FILENAME, data=data),
+                json_entry(arcname=ZIP_REQUIREMENTS_FILENAME, data=requirements.dict()),
+                json_entry(arcname=ZIP_GLOBAL_CONTENT_FILENAME, data=global_content),
+                *[document_entry(doc["content_id"]) for doc in data["documents"]],
+            ]
+        )
 
 
 @router.put("/stories", response_model=StoryResp, summary="create a new story")
@@ -26,6 +26,10 @@ class Constants:
     This is the limit of children that can be fetched for a folder/drive.
     It has to disappear, see issue #158 files explorer: no max children count
     """
+    max_subtree_count = 100000
+    """
+    This is the limit of entities (folders or items) that can be fetched at once when querying a subtree or a drive.
+    """
 
 
 @dataclass(frozen=True)
@@ -1,6 +1,5 @@
 # standard library
 import asyncio
-import itertools
 
 # third parties
 from fastapi import APIRouter, Depends, HTTPException
@@ -22,9 +21,12 @@ from youwol.utils.http_clients.tree_db_backend import (
 # relative
 from ..utils import (
     db_delete,
+    db_delete_batch,
     db_get,
     db_post,
     db_query,
+    db_query_drive,
+    doc_to_item,
     entities_children,
     folder_to_doc,
     get_default_drive,
@@ -32,10 +34,8 @@ from ..utils import (
     item_to_doc,
     list_deleted,
 )
-from .folders import purge_folder
 
 router = APIRouter(tags=["treedb-backend.drives"])
-flatten = itertools.chain.from_iterable
 
 
 # drives
@@ -217,66 +217,85 @@ async def purge_drive(
         with_attributes={"drive_id": drive_id},
     ) as ctx:  # type: Context
         dbs = configuration.doc_dbs
-        folders_db, items_db = dbs.folders_db, dbs.items_db
-
-        deleted = await list_deleted(
-            drive_id=drive_id, configuration=configuration, context=ctx
+        folders_db, items_db, deleted_db = (
+            dbs.folders_db,
+            dbs.items_db,
+            dbs.deleted_db,
         )
 
-        deletion_items = [
-            db_delete(docdb=items_db, doc=item_to_doc(f), context=ctx)
-            for f in deleted.items
-        ]
-        deletion_folders = [
-            db_delete(docdb=folders_db, doc=folder_to_doc(f), context=ctx)
-            for f in deleted.folders
-        ]
-
-        skip_items = {e.itemId for e in deleted.items}
-
-        children_folder = [
-            purge_folder(
-                request=request,
-                drive_id=drive_id,
-                folder_id=f.folderId,
-                skip_folders=set(),
-                skip_items=skip_items,
-                configuration=configuration,
+        deleted, folders, items, deleted_docs = await asyncio.gather(
+            list_deleted(drive_id=drive_id, configuration=configuration, context=ctx),
+            db_query_drive(
+                docdb=folders_db, drive_id=drive_id, path_prefix=None, context=ctx
+            ),
+            db_query_drive(
+                docdb=items_db, drive_id=drive_id, path_prefix=None, context=ctx
+            ),
+            db_query(
+                docdb=deleted_db,
+                key="drive_id",
+                value=drive_id,
+                max_count=100,
                 context=ctx,
-            )
-            for f in deleted.folders
-        ]
-
-        deletion_children_folders = await asyncio.gather(*children_folder)
-
-        deletion_rec_items = list(flatten([d for d, _, _ in deletion_children_folders]))
-        deletion_rec_folders = list(
-            flatten([d for _, d, _ in deletion_children_folders])
+            ),
         )
-        list_items = list(flatten([d for _, _, d in deletion_children_folders]))
-        all_entities_delete = [
-            *deletion_rec_items,
-            *deletion_rec_folders,
-            *deletion_items,
-            *deletion_folders,
+        deleted_folders_ids = {f.folderId for f in deleted.folders}
+        deleted_items_ids = {i.itemId for i in deleted.items}
+        # The whole drive is available: ancestors are resolved in memory from the parents' links (the entities
+        # scheduled for deletion are not in the folders or items tables anymore, but their descendants are).
+        parents = {
+            **{f["folder_id"]: f["parent_folder_id"] for f in folders},
+            **{f.folderId: f.parentFolderId for f in deleted.folders},
+        }
+        purged: dict[str, bool] = {}
+
+        def is_purged(folder_id: str) -> bool:
+            chain = []
+            while folder_id not in purged and folder_id not in deleted_folders_ids:
+                if folder_id not in parents:
+                    purged[folder_id] = False
+                    break
+                chain.append(folder_id)
+                folder_id = parents[folder_id]
+            result = folder_id in deleted_folders_ids or purged[folder_id]
+            purged.update({f: result for f in chain})
+            return result
+
+        purged_folders = [
+            f
+            for f in folders
+            if f["folder_id"] in deleted_folders_ids or is_purged(f["parent_folder_id"])
+        ]
+        purged_items = [
+            i
+            for i in items
+            if i["item_id"] not in deleted_items_ids and is_purged(i["folder_id"])
         ]
 
-        await asyncio.gather(*all_entities_delete)
-
-        deleted_db = configuration.doc_dbs.deleted_db
-        deleted_db_items = await db_query(
-            docdb=deleted_db, key="drive_id", value=drive_id, max_count=100, context=ctx
-        )
         await asyncio.gather(
-            *[
-                db_delete(docdb=deleted_db, doc=item, context=ctx)
-                for item in deleted_db_items
-            ]
+            db_delete_batch(
+                docdb=items_db,
+                docs=[
+                    *[item_to_doc(i) for i in deleted.items],
+                    *purged_items,
+                ],
+                context=ctx,
+            ),
+            db_delete_batch(
+                docdb=folders_db,
+                docs=[
+                    *[folder_to_doc(f) for f in deleted.folders],
+                    *purged_folders,
+                ],
+                context=ctx,
+            ),
         )
+        await db_delete_batch(docdb=deleted_db, docs=deleted_docs, context=ctx)
 
+        purged_folders_ids = {f["folder_id"] for f in purged_folders}
         response = PurgeResponse(
-            foldersCount=len(deletion_folders) + len(deletion_rec_folders),
-            itemsCount=len(deletion_items) + len(deletion_rec_items),
-            items=list_items + deleted.items,
+            foldersCount=len(deleted_folders_ids.union(purged_folders_ids)),
+            itemsCount=len(deleted.items) + len(purged_items),
+            items=[doc_to_item(i) for i in purged_items] + deleted.items,
         )
         return response
@@ -12,7 +12,6 @@ from youwol.utils import AnyDict
 from youwol.utils.context import Context
 from youwol.utils.http_clients.tree_db_backend import (
     EntityResponse,
-    FolderResponse,
     MoveItemBody,
     MoveResponse,
 )
@@ -21,11 +20,15 @@ from youwol.utils.http_clients.tree_db_backend import (
 from ..configurations import Configuration, get_configuration
 from ..utils import (
     db_post,
+    db_post_batch,
     db_query,
     doc_to_drive_response,
     doc_to_folder,
     doc_to_item,
-    entities_children,
+    folder_path,
+    get_entity_path,
+    get_parent,
+    get_subtree,
 )
 
 router = APIRouter(tags=["treedb-backend.entities"])
@@ -58,8 +61,8 @@ async def move(
         folders_db = configuration.doc_dbs.folders_db
         items: list[AnyDict]
         folders: list[AnyDict]
-        to_folder_or_drive: EntityResponse
-        items, folders, to_folder_or_drive = await asyncio.gather(
+        destination: AnyDict
+        items, folders, destination = await asyncio.gather(
             db_query(
                 docdb=items_db,
                 key="item_id",
@@ -74,9 +77,8 @@ async def move(
                 max_count=1,
                 context=ctx,
             ),
-            _get_entity(
-                entity_id=body.destinationFolderId,
-                include_items=False,
+            get_parent(
+                parent_id=body.destinationFolderId,
                 configuration=configuration,
                 context=ctx,
             ),
@@ -87,84 +89,119 @@ async def move(
                 status_code=404, detail="Source item or folder not found in database"
             )
 
-        if (
-            isinstance(to_folder_or_drive, HTTPException)
-            and to_folder_or_drive.status_code == 404
-        ):
+        if isinstance(destination, HTTPException) and destination.status_code == 404:
             raise HTTPException(
                 status_code=404,
                 detail="Destination folder or drive not found in database",
             )
 
-        if isinstance(to_folder_or_drive, Exception):
-            raise to_folder_or_drive
+        if isinstance(destination, Exception):
+            raise destination
 
-        destination = to_folder_or_drive.entity
-        destination_id = (
-            destination.folderId
-            if isinstance(destination, FolderResponse)
-            else destination.driveId
+        destination_path = await get_entity_path(
+            entity=destination, configuration=configuration, context=ctx
         )
         target = items[0] if len(items) > 0 else folders[0]
+        location = {
+            "group_id": destination["group_id"],
+            "drive_id": destination["drive_id"],
+        }
 
         if "parent_folder_id" in target:
-            doc = {
-                **target,
-                **{
-                    "parent_folder_id": destination_id,
-                    "group_id": destination.groupId,
-                    "drive_id": destination.driveId,
-                },
-            }
-            await db_post(docdb=folders_db, doc=doc, context=ctx)
-            if (
-                target["drive_id"] == destination.driveId
-                and target["group_id"] == destination.groupId
-            ):
-                return MoveResponse(foldersCount=1, items=[])
-            to_move = await entities_children(
-                folder_id=target["folder_id"], configuration=configuration, context=ctx
-            )
-
-            bodies = [
-                MoveItemBody(
-                    targetId=item.itemId, destinationFolderId=target["folder_id"]
-                )
-                for item in to_move.items
-                # For now only 'original' assets can be moved (no 'symlinks'), related to change in authorisation policy
-                # (handled by assets-gtw.treedb-backend)
-                if not item.borrowed
-            ] + [
-                MoveItemBody(
-                    targetId=item.folderId, destinationFolderId=target["folder_id"]
-                )
-                for item in to_move.folders
-            ]
-
-            results = await asyncio.gather(
-                *[
-                    move(request=request, body=body, configuration=configuration)
-                    for body in bodies
-                ]
-            )
-            all_items = list(flatten([r.items for r in results]))
-            return MoveResponse(
-                foldersCount=1 + sum(r.foldersCount for r in results), items=all_items
+            return await _move_folder(
+                target=target,
+                destination_id=body.destinationFolderId,
+                destination_path=destination_path,
+                location=location,
+                configuration=configuration,
+                context=ctx,
             )
 
         doc = {
             **target,
-            **{
-                "folder_id": destination_id,
-                "group_id": destination.groupId,
-                "drive_id": destination.driveId,
-            },
+            **location,
+            "folder_id": body.destinationFolderId,
+            "path": destination_path,
         }
         await db_post(docdb=items_db, doc=doc, context=ctx)
         response = MoveResponse(foldersCount=0, items=[doc_to_item(doc)])
         return response
 
 
+async def _move_folder(
+    target: AnyDict,
+    destination_id: str,
+    destination_path: str,
+    location: dict[str, str],
+    configuration: Configuration,
+    context: Context,
+) -> MoveResponse:
+    async with context.start(action="_move_folder") as ctx:  # type: Context
+        folders_db = configuration.doc_dbs.folders_db
+        items_db = configuration.doc_dbs.items_db
+        source_path = await get_entity_path(
+            entity=target, configuration=configuration, context=ctx
+        )
+        if destination_path.startswith(source_path):
+            raise HTTPException(
+                status_code=400,
+                detail="A folder can not be moved into itself or one of its descendants",
+            )
+        target_path = folder_path(
+            parent_path=destination_path, folder_id=target["folder_id"]
+        )
+        sub_folders, sub_items = await get_subtree(
+            folder=target, path=source_path, configuration=configuration, context=ctx
+        )
+        await ctx.info(
+            "Subtree retrieved",
+            data={"foldersCount": len(sub_folders), "itemsCount": len(sub_items)},
+        )
+        same_location = (
+            target["drive_id"] == location["drive_id"]
+            and target["group_id"] == location["group_id"]
+        )
+        # For now only 'original' assets are moved to another drive or group (no 'symlinks'), related to change in
+        # authorisation policy (handled by assets-gtw.treedb-backend).
+        # Nevertheless, all the items' documents are relocated: the subtree of a folder is queried by drive & path.
+        moved_items = [
+            item
+            for item in sub_items
+            if not same_location and not doc_to_item(item).borrowed
+        ]
+
+        def rewrite(doc: AnyDict) -> AnyDict:
+            return {**doc, "path": target_path + doc["path"][len(source_path) :]}
+
+        await asyncio.gather(
+            db_post_batch(
+                docdb=folders_db,
+                docs=[
+                    {
+                        **target,
+                        **location,
+                        "parent_folder_id": destination_id,
+                        "path": target_path,
+                    },
+                    *[{**rewrite(folder), **location} for folder in sub_folders],
+                ],
+                context=ctx,
+            ),
+            db_post_batch(
+                docdb=items_db,
+                docs=[{**rewrite(item), **location} for item in sub_items],
+                context=ctx,
+            ),
+        )
+        if same_location:
+            return MoveResponse(foldersCount=1, items=[])
+
+        return MoveResponse(
+            foldersCount=1 + len(sub_folders),
+            items=[doc_to_item({**rewrite(item), **location}) for item in moved_items],
+        )
+
+
 async def _get_entity(
     entity_id: str,
     configuration: Configuration,
@@ -1,9 +1,3 @@
-# standard library
-import asyncio
-import itertools
-
-from collections.abc import Coroutine
-
 # third parties
 from fastapi import APIRouter, Depends
 from starlette.requests import Request
@@ -18,7 +12,6 @@ from youwol.utils.http_clients.tree_db_backend import (
     ChildrenResponse,
     FolderBody,
     FolderResponse,
-    ItemResponse,
     PathResponse,
     RenameBody,
 )
@@ -31,14 +24,11 @@ from ..utils import (
     db_post,
     doc_to_folder,
     entities_children,
-    folder_to_doc,
     get_folder,
     get_folders_rec,
-    item_to_doc,
 )
 
 router = APIRouter(tags=["treedb-backend.folders"])
-flatten = itertools.chain.from_iterable
 
 
 @router.put(
@@ -273,54 +263,3 @@ async def queue_delete_folder(
             context=ctx,
         )
         return {}
-
-
-async def purge_folder(
-    request: Request,
-    drive_id: str,
-    folder_id: str,
-    skip_folders: set[str],
-    skip_items: set[str],
-    configuration: Configuration,
-    context: Context,
-) -> tuple[list[Coroutine], list[Coroutine], list[ItemResponse]]:
-    async with context.start(action="purge folder") as ctx:
-        doc_dbs = configuration.doc_dbs
-        content = await entities_children(
-            folder_id=folder_id, configuration=configuration, context=ctx
-        )
-
-        delete_items = [
-            db_delete(docdb=doc_dbs.items_db, doc=item_to_doc(f), context=ctx)
-            for f in content.items
-            if f.itemId not in skip_items
-        ]
-        delete_folders = [
-            db_delete(docdb=doc_dbs.folders_db, doc=folder_to_doc(f), context=ctx)
-            for f in content.folders
-            if f.folderId not in skip_items
-        ]
-
-        skip_items = skip_items.union({f.itemId for f in content.items})
-
-        children_folder = [
-            purge_folder(
-                request=request,
-                drive_id=drive_id,
-                folder_id=f.folderId,
-                context=ctx,
-                skip_folders=skip_folders,
-                skip_items=skip_items,
-                configuration=configuration,
-            )
-            for f in content.folders
-            if f.folderId not in skip_folders
-        ]
-
-        deletion_rec_folders = await asyncio.gather(*children_folder)
-
-        return (
-            delete_items + list(flatten([d for d, _, _ in deletion_rec_folders])),
-            delete_folders + list(flatten([d for _, d, _ in deletion_rec_folders])),
-            content.items + list(flatten([d for _, _, d in deletion_rec_folders])),
-        )
@@ -29,6 +29,7 @@ from ..utils import (
     db_post,
     db_query,
     doc_to_item,
+    get_entity_path,
     get_folders_rec,
     get_parent,
     list_deleted,
@@ -55,6 +56,9 @@ async def _create_item(
             "group_id": parent["group_id"],
             "drive_id": parent["drive_id"],
             "metadata": json.dumps({"borrowed": item.borrowed}),
+            "path": await get_entity_path(
+                entity=parent, configuration=configuration, context=ctx
+            ),
         }
         await db_post(docdb=items_db, doc=doc, context=ctx)
 
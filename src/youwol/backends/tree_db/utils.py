@@ -13,7 +13,14 @@ from fastapi import Depends, HTTPException
 from starlette.requests import Request
 
 # Youwol utilities
-from youwol.utils import DocDb, asyncio, decode_id, get_all_individual_groups
+from youwol.utils import (
+    AnyDict,
+    DocDb,
+    asyncio,
+    decode_id,
+    get_all_individual_groups,
+)
+from youwol.utils.clients.docdb.models import Query, QueryBody, WhereClause
 from youwol.utils.context import Context
 from youwol.utils.http_clients.tree_db_backend import (
     ChildrenResponse,
@@ -241,6 +248,17 @@ async def db_post(docdb: DocDb, doc: Any, context: Context):
         )
 
 
+async def db_post_batch(docdb: DocDb, docs: list[AnyDict], context: Context):
+    async with context.start(
+        action="db_post_batch", with_attributes={"count": len(docs)}
+    ) as ctx:  # type: Context
+        if not docs:
+            return {}
+        return await docdb.update_documents(
+            docs, owner=Constants.public_owner, headers=ctx.headers()
+        )
+
+
 async def db_query(
     docdb: DocDb, key: str, value: str, max_count: int, context: Context
 ):
@@ -261,6 +279,185 @@ async def db_delete(docdb: DocDb, doc: dict[str, Any], context: Context):
         )
 
 
+async def db_delete_batch(docdb: DocDb, docs: list[AnyDict], context: Context):
+    async with context.start(
+        action="db_delete_batch", with_attributes={"count": len(docs)}
+    ) as ctx:  # type: Context
+        if not docs:
+            return {}
+        return await docdb.delete_documents(
+            docs, owner=Constants.public_owner, headers=ctx.headers()
+        )
+
+
+async def db_query_drive(
+    docdb: DocDb, drive_id: str, path_prefix: str | None, context: Context
+) -> list[AnyDict]:
+    """
+    Queries the entities (folders or items) of a drive, eventually restricted to the ones with a materialized path
+    starting with a given prefix.
+
+    Parameters:
+        docdb: Folders or items table.
+        drive_id: Drive's ID.
+        path_prefix: If provided, prefix of the materialized paths.
+        context: Current context.
+
+    Returns:
+        The documents.
+    """
+    async with context.start(action="db_query_drive") as ctx:  # type: Context
+        where_clause = [WhereClause(column="drive_id", relation="eq", term=drive_id)]
+        if path_prefix:
+            where_clause += [
+                WhereClause(column="path", relation="geq", term=path_prefix),
+                WhereClause(column="path", relation="lt", term=f"{path_prefix}\uffff"),
+            ]
+        r = await docdb.query(
+            query_body=QueryBody(
+                allow_filtering=bool(path_prefix),
+                max_results=Constants.max_subtree_count,
+                query=Query(where_clause=where_clause),
+            ),
+            owner=Constants.public_owner,
+            headers=ctx.headers(),
+        )
+        return list(r["documents"])
+
+
+def folder_path(parent_path: str, folder_id: str) -> str:
+    """
+    The materialized path of a folder is the concatenation of the IDs of its drive, its ancestors and itself,
+    each one followed by a `/` (e.g. `drive_id/folder_a/folder_b/`).
+    The materialized path of a drive is `drive_id/`, items store the one of their parent folder.
+
+    Parameters:
+        parent_path: Materialized path of the parent folder or drive.
+        folder_id: ID of the folder.
+
+    Returns:
+        The materialized path of the folder.
+    """
+    return f"{parent_path}{folder_id}/"
+
+
+def path_ids(path: str) -> list[str]:
+    """
+    Parameters:
+        path: A materialized path, see :func:`folder_path <youwol.backends.tree_db.utils.folder_path>`.
+
+    Returns:
+        The IDs of the drive & folders involved in the path.
+    """
+    return [part for part in path.split("/") if part]
+
+
+async def get_entity_path(
+    entity: AnyDict, configuration: Configuration, context: Context
+) -> str:
+    """
+    Returns the materialized path of a drive or folder (provided as stored document), it is the one of its children.
+
+    Folders created before the introduction of materialized paths do not store it, it is then computed by
+    walking up the parents.
+
+    Parameters:
+        entity: Document of the drive or folder.
+        configuration: Configuration of the service.
+        context: Current context.
+
+    Returns:
+        The materialized path.
+    """
+    if "folder_id" not in entity:
+        return f"{entity['drive_id']}/"
+    if entity.get("path"):
+        return entity["path"]
+    folders, _ = await get_folders_rec(
+        folder_id=entity["folder_id"],
+        drive_id=entity["drive_id"],
+        configuration=configuration,
+        context=context,
+    )
+    path = f"{entity['drive_id']}/"
+    for folder in folders:
+        path = folder_path(parent_path=path, folder_id=folder.folderId)
+    return path
+
+
+async def get_subtree(
+    folder: AnyDict, path: str, configuration: Configuration, context: Context
+) -> tuple[list[AnyDict], list[AnyDict]]:
+    """
+    Retrieves all the folders & items included in a folder (recursively), their `path` attributes are set.
+
+    Parameters:
+        folder: Document of the folder.
+        path: Materialized path of the folder.
+        configuration: Configuration of the service.
+        context: Current context.
+
+    Returns:
+        The folders & the items.
+    """
+    async with context.start(action="get_subtree") as ctx:  # type: Context
+        doc_dbs = configuration.doc_dbs
+        if folder.get("path"):
+            # If a folder stores its path, so do all its descendants.
+            folders, items = await asyncio.gather(
+                db_query_drive(
+                    docdb=doc_dbs.folders_db,
+                    drive_id=folder["drive_id"],
+                    path_prefix=path,
+                    context=ctx,
+                ),
+                db_query_drive(
+                    docdb=doc_dbs.items_db,
+                    drive_id=folder["drive_id"],
+                    path_prefix=path,
+                    context=ctx,
+                ),
+            )
+            return [f for f in folders if f["folder_id"] != folder["folder_id"]], items
+
+        await ctx.info("Folder without materialized path, walk down the children")
+        folders, items = [], []
+        level = [(folder["folder_id"], path)]
+        while level:
+            children = await asyncio.gather(
+                *[
+                    asyncio.gather(
+                        db_query(
+                            docdb=doc_dbs.folders_db,
+                            key="parent_folder_id",
+                            value=parent_id,
+                            max_count=Constants.max_children_count,
+                            context=ctx,
+                        ),
+                        db_query(
+                            docdb=doc_dbs.items_db,
+                            key="folder_id",
+                            value=parent_id,
+                            max_count=Constants.max_children_count,
+                            context=ctx,
+                        ),
+                    )
+                    for parent_id, _ in level
+                ]
+            )
+            next_level = []
+            for (_, parent_path), (children_folders, children_items) in zip(
+                level, children
+            ):
+                items += [{**item, "path": parent_path} for item in children_items]
+                for child in children_folders:
+                    child_path = folder_path(parent_path, child["folder_id"])
+                    folders.append({**child, "path": child_path})
+                    next_level.append((child["folder_id"], child_path))
+            level = next_level
+        return folders, items
+
+
 async def get_parent(parent_id: str, configuration: Configuration, context: Context):
     folders_db, drives_db = (
         configuration.doc_dbs.folders_db,
@@ -349,24 +546,38 @@ async def get_drive(drive_id: str, configuration: Configuration, context: Contex
 async def get_folders_rec(
     folder_id: str, drive_id: str, configuration: Configuration, context: Context
 ):
-    drive = await get_drive(
-        drive_id=drive_id, configuration=configuration, context=context
-    )
-
-    folders = [
-        await get_folder(
-            folder_id=folder_id, configuration=configuration, context=context
+    async with context.start(action="get_folders_rec") as ctx:  # type: Context
+        doc = await db_get(
+            partition_keys={"folder_id": folder_id},
+            context=ctx,
+            docdb=configuration.doc_dbs.folders_db,
         )
-    ]
-    while folders[0].parentFolderId != folders[0].driveId:
-        folders = [
-            await get_folder(
-                folder_id=folders[0].parentFolderId,
-                configuration=configuration,
-                context=context,
+        if doc.get("path"):
+            # The ancestors are known from the materialized path: they are fetched concurrently.
+            drive, *ancestors = await asyncio.gather(
+                get_drive(drive_id=drive_id, configuration=configuration, context=ctx),
+                *[
+                    get_folder(
+                        folder_id=ancestor_id, configuration=configuration, context=ctx
+                    )
+                    for ancestor_id in path_ids(doc["path"])[1:-1]
+                ],
             )
-        ] + folders
-    return folders, drive
+            return [*ancestors, doc_to_folder(doc)], drive
+
+        drive = await get_drive(
+            drive_id=drive_id, configuration=configuration, context=ctx
+        )
+        folders = [doc_to_folder(doc)]
+        while folders[0].parentFolderId != folders[0].driveId:
+            folders = [
+                await get_folder(
+                    folder_id=folders[0].parentFolderId,
+                    configuration=configuration,
+                    context=ctx,
+                )
+            ] + folders
+        return folders, drive
 
 
 async def list_deleted(drive_id: str, configuration: Configuration, context: Context):
@@ -411,14 +622,21 @@ async def create_folder(
             parent_id=parent_folder_id, configuration=configuration, context=ctx
         )
 
+        folder_id = folder.folderId or str(uuid.uuid4())
         doc = {
-            "folder_id": folder.folderId or str(uuid.uuid4()),
+            "folder_id": folder_id,
             "name": folder.name,
             "parent_folder_id": parent_folder_id,
             "group_id": parent["group_id"],
             "type": folder.kind,
             "metadata": folder.metadata,
             "drive_id": parent["drive_id"],
+            "path": folder_path(
+                parent_path=await get_entity_path(
+                    entity=parent, configuration=configuration, context=ctx
+                ),
+                folder_id=folder_id,
+            ),
         }
         await db_post(docdb=folders_db, doc=doc, context=ctx)
 
@@ -1,5 +1,6 @@
 # standard library
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 # third parties
 import aiohttp
@@ -12,6 +13,7 @@ from youwol.utils.clients.oidc.tokens_manager import SessionLessTokenManager
 
 # relative
 from ..deployment import Configuration, ConfigurationFactory
+from .edge_cache import EdgeCache, TtlMemo
 
 
 class Dependencies:
@@ -31,6 +33,11 @@ class Dependencies:
         )
         self.session_less_token_manager = session_less_token_manager
         self.client_session = aiohttp.ClientSession(auto_decompress=False)
+        self.edge_cache = EdgeCache(
+            root=Path(configuration.edge_cache_dir),
+            max_size=configuration.edge_cache_max_size,
+        )
+        self.loading_graph_memo = TtlMemo(ttl=configuration.loading_graph_ttl)
         self.configuration = configuration
 
     async def shutdown(self):
@@ -0,0 +1,240 @@
+# standard library
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+# typing
+from typing import BinaryIO
+
+# third parties
+from aiohttp import ClientResponse
+from semantic_version import Version
+
+# Youwol utilities
+from youwol.utils import Coalescer
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Response stored by the edge cache: the body is either on disk (`path`) or in memory (`content`).
+    """
+
+    status: int
+    headers: dict[str, str]
+    path: Path | None = None
+    content: bytes = b""
+    size: int = 0
+
+
+def resource_cache_key(rest_of_path: str) -> str | None:
+    """
+    Returns the cache key of a resource `{asset_id}/{version}/{path}`, `None` if the version is not explicit
+    or is a prerelease (only resources of explicit, released versions are immutable: *e.g.* `-wip` versions are
+    republished).
+    """
+    parts = rest_of_path.strip("/").split("/", 2)
+    if len(parts) < 2:
+        return None
+    try:
+        if Version(parts[1]).prerelease:
+            return None
+    except ValueError:
+        return None
+    return "/".join([parts[0], parts[1], parts[2] if len(parts) == 3 else ""])
+
+
+def is_cacheable(headers: dict[str, str]) -> bool:
+    """
+    Returns whether a response can be stored, according to its (lower-cased) headers: responses with
+    `cache-control` including `no-store`, `no-cache` or `max-age=0` are not.
+    """
+    directives = {
+        directive.strip().lower()
+        for directive in headers.get("cache-control", "").split(",")
+    }
+    return not directives & {"no-store", "no-cache", "max-age=0"}
+
+
+class EdgeCache:
+    """
+    On-disk, size-bounded (LRU) cache of the resources of explicit versions, keyed by
+    `(package, version, path)`.
+
+    Bodies are stored in `{digest}.body` files and their status & headers in `{digest}.json` files; the index is
+    rebuilt from the folder when the cache is created.
+    """
+
+    def __init__(self, root: Path, max_size: int, chunk_size: int = 2**16):
+        self.root = root
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.total_size = 0
+        self.__entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.__coalescer: Coalescer[CachedResponse] = Coalescer()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.__load()
+
+    def get(self, key: str) -> tuple[CachedResponse, BinaryIO] | None:
+        """
+        Returns the entry & its opened body file, `None` if not in cache.
+        The file is opened here: the entry can be evicted while the response is streamed.
+        """
+        entry = self.__entries.get(key)
+        if not entry or not entry.path:
+            return None
+        try:
+            fp = entry.path.open("rb")
+        except FileNotFoundError:
+            self.__evict(key)
+            return None
+        self.__entries.move_to_end(key)
+        return entry, fp
+
+    async def fetch(
+        self, key: str, request: Callable[[], Awaitable[ClientResponse]]
+    ) -> tuple[CachedResponse, bool]:
+        """
+        Fetches a resource from upstream (concurrent fetches of the same key are coalesced).
+        Successful & cacheable (see :func:`is_cacheable`) responses are stored on disk, other responses are returned
+        with their content in memory.
+
+        Returns:
+            The response & whether the fetch has been coalesced with an ongoing one.
+        """
+        return await self.__coalescer.run(key, lambda: self.__fetch(key, request))
+
+    async def stream(self, fp: BinaryIO) -> AsyncIterator[bytes]:
+        try:
+            while chunk := await asyncio.to_thread(fp.read, self.chunk_size):
+                yield chunk
+        finally:
+            fp.close()
+
+    async def __fetch(
+        self, key: str, request: Callable[[], Awaitable[ClientResponse]]
+    ) -> CachedResponse:
+        resp = await request()
+        async with resp:
+            headers = {k.lower(): v for k, v in resp.headers.items()}
+            if resp.status != 200 or not is_cacheable(headers):
+                return CachedResponse(
+                    status=resp.status, headers=headers, content=await resp.read()
+                )
+            digest = hashlib.sha256(key.encode()).hexdigest()
+            path = self.root / f"{digest}.body"
+            tmp_path = self.root / f"{digest}.{os.getpid()}.tmp"
+            size = 0
+            try:
+                fp = await asyncio.to_thread(tmp_path.open, "wb")
+                with fp:
+                    async for chunk, _ in resp.content.iter_chunks():
+                        await asyncio.to_thread(fp.write, chunk)
+                        size += len(chunk)
+                await asyncio.to_thread(os.replace, tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        entry = CachedResponse(status=200, headers=headers, path=path, size=size)
+        await asyncio.to_thread(
+            (self.root / f"{digest}.json").write_text,
+            json.dumps({"key": key, "headers": headers, "size": size}),
+        )
+        self.__put(key, entry)
+        return entry
+
+    def __put(self, key: str, entry: CachedResponse):
+        if key in self.__entries:
+            self.total_size -= self.__entries.pop(key).size
+        self.__entries[key] = entry
+        self.total_size += entry.size
+        while self.total_size > self.max_size and len(self.__entries) > 1:
+            self.__evict(next(iter(self.__entries)))
+
+    def __evict(self, key: str):
+        entry = self.__entries.pop(key, None)
+        if not entry or not entry.path:
+            return
+        self.total_size -= entry.size
+        for path in [entry.path, entry.path.with_suffix(".json")]:
+            path.unlink(missing_ok=True)
+
+    def __load(self):
+        metadata_files = sorted(
+            self.root.glob("*.json"), key=lambda p: p.stat().st_mtime
+        )
+        for metadata_file in metadata_files:
+            path = metadata_file.with_suffix(".body")
+            try:
+                metadata = json.loads(metadata_file.read_text())
+            except ValueError:
+                metadata_file.unlink(missing_ok=True)
+                continue
+            if not path.exists():
+                metadata_file.unlink(missing_ok=True)
+                continue
+            self.__put(
+                metadata["key"],
+                CachedResponse(
+                    status=200,
+                    headers=metadata["headers"],
+                    path=path,
+                    size=metadata["size"],
+                ),
+            )
+        for tmp_path in self.root.glob("*.tmp"):
+            tmp_path.unlink(missing_ok=True)
+
+
+class TtlMemo:
+    """
+    In-memory memoization of small upstream responses (e.g. loading graphs) for a short duration,
+    concurrent misses are coalesced.
+    """
+
+    def __init__(self, ttl: float, max_count: int = 1000):
+        self.ttl = ttl
+        self.max_count = max_count
+        self.__entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self.__coalescer: Coalescer[CachedResponse] = Coalescer()
+
+    @staticmethod
+    def key(body: object) -> str:
+        return hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        item = self.__entries.get(key)
+        if not item:
+            return None
+        expires, entry = item
+        if time.monotonic() > expires:
+            del self.__entries[key]
+            return None
+        return entry
+
+    async def fetch(
+        self, key: str, request: Callable[[], Awaitable[ClientResponse]]
+    ) -> tuple[CachedResponse, bool]:
+        return await self.__coalescer.run(key, lambda: self.__fetch(key, request))
+
+    async def __fetch(
+        self, key: str, request: Callable[[], Awaitable[ClientResponse]]
+    ) -> CachedResponse:
+        resp = await request()
+        async with resp:
+            entry = CachedResponse(
+                status=resp.status,
+                headers={k.lower(): v for k, v in resp.headers.items()},
+                content=await resp.read(),
+            )
+        if entry.status == 200:
+            self.__entries[key] = (time.monotonic() + self.ttl, entry)
+            while len(self.__entries) > self.max_count:
+                self.__entries.popitem(last=False)
+        return entry
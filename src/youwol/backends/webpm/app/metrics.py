@@ -2,7 +2,7 @@
 import re
 
 # third parties
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 
 class CountVersions:
@@ -30,3 +30,17 @@ gauge_concurrent_streaming = Gauge(
     documentation="Nb of concurrent resources streaming",
 )
 count_root_redirection = Counter("webpm_root_redirection", "Nb of redirection from /")
+count_edge_cache = Counter(
+    name="webpm_edge_cache",
+    documentation="Nb of requests served by the edge caches, by cache & result (hit, miss, coalesced, bypass)",
+    labelnames=["cache", "result"],
+)
+histogram_edge_cache_latency = Histogram(
+    name="webpm_edge_cache_latency_seconds",
+    documentation="Latency until the response starts, by cache & result (hit, miss, coalesced, bypass)",
+    labelnames=["cache", "result"],
+)
+gauge_edge_cache_size = Gauge(
+    name="webpm_edge_cache_size_bytes",
+    documentation="Size of the resources stored in the edge cache",
+)
@@ -2,7 +2,7 @@
 
 # third parties
 from fastapi.param_functions import Depends
-from starlette.responses import Response, StreamingResponse
+from starlette.responses import Response
 
 # relative
 from ..constantes import (
@@ -20,7 +20,7 @@ from .root import resource, router
 @router.get("/cdn-client.js")
 async def get_cdn_client_js_default_version(
     deps: Dependencies = Depends(dependenciesFactory),
-) -> StreamingResponse:
+) -> Response:
     return await get_cdn_client_js(
         deps.configuration.default_cdn_client_version, deps=deps
     )
@@ -29,7 +29,7 @@ async def get_cdn_client_js_default_version(
 @router.get("/{version}/cdn-client.js")
 async def get_cdn_client_js(
     version: str, deps: Dependencies = Depends(dependenciesFactory)
-) -> StreamingResponse:
+) -> Response:
     count_download.inc()
     count_version.inc(version)
     resource_path = f"{CDN_CLIENT_ASSET_ID}/{version}/{CDN_CLIENT_ASSET_PATH}"
@@ -39,7 +39,7 @@ async def get_cdn_client_js(
 @router.get("/cdn-client.js.map")
 async def get_cdn_client_js_map_default_version(
     deps: Dependencies = Depends(dependenciesFactory),
-) -> StreamingResponse:
+) -> Response:
     return await get_cdn_client_js_map(
         deps.configuration.default_cdn_client_version, deps
     )
@@ -48,7 +48,7 @@ async def get_cdn_client_js_map_default_version(
 @router.get("/{version}/cdn-client.js.map")
 async def get_cdn_client_js_map(
     version: str, deps: Dependencies = Depends(dependenciesFactory)
-) -> StreamingResponse:
+) -> Response:
     resource_path = (
         f"{CDN_CLIENT_ASSET_ID}/{version}/{CDN_CLIENT_ASSET_PATH_SOURCE_MAP}"
     )
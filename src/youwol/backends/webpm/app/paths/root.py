@@ -1,26 +1,69 @@
+# standard library
+import time
+
 # third parties
 from fastapi import APIRouter, Depends, Request
-from starlette.responses import RedirectResponse, StreamingResponse
+from starlette.responses import RedirectResponse, Response, StreamingResponse
 
 # relative
+from ..constantes import PROXIED_HEADERS
 from ..dependencies import Dependencies, dependenciesFactory
-from ..metrics import count_root_redirection
+from ..edge_cache import CachedResponse, resource_cache_key
+from ..metrics import (
+    count_data_transferred,
+    count_edge_cache,
+    count_root_redirection,
+    gauge_edge_cache_size,
+    histogram_edge_cache_latency,
+)
 from .common import client_response_to_streaming_response
 
 router = APIRouter(tags=["webpm"])
 
 
+def record_edge_cache(cache: str, result: str, start: float):
+    count_edge_cache.labels(cache=cache, result=result).inc()
+    histogram_edge_cache_latency.labels(cache=cache, result=result).observe(
+        time.perf_counter() - start
+    )
+
+
+def cached_response_headers(entry: CachedResponse) -> dict[str, str]:
+    return {
+        k: v
+        for k, v in entry.headers.items()
+        if k in PROXIED_HEADERS or k == "content-type"
+    }
+
+
 @router.post("/loading-graph")
 async def loading_graph(
     request: Request, deps: Dependencies = Depends(dependenciesFactory)
-) -> StreamingResponse:
-    token = await deps.session_less_token_manager.get_access_token()
-    return await client_response_to_streaming_response(
-        await deps.client_session.post(
-            f"{deps.configuration.assets_gateway_base_url}/cdn-backend/queries/loading-graph",
-            json=await request.json(),
-            headers={"Authorization": f"Bearer {token}"},
-        ),
+) -> Response:
+    start = time.perf_counter()
+    body = await request.json()
+    key = deps.loading_graph_memo.key(body)
+    entry = deps.loading_graph_memo.get(key)
+    result = "hit"
+    if not entry:
+
+        async def fetch():
+            token = await deps.session_less_token_manager.get_access_token()
+            return await deps.client_session.post(
+                f"{deps.configuration.assets_gateway_base_url}/cdn-backend/queries/loading-graph",
+                json=body,
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        entry, coalesced = await deps.loading_graph_memo.fetch(key, fetch)
+        result = "coalesced" if coalesced else "miss"
+
+    record_edge_cache(cache="loading_graph", result=result, start=start)
+    count_data_transferred.inc(len(entry.content))
+    return Response(
+        content=entry.content,
+        status_code=entry.status,
+        headers=cached_response_headers(entry),
     )
 
 
@@ -28,14 +71,55 @@ async def loading_graph(
 async def resource(
     rest_of_path: str,
     deps: Dependencies = Depends(dependenciesFactory),
-) -> StreamingResponse:
-    token = await deps.session_less_token_manager.get_access_token()
+) -> Response:
+    start = time.perf_counter()
 
-    return await client_response_to_streaming_response(
-        await deps.client_session.get(
+    async def fetch():
+        token = await deps.session_less_token_manager.get_access_token()
+        return await deps.client_session.get(
             f"{deps.configuration.assets_gateway_base_url}/raw/package/{rest_of_path}",
             headers={"Authorization": f"Bearer {token}"},
-        ),
+        )
+
+    key = resource_cache_key(rest_of_path)
+    if not key:
+        # Semantic versioning ranges (or 'latest') are not cached: their resolution may change.
+        response = await client_response_to_streaming_response(await fetch())
+        record_edge_cache(cache="resource", result="bypass", start=start)
+        return response
+
+    cached = deps.edge_cache.get(key)
+    result = "hit"
+    if not cached:
+        entry, coalesced = await deps.edge_cache.fetch(key, fetch)
+        gauge_edge_cache_size.set(deps.edge_cache.total_size)
+        result = "coalesced" if coalesced else "miss"
+        if not entry.path:
+            # Errors & non-cacheable responses are not cached, they are forwarded as is.
+            record_edge_cache(cache="resource", result=result, start=start)
+            return Response(
+                content=entry.content,
+                status_code=entry.status,
+                headers=cached_response_headers(entry),
+            )
+        cached = deps.edge_cache.get(key)
+        if not cached:
+            # The entry has been evicted (or its body file removed) before being opened: its content is not in
+            # memory, the resource is fetched again.
+            response = await client_response_to_streaming_response(await fetch())
+            record_edge_cache(cache="resource", result="bypass", start=start)
+            return response
+
+    entry, fp = cached
+    record_edge_cache(cache="resource", result=result, start=start)
+    count_data_transferred.inc(entry.size)
+    return StreamingResponse(
+        content=deps.edge_cache.stream(fp),
+        status_code=entry.status,
+        headers={
+            **cached_response_headers(entry),
+            "content-length": str(entry.size),
+        },
     )
 
 
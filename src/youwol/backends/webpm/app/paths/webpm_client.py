@@ -2,7 +2,6 @@
 
 # third parties
 from fastapi import Depends
-from fastapi.responses import StreamingResponse
 from starlette.responses import Response
 
 # relative
@@ -21,7 +20,7 @@ from .root import resource, router
 @router.get("/webpm-client.js")
 async def get_webpm_client_js_default_version(
     deps: Dependencies = Depends(dependenciesFactory),
-) -> StreamingResponse:
+) -> Response:
     return await get_webpm_client_js(
         deps.configuration.default_webpm_client_version, deps=deps
     )
@@ -30,7 +29,7 @@ async def get_webpm_client_js_default_version(
 @router.get("/{version}/webpm-client.js")
 async def get_webpm_client_js(
     version: str, deps: Dependencies = Depends(dependenciesFactory)
-) -> StreamingResponse:
+) -> Response:
     count_download.inc()
     count_version.inc(version)
     resource_path = f"{WEBPM_CLIENT_ASSET_ID}/{version}/{WEBPM_CLIENT_ASSET_PATH}"
@@ -40,7 +39,7 @@ async def get_webpm_client_js(
 @router.get("/webpm-client.js.map")
 async def get_webpm_client_js_map_default_version(
     deps: Dependencies = Depends(dependenciesFactory),
-) -> StreamingResponse:
+) -> Response:
     return await get_webpm_client_js_map(
         deps.configuration.default_webpm_client_version, deps
     )
@@ -49,7 +48,7 @@ async def get_webpm_client_js_map_default_version(
 @router.get("/{version}/webpm-client.js.map")
 async def get_webpm_client_js_map(
     version: str, deps: Dependencies = Depends(dependenciesFactory)
-) -> StreamingResponse:
+) -> Response:
     resource_path = (
         f"{WEBPM_CLIENT_ASSET_ID}/{version}/{WEBPM_CLIENT_ASSET_PATH_SOURCE_MAP}"
     )
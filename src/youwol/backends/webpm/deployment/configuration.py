@@ -1,5 +1,6 @@
 # standard library
 import os
+import tempfile
 
 # third parties
 from pydantic.dataclasses import dataclass
@@ -16,6 +17,9 @@ class Configuration:
     default_cdn_client_version: str
     default_webpm_client_version: str
     root_redirection: str
+    edge_cache_dir: str = os.path.join(tempfile.gettempdir(), "webpm-edge-cache")
+    edge_cache_max_size: int = 2 * 1024**3
+    loading_graph_ttl: float = 30
 
 
 class ConfigurationFactory:
@@ -54,6 +58,19 @@ class ConfigurationFactory:
                     "DEFAULT_WEBPM_CLIENT_VERSION"
                 ),
                 root_redirection=cls.__get_value_from_env("ROOT_REDIRECTION"),
+                edge_cache_dir=cls.__get_optional_value_from_env(
+                    "EDGE_CACHE_DIR", Configuration.edge_cache_dir
+                ),
+                edge_cache_max_size=int(
+                    cls.__get_optional_value_from_env(
+                        "EDGE_CACHE_MAX_SIZE", str(Configuration.edge_cache_max_size)
+                    )
+                ),
+                loading_graph_ttl=float(
+                    cls.__get_optional_value_from_env(
+                        "LOADING_GRAPH_TTL", str(Configuration.loading_graph_ttl)
+                    )
+                ),
             )
         )
 
@@ -63,3 +80,7 @@ class ConfigurationFactory:
         if v is None:
             raise ValueError(f"Missing environment value {key}")
         return v
+
+    @staticmethod
+    def __get_optional_value_from_env(key, default: str) -> str:
+        return os.environ.get(key, default)
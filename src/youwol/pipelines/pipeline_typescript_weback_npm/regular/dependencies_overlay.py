@@ -0,0 +1,189 @@
+# standard library
+import hashlib
+import json
+import os
+import shutil
+
+from pathlib import Path
+
+# third parties
+from pydantic import BaseModel
+
+# Youwol utilities
+from youwol.utils import AnyDict
+from youwol.utils.utils_paths import list_files, parse_json, write_json
+
+OVERLAY_MANIFEST = ".youwol-overlay.json"
+"""
+Name of the file, within a synchronized folder of `node_modules`, recording the state of the overlay.
+
+A folder including this file has been (at least partially) created by
+:func:`sync_overlay <youwol.pipelines.pipeline_typescript_weback_npm.regular.dependencies_overlay.sync_overlay>`:
+its files are hard links to the dependency's `dist` artifact.
+"""
+
+
+class OverlayDelta(BaseModel):
+    """
+    Changes applied by
+    :func:`sync_overlay <youwol.pipelines.pipeline_typescript_weback_npm.regular.dependencies_overlay.sync_overlay>`.
+    """
+
+    added: list[str] = []
+    """
+    Files added (relative paths).
+    """
+
+    updated: list[str] = []
+    """
+    Files updated (relative paths).
+    """
+
+    removed: list[str] = []
+    """
+    Files removed (relative paths).
+    """
+
+    unchanged: int = 0
+    """
+    Count of files unchanged.
+    """
+
+
+def package_dependencies(package_json: AnyDict) -> dict[str, str]:
+    """
+    Returns the dependencies installed along with a package (its `dependencies` & `peerDependencies`).
+
+    Parameters:
+        package_json: Content of the package's `package.json`.
+
+    Returns:
+        The dependencies, mapping name to version.
+    """
+    return {
+        **package_json.get("dependencies", {}),
+        **package_json.get("peerDependencies", {}),
+    }
+
+
+def read_overlay_manifest(destination: Path) -> AnyDict | None:
+    """
+    Parameters:
+        destination: Folder of the dependency within `node_modules`.
+
+    Returns:
+        The overlay manifest, `None` if the folder has not been synchronized.
+    """
+    try:
+        return parse_json(destination / OVERLAY_MANIFEST)
+    except (OSError, ValueError):
+        return None
+
+
+def can_overlay(source: Path, destination: Path) -> bool:
+    """
+    Whether a dependency can be synchronized using
+    :func:`sync_overlay <youwol.pipelines.pipeline_typescript_weback_npm.regular.dependencies_overlay.sync_overlay>`:
+    it has already been synchronized, and its dependencies did not change since then.
+
+    Parameters:
+        source: Folder of the dependency's `dist` artifact.
+        destination: Folder of the dependency within `node_modules`.
+
+    Returns:
+        `True` if the overlay can be used, `False` if the dependency needs to be installed.
+    """
+    manifest = read_overlay_manifest(destination)
+    if manifest is None:
+        return False
+    dependencies = package_dependencies(parse_json(source / "package.json"))
+    return manifest.get("dependencies") == dependencies
+
+
+def overlay_checksum(destination: Path) -> str | None:
+    """
+    Parameters:
+        destination: Folder of the dependency within `node_modules`.
+
+    Returns:
+        Checksum of the files synchronized, computed from the overlay manifest (files are not read).
+    """
+    manifest = read_overlay_manifest(destination)
+    if manifest is None:
+        return None
+    files = sorted((path, entry["hash"]) for path, entry in manifest["files"].items())
+    return hashlib.md5(json.dumps(files).encode()).hexdigest()
+
+
+def sync_overlay(source: Path, destination: Path) -> OverlayDelta:
+    """
+    Mirrors the `dist` artifact of a dependency into its folder within `node_modules`.
+
+    Only the files that changed since the previous synchronization (according to their hash) are updated; they
+    are hard links to the artifact's files (or copies if the link can not be created, *e.g.* across devices).
+    Files of the previous synchronization not included in the artifact anymore are removed.
+    The state of the synchronization is saved in the destination folder, in the file `OVERLAY_MANIFEST`.
+
+    This function is blocking.
+
+    Parameters:
+        source: Folder of the dependency's `dist` artifact.
+        destination: Folder of the dependency within `node_modules`.
+
+    Returns:
+        The changes applied.
+    """
+    previous = read_overlay_manifest(destination) or {}
+    previous_files: dict[str, AnyDict] = previous.get("files", {})
+    files: dict[str, AnyDict] = {}
+    delta = OverlayDelta()
+    for path in list_files(source):
+        relative = path.relative_to(source).as_posix()
+        stat = path.stat()
+        entry = previous_files.get(relative)
+        unmodified = (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime"] == stat.st_mtime_ns
+        )
+        files[relative] = {
+            "hash": entry["hash"] if entry and unmodified else file_hash(path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+        }
+        target = destination / relative
+        if entry and entry["hash"] == files[relative]["hash"] and target.exists():
+            delta.unchanged += 1
+            continue
+        link_file(source=path, destination=target)
+        (delta.updated if entry else delta.added).append(relative)
+
+    for relative in previous_files.keys() - files.keys():
+        (destination / relative).unlink(missing_ok=True)
+        delta.removed.append(relative)
+
+    write_json(
+        {
+            "dependencies": package_dependencies(parse_json(source / "package.json")),
+            "files": files,
+        },
+        destination / OVERLAY_MANIFEST,
+    )
+    return delta
+
+
+def file_hash(path: Path) -> str:
+    md5 = hashlib.md5()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(2**16), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def link_file(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
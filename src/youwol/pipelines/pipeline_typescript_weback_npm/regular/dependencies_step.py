@@ -1,9 +1,10 @@
 # standard library
-import functools
+import asyncio
+import hashlib
 import shutil
 import time
 
-from collections.abc import Mapping
+from collections.abc import Collection
 from pathlib import Path
 
 # third parties
@@ -26,13 +27,20 @@ from youwol.app.routers.projects.models_project import (
 from youwol.app.routers.projects.projects_resolver import ProjectLoader
 
 # Youwol utilities
-from youwol.utils import CommandException, execute_shell_cmd, files_check_sum, to_json
+from youwol.utils import CommandException, execute_shell_cmd, to_json
 from youwol.utils.context import Context
 from youwol.utils.utils_paths import copy_tree, list_files, write_json
 
 # Youwol pipelines
 from youwol.pipelines.pipeline_typescript_weback_npm.regular.build_step import BuildStep
 from youwol.pipelines.pipeline_typescript_weback_npm.regular.common import Paths
+from youwol.pipelines.pipeline_typescript_weback_npm.regular.dependencies_overlay import (
+    OverlayDelta,
+    can_overlay,
+    overlay_checksum,
+    read_overlay_manifest,
+    sync_overlay,
+)
 from youwol.pipelines.pipeline_typescript_weback_npm.regular.models import (
     InputDataDependency,
 )
@@ -60,7 +68,77 @@ def patch_pipeline_generated_module(
         )
 
 
-async def get_input_data(project: Project, flow_id: str, context: Context):
+dist_checksums_cache: dict[tuple[str, str, str], tuple[tuple[int, int], str | None]] = (
+    {}
+)
+"""
+Checksums of the `dist` artifacts, by (project's name, flow ID, build step ID), see
+:func:`dist_checksum <youwol.pipelines.pipeline_typescript_weback_npm.regular.dependencies_step.dist_checksum>`.
+
+Entries are associated to the modification time & size of the build manifest from which they have been computed:
+they are reused by successive status polls while the dependency is not re-built.
+"""
+
+
+def dist_checksum(
+    dependency: Project, step: BuildStep, flow_id: str, paths_book: PathsBook
+) -> str | None:
+    """
+    Returns the checksum of the `dist` artifact of a dependency, computed from the manifest written by its build
+    step (the artifact's files are not read).
+
+    Parameters:
+        dependency: The dependency.
+        step: The build step of the dependency.
+        flow_id: The flow ID.
+        paths_book: Paths book of the environment.
+
+    Returns:
+        The checksum, `None` if the build step has not been run successfully.
+    """
+    manifest_path = paths_book.artifacts_manifest(
+        project_name=dependency.name, flow_id=flow_id, step_id=step.id
+    )
+    try:
+        stat = manifest_path.stat()
+    except FileNotFoundError:
+        return None
+    key = (dependency.name, flow_id, step.id)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = dist_checksums_cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    manifest = Manifest(**parse_json(manifest_path))
+    # The artifact is created from the sources identified by the fingerprint, each time the step is run.
+    checksum = (
+        hashlib.md5(
+            f"{manifest.fingerprint}:{manifest.creationDate}".encode()
+        ).hexdigest()
+        if manifest.succeeded
+        else None
+    )
+    dist_checksums_cache[key] = (stamp, checksum)
+    return checksum
+
+
+async def get_input_data(
+    project: Project,
+    flow_id: str,
+    context: Context,
+    names: Collection[str] | None = None,
+) -> dict[str, InputDataDependency]:
+    """
+    Retrieves the dependencies of a project in the workspace which have been built successfully.
+
+    Parameters:
+        project: The project.
+        flow_id: The flow ID.
+        context: Current context.
+        names: If provided, only the dependencies with these names are retrieved.
+
+    Returns:
+        The dependencies, by name. Their files are listed on demand.
+    """
     async with context.start(action="get_input_data") as ctx:
         env = await ctx.get("env", YouwolEnvironment)
         all_projects = ProjectLoader.projects_list
@@ -89,23 +167,26 @@ async def get_input_data(project: Project, flow_id: str, context: Context):
                 ),
             )
             for d in dependencies
+            if names is None or d.name in names
         ]
-
-        def is_succeeded(p: Project, s: BuildStep):
-            manifest = p.get_manifest(flow_id=flow_id, step=s, env=env)
-            return manifest.succeeded if manifest else False
-
-        dependencies = [
+        checksums = {
+            project.name: dist_checksum(
+                dependency=project, step=step, flow_id=flow_id, paths_book=paths_book
+            )
+            for project, step in project_step
+            if step is not None
+        }
+        built = [
             (project, step)
             for project, step in project_step
-            if step is not None and is_succeeded(project, step)
+            if step is not None and checksums[project.name]
         ]
 
         await ctx.info(
             "Succeeded built dependencies in workspace retrieved",
             data={
                 "dependencies": [
-                    {"projectName": d[0].name, "stepId": d[1].id} for d in dependencies
+                    {"projectName": d[0].name, "stepId": d[1].id} for d in built
                 ]
             },
         )
@@ -114,22 +195,18 @@ async def get_input_data(project: Project, flow_id: str, context: Context):
             project.name: paths_book.artifact(
                 project.name, flow_id, step.id, step.artifacts[0].id
             )
-            for project, step in dependencies
+            for project, step in built
         }
         await ctx.info("Source of 'dist' folders retrieved", data=dist_folders)
 
-        dist_files = {name: list_files(folder) for name, folder in dist_folders.items()}
-        src_files = {p.name: list_files(p.path / "src") for p, s in dependencies}
         return {
             dependency.name: InputDataDependency(
                 project=dependency,
                 dist_folder=dist_folders[dependency.name],
                 src_folder=dependency.path / "src",
-                dist_files=dist_files[dependency.name],
-                src_files=src_files[dependency.name],
-                checksum=files_check_sum(dist_files[dependency.name]),
+                checksum=checksums[dependency.name],
             )
-            for dependency, step in dependencies
+            for dependency, _ in built
         }
 
 
@@ -188,8 +265,9 @@ class DependenciesStep(PipelineStep):
                 return PipelineStepStatus.OK
 
             await ctx.info(text="previous manifest", data=to_json(last_manifest))
-            data = await get_input_data(project=project, flow_id=flow_id, context=ctx)
-            data = {k: v for k, v in data.items() if k in to_sync}
+            data = await get_input_data(
+                project=project, flow_id=flow_id, context=ctx, names=to_sync
+            )
             prev_checksums = last_manifest.cmdOutputs["checksumsFromDist"]
 
             synced_dist_artifacts = [
@@ -217,96 +295,175 @@ class DependenciesStep(PipelineStep):
         async with context.start(
             action="run synchronization of workspace dependencies"
         ) as ctx:
+            env = await ctx.get("env", YouwolEnvironment)
             data = await get_input_data(project=project, flow_id=flow_id, context=ctx)
-            uid_suffix = (
-                f"{int(time.time())}"  # Epoch in s, used to disable yarn's cache
-            )
-            local_deps_folder = project.path / ".local-dependencies"
-            shutil.rmtree(local_deps_folder, ignore_errors=True)
-            pkg_json = parse_json(project.path / ".template" / "package.json")
             config = await get_project_configuration(
                 project_id=project.id, flow_id=flow_id, step_id=self.id, context=ctx
             )
             to_sync = config.get("synchronizedDependencies", [])
-
-            destination_folders: Mapping[str, Path] = {
-                name: project.path / "node_modules" / name for name in data.keys()
-            }
-            local_packages = []
-            for name, p in data.items():
+            node_modules = project.path / "node_modules"
+            for name in data.keys():
                 if name not in to_sync:
                     await ctx.info(text=f"keep original package {name}")
-                    continue
-                await ctx.info(
-                    text=f"sync package {name}",
-                    data={
-                        "source": p.dist_folder,
-                        "destination": destination_folders[name],
-                    },
-                )
-                node_module_path = project.path / "node_modules" / p.project.name
-                if node_module_path.exists():
-                    await ctx.info(f"Remove {p.project.name} from 'node_modules'")
-                    shutil.rmtree(node_module_path)
-
-                await ctx.info(f"Package dependency {p.project.name}")
+            selected_data = {k: v for k, v in data.items() if k in to_sync}
 
-                return_code_pack, outputs_pack = await execute_shell_cmd(
-                    cmd="npm pack", cwd=p.project.path, context=ctx
+            last_manifest = project.get_manifest(flow_id=flow_id, step=self, env=env)
+            # The 'package.json' generated by the last run is kept (only patched) if the project did not change.
+            keep_package_json = (
+                node_modules.exists()
+                and last_manifest is not None
+                and last_manifest.succeeded
+                and isinstance(last_manifest.cmdOutputs, dict)
+                and last_manifest.cmdOutputs.get("config") == config
+                and last_manifest.cmdOutputs.get("allDependencies")
+                == flatten_dependencies(project=project)
+            )
+            to_install = [
+                name
+                for name, p in selected_data.items()
+                if not keep_package_json
+                or not can_overlay(
+                    source=p.dist_folder, destination=node_modules / name
                 )
-                if return_code_pack > 0:
-                    raise CommandException(command="npm pack", outputs=outputs_pack)
-                await ctx.info(f"Successfully packaged {p.project.name}")
-                base_name = f"{p.project.name.replace('@', '').replace('/', '-')}-{p.project.version}"
-                tgz_to_name = f"{base_name}-{uid_suffix}.tgz"
-                tgz_from_name = f"{base_name}.tgz"
-                tgz_to_path = local_deps_folder.relative_to(project.path) / tgz_to_name
-                await ctx.info(
-                    f'Patch "package.json" for local package {tgz_from_name}'
+            ]
+            await ctx.info(
+                text="dependencies to install (others are synchronized using overlay)",
+                data={"toInstall": to_install, "keepPackageJson": keep_package_json},
+            )
+            outputs: list[str] = []
+            if to_install:
+                outputs = await DependenciesStep.install(
+                    project=project,
+                    data=data,
+                    to_sync=to_sync,
+                    to_install=to_install,
+                    keep_package_json=keep_package_json,
+                    context=ctx,
                 )
 
-                for k in ["dependencies", "devDependencies"]:
-                    if p.project.name in pkg_json.get(k, {}):
-                        pkg_json[k][p.project.name] = f"file:{tgz_to_path}"
-
-                resolutions = pkg_json.get("resolutions", {})
-                resolutions[p.project.name] = f"file:{tgz_to_path}"
-                pkg_json["resolutions"] = resolutions
-
-                local_deps_folder.mkdir(exist_ok=True)
-                shutil.move(
-                    src=p.project.path / tgz_from_name,
-                    dst=local_deps_folder / tgz_to_name,
+            overlays: dict[str, OverlayDelta] = {}
+            for name, p in selected_data.items():
+                overlays[name] = await asyncio.to_thread(
+                    sync_overlay, source=p.dist_folder, destination=node_modules / name
+                )
+                await ctx.info(
+                    text=f"package {name} synchronized using overlay",
+                    data={
+                        "source": p.dist_folder,
+                        "destination": node_modules / name,
+                        "delta": overlays[name],
+                    },
                 )
-                local_packages.append(tgz_to_name)
-
-            selected_data = {k: v for k, v in data.items() if k in to_sync}
-            all_files = functools.reduce(
-                lambda acc, e: acc + e.dist_files, selected_data.values(), []
-            )
-            write_json(pkg_json, project.path / "package.json")
-
-            install_cmd = f"(cd {project.path} && yarn --check-files)"
-            return_code, outputs = await execute_shell_cmd(cmd=install_cmd, context=ctx)
-            if return_code > 0:
-                raise CommandException(command=install_cmd, outputs=outputs)
 
             return {
                 "config": config,
                 "yarnInstallOutputs": outputs,
-                "syncedModulesFingerprint": files_check_sum(all_files),
+                "overlays": {
+                    name: {
+                        "added": len(delta.added),
+                        "updated": len(delta.updated),
+                        "removed": len(delta.removed),
+                        "unchanged": delta.unchanged,
+                    }
+                    for name, delta in overlays.items()
+                },
+                "syncedModulesFingerprint": hashlib.md5(
+                    "".join(sorted(d.checksum for d in selected_data.values())).encode()
+                ).hexdigest(),
                 "allDependencies": flatten_dependencies(project=project),
                 "checksumsFromDist": {name: d.checksum for name, d in data.items()},
                 "actualChecksums": {
-                    name: DependenciesStep.node_module_checksum(
-                        project=project, name=name
-                    )
-                    for name in data.keys()
+                    name: overlay_checksum(node_modules / name)
+                    for name in selected_data.keys()
                 },
             }
 
     @staticmethod
-    def node_module_checksum(project: Project, name: str) -> str | None:
-        node_module_folder = project.path / "node_modules" / name
-        files = list_files(node_module_folder)
-        return files_check_sum(files)
+    async def install(
+        project: Project,
+        data: dict[str, InputDataDependency],
+        to_sync: list[str],
+        to_install: list[str],
+        keep_package_json: bool,
+        context: Context,
+    ) -> list[str]:
+        """
+        Packs the dependencies to install, references them from the project's `package.json` and runs
+        `yarn --check-files`.
+
+        Parameters:
+            project: The project.
+            data: The dependencies in the workspace.
+            to_sync: Names of the dependencies synchronized.
+            to_install: Names of the dependencies to pack.
+            keep_package_json: If `True`, the current `package.json` is patched (the other synchronized
+                dependencies keep referencing their previous package), otherwise it is generated from the template.
+            context: Current context.
+
+        Returns:
+            The outputs of the installation.
+        """
+        uid_suffix = f"{int(time.time())}"  # Epoch in s, used to disable yarn's cache
+        local_deps_folder = project.path / ".local-dependencies"
+        if not keep_package_json:
+            shutil.rmtree(local_deps_folder, ignore_errors=True)
+        pkg_json = parse_json(
+            project.path / "package.json"
+            if keep_package_json
+            else project.path / ".template" / "package.json"
+        )
+        for name in data.keys():
+            node_module_path = project.path / "node_modules" / name
+            # Overlaid folders are hard links to the 'dist' artifacts: they must not be modified by yarn.
+            if node_module_path.exists() and (
+                name in to_sync or read_overlay_manifest(node_module_path) is not None
+            ):
+                await context.info(f"Remove {name} from 'node_modules'")
+                shutil.rmtree(node_module_path)
+
+        for name in to_install:
+            p = data[name]
+            await context.info(f"Package dependency {p.project.name}")
+
+            return_code_pack, outputs_pack = await execute_shell_cmd(
+                cmd="npm pack", cwd=p.project.path, context=context
+            )
+            if return_code_pack > 0:
+                raise CommandException(command="npm pack", outputs=outputs_pack)
+            await context.info(f"Successfully packaged {p.project.name}")
+            base_name = f"{p.project.name.replace('@', '').replace('/', '-')}-{p.project.version}"
+            tgz_to_name = f"{base_name}-{uid_suffix}.tgz"
+            tgz_from_name = f"{base_name}.tgz"
+            tgz_to_path = local_deps_folder.relative_to(project.path) / tgz_to_name
+            await context.info(
+                f'Patch "package.json" for local package {tgz_from_name}'
+            )
+
+            for k in ["dependencies", "devDependencies"]:
+                if p.project.name in pkg_json.get(k, {}):
+                    pkg_json[k][p.project.name] = f"file:{tgz_to_path}"
+
+            resolutions = pkg_json.get("resolutions", {})
+            resolutions[p.project.name] = f"file:{tgz_to_path}"
+            pkg_json["resolutions"] = resolutions
+
+            local_deps_folder.mkdir(exist_ok=True)
+            shutil.move(
+                src=p.project.path / tgz_from_name,
+                dst=local_deps_folder / tgz_to_name,
+            )
+
+        write_json(pkg_json, project.path / "package.json")
+        referenced = {
+            Path(version.removeprefix("file:")).name
+            for version in pkg_json.get("resolutions", {}).values()
+        }
+        for tgz in list_files(local_deps_folder, rec=False):
+            if tgz.name not in referenced:
+                tgz.unlink()
+
+        install_cmd = f"(cd {project.path} && yarn --check-files)"
+        return_code, outputs = await execute_shell_cmd(cmd=install_cmd, context=context)
+        if return_code > 0:
+            raise CommandException(command=install_cmd, outputs=outputs)
+        return outputs
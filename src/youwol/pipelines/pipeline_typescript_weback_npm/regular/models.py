@@ -7,11 +7,26 @@ from pydantic import BaseModel
 # Youwol application
 from youwol.app.routers.projects.models_project import Project
 
+# Youwol utilities
+from youwol.utils.utils_paths import list_files
+
 
 class InputDataDependency(BaseModel):
     project: Project
     dist_folder: Path
     src_folder: Path
-    dist_files: list[Path]
-    src_files: list[Path]
     checksum: str
+
+    def dist_files(self) -> list[Path]:
+        """
+        Returns:
+            The files of the `dist` artifact, listed on call.
+        """
+        return list_files(self.dist_folder)
+
+    def src_files(self) -> list[Path]:
+        """
+        Returns:
+            The files of the `src` folder, listed on call.
+        """
+        return list_files(self.src_folder)
@@ -5,8 +5,11 @@ This module defines helping utilities for working with youwol.
 
 # relative
 from .clients import *
+from .coalescer import *
 from .context import *
 from .exceptions import *
+from .reverse_proxy import *
+from .streaming_zip import *
 from .types import *
 from .utils import *
 from .utils_helm import *
@@ -6,6 +6,9 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
+# typing
+from typing import BinaryIO
+
 # third parties
 from aiohttp import FormData
 
@@ -163,10 +166,12 @@ class CdnClient:
             **kwargs,
         )
 
-    async def publish(self, zip_content: bytes, **kwargs):
+    async def publish(self, zip_content: bytes | BinaryIO, **kwargs):
         """
         See description in
         :func:`cdn.publish_library <youwol.backends.cdn.root_paths.publish_library>`.
+
+        A file object provided as `zip_content` is streamed.
         """
         form_data = FormData()
         form_data.add_field(
@@ -1,4 +1,8 @@
 # standard library
+import asyncio
+import functools
+
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -154,6 +158,11 @@ class DocDbClient:
     Secondary indexes pf the table.
     """
 
+    batch_parallelism: int = 32
+    """
+    Maximum count of concurrent requests when updating or deleting a batch of documents.
+    """
+
     async def get_upstsream_exception(self, resp: ClientResponse, **kwargs):
         params = {
             "url_base": self.url_base,
@@ -523,6 +532,63 @@ class DocDbClient:
                     doc=doc,
                 )
 
+    async def update_documents(
+        self, docs: list[AnyDict], owner: str | None, **kwargs: Any
+    ) -> JSON:
+        """
+        Update (or create) a batch of documents in the database, at most
+        :attr:`batch_parallelism <youwol.utils.clients.docdb.docdb.DocDbClient.batch_parallelism>` requests
+        are executed concurrently.
+
+        Parameters:
+            docs: Updated documents.
+            owner: The owner of the documents. Please provide always `youwol-users`.
+            kwargs:  keywords arg. forwarded to internal calls.
+
+        Returns:
+            Empty JSON object.
+        """
+        await self.__batch(
+            [
+                functools.partial(self.update_document, doc=doc, owner=owner, **kwargs)
+                for doc in docs
+            ]
+        )
+        return {}
+
+    async def delete_documents(
+        self, docs: list[dict[str, Any]], owner: str | None, **kwargs: Any
+    ) -> JSON:
+        """
+        Delete a batch of documents from the database, at most
+        :attr:`batch_parallelism <youwol.utils.clients.docdb.docdb.DocDbClient.batch_parallelism>` requests
+        are executed concurrently.
+
+        Parameters:
+            docs: Primary keys of the documents.
+            owner: The owner of the documents. Please provide always `youwol-users`.
+            kwargs:  keywords arg. forwarded to internal calls.
+
+        Returns:
+            Empty JSON object.
+        """
+        await self.__batch(
+            [
+                functools.partial(self.delete_document, doc=doc, owner=owner, **kwargs)
+                for doc in docs
+            ]
+        )
+        return {}
+
+    async def __batch(self, requests: list[Callable[[], Awaitable[Any]]]):
+        semaphore = asyncio.Semaphore(self.batch_parallelism)
+
+        async def run(request: Callable[[], Awaitable[Any]]):
+            async with semaphore:
+                await request()
+
+        await asyncio.gather(*[run(request) for request in requests])
+
     def get_primary_key_query_parameters(self, doc: dict[str, Any]):
         if (
             len(self.table_body.partition_key) == 1
@@ -80,6 +80,21 @@ class LocalDocDbClient(DigestExclude):
     data: Any = field(default_factory=lambda: {"documents": []})
     secondary_indexes: list[SecondaryIndex] = field(default_factory=lambda: [])
 
+    __indexes: dict[str, dict[Any, list[AnyDict]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """
+    Documents by value, for the columns of the secondary indexes; built on first use, reset when the data are
+    persisted or when the list of documents is replaced or resized without persisting (*e.g.* by a hard reset).
+    """
+
+    __indexed: list[Any] = field(
+        default_factory=lambda: [None, 0], init=False, repr=False, compare=False
+    )
+    """
+    List of documents from which the indexes are built, and its length at that time.
+    """
+
     @property
     def table_name(self):
         return self.table_body.name
@@ -111,6 +126,42 @@ class LocalDocDbClient(DigestExclude):
             + [[k, doc[k]] for k in self.table_body.clustering_columns]
         )
 
+    def index_lookup(self, column: str, value: Any) -> list[AnyDict]:
+        """
+        Retrieves the documents with a given value for a column of a secondary index, without scanning the
+        documents (except when the index is built, on first use after a modification of the data).
+
+        Documents for which the value of the column is not a string are always included.
+
+        Parameters:
+            column: Name of the column, usually the column of a secondary index or of the partition key.
+            value: The value.
+
+        Returns:
+            The documents, in the order of the table.
+        """
+        documents = self.data["documents"]
+        indexed_documents, indexed_count = self.__indexed
+        if indexed_documents is not documents or indexed_count != len(documents):
+            self.__indexes.clear()
+            self.__indexed[:] = [documents, len(documents)]
+        if column not in self.__indexes:
+            index: dict[Any, list[AnyDict]] = {}
+            for doc in documents:
+                key = doc.get(column)
+                index.setdefault(key if isinstance(key, str) else None, []).append(doc)
+            self.__indexes[column] = index
+        index = self.__indexes[column]
+        if value is None:
+            return index.get(None, [])
+        unindexed = index.get(None, [])
+        matching = index.get(value, [])
+        if not unindexed:
+            return matching
+        # Keep the order of the table.
+        ids = {id(doc) for doc in unindexed + matching}
+        return [doc for doc in documents if id(doc) in ids]
+
     async def delete_table(self, **_kwargs: Any) -> None:
         """
         Delete the table and its data.
@@ -227,7 +278,24 @@ class LocalDocDbClient(DigestExclude):
                     return False
             return True
 
-        documents = self.data["documents"]
+        indexed_columns = {
+            index.identifier.column_name for index in self.secondary_indexes
+        }
+        indexed_clause = next(
+            (
+                clause
+                for clause in typed_query_body.query.where_clause
+                if clause.relation == "eq"
+                and clause.column in indexed_columns
+                and isinstance(clause.term, str)
+            ),
+            None,
+        )
+        documents = (
+            self.index_lookup(column=indexed_clause.column, value=indexed_clause.term)
+            if indexed_clause
+            else self.data["documents"]
+        )
         r = [doc for doc in documents if is_matching(doc)]
 
         query_ordering = {
@@ -309,6 +377,44 @@ class LocalDocDbClient(DigestExclude):
             self.__persist()
         return {}
 
+    async def update_documents(
+        self,
+        docs: list[AnyDict],
+        owner: str | None = None,
+        headers: dict[str, str] | None = None,
+        **_kwargs: Any,
+    ) -> JSON:
+        """
+        Update (or create) a batch of documents in the database, the data are persisted once.
+
+        Parameters:
+            docs: The documents to update.
+            owner: Deprecated: do not provide.
+            headers: Deprecated: do not provide.
+            _kwargs: Additional keyword arguments.
+
+        Returns:
+            Empty JSON object
+        """
+        if not headers:
+            headers = {}
+        if not owner:
+            owner = get_default_owner(headers)
+
+        with self.__lock:
+            documents = self.data["documents"]
+            indexes = {self.primary_key_id(d): i for i, d in enumerate(documents)}
+            for doc in docs:
+                doc["owner"] = owner
+                key = self.primary_key_id(doc)
+                if key in indexes:
+                    documents[indexes[key]] = doc
+                else:
+                    indexes[key] = len(documents)
+                    documents.append(doc)
+            self.__persist()
+        return {}
+
     async def delete_document(
         self,
         doc: dict[str, Any],
@@ -348,8 +454,43 @@ class LocalDocDbClient(DigestExclude):
             self.__persist()
         return {}
 
+    async def delete_documents(
+        self,
+        docs: list[dict[str, Any]],
+        owner: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        **_kwargs: Any,
+    ) -> JSON:
+        """
+        Delete a batch of documents from the database, the data are persisted once.
+
+        Parameters:
+            docs: Primary keys of the documents.
+            owner: Deprecated: do not provide.
+            headers: Deprecated: do not provide.
+            _kwargs: Additional keyword arguments.
+
+        Returns:
+            Empty JSON object.
+        """
+        if not headers:
+            headers = {}
+        if not owner:
+            owner = get_default_owner(headers)
+
+        keys = {self.primary_key_id(doc) for doc in docs}
+        with self.__lock:
+            self.data["documents"] = [
+                d
+                for d in self.data["documents"]
+                if self.primary_key_id(d) not in keys or d["owner"] != owner
+            ]
+            self.__persist()
+        return {}
+
     def __persist(self):
         # should be called within a mutex section
+        self.__indexes.clear()
         self.data_path.write_text(data=json.dumps(self.data, indent=4))
 
     def reset(self) -> None:
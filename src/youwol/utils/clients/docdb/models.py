@@ -156,7 +156,10 @@ class WhereClause(BaseModel):
             "geq": lambda _value, _target: value >= target,
         }
         target = self.term
-        value = doc[self.column]
+        value = doc.get(self.column)
+        if value is None:
+            # Like in scyllaDB, null (or missing) values never match.
+            return False
         if isinstance(value, (float, int)):
             target = float(target)
         return factory_clauses[self.relation](value, target)
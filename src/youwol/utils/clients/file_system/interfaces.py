@@ -1,16 +1,25 @@
 # standard library
+import hashlib
 import io
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 
+# typing
+from typing import BinaryIO
+
 # third parties
 from pydantic import BaseModel
 
 # Youwol utilities
 from youwol.utils.types import AnyDict
 
+DEFAULT_CHUNK_SIZE = 2**16
+"""
+Default size of the chunks when streaming objects' content.
+"""
+
 
 @dataclass(frozen=True)
 class FileObject:
@@ -50,6 +59,37 @@ class Metadata(BaseModel):
     """
 
 
+class DigestReader(io.RawIOBase):
+    """
+    Reader over a binary stream, the size & SHA-256 digest of the content are computed as it is read (*e.g.* they
+    are stored in the metadata by :class:`LocalFileSystem
+    <youwol.utils.clients.file_system.local_file_system.LocalFileSystem>`).
+    """
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self.stream = stream
+        self.size = 0
+        self.__hash = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        self.size += len(chunk)
+        self.__hash.update(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def hexdigest(self) -> str:
+        return self.__hash.hexdigest()
+
+
 class FileSystemInterface(ABC):
     """
     Abstract class defining methods for interacting with a file system.
@@ -68,7 +108,7 @@ class FileSystemInterface(ABC):
     async def put_object(
         self,
         object_id: str,
-        data: io.BytesIO,
+        data: io.BytesIO | BinaryIO,
         object_name: str,
         content_type: str,
         content_encoding: str,
@@ -79,7 +119,7 @@ class FileSystemInterface(ABC):
 
         Parameters:
             object_id: UID of the object
-            data: Content of the object
+            data: Content of the object, it is read by chunks if not a `BytesIO`
             object_name: name of the object
             content_type: MIME type of the content,
             content_encoding: Encoding of the content.
@@ -96,7 +136,11 @@ class FileSystemInterface(ABC):
             object_id: Unique identifier for the object.
             kwargs: Additional keyword arguments.
         Returns:
-            Metadata and information about the object.
+            Metadata and information about the object:
+            *  `metadata`: the :class:`Metadata <youwol.utils.clients.file_system.interfaces.Metadata>` as dict.
+            *  `etag`: an opaque tag identifying the content of the stored object.
+            *  `lastModified`: last modification time (EPOCH) of the stored object.
+            *  `size`: size in bytes of the stored object.
         """
         raise NotImplementedError
 
@@ -126,10 +170,8 @@ class FileSystemInterface(ABC):
 
         Parameters:
             object_id: Unique identifier for the object.
-            ranges_bytes: List of byte ranges to retrieve.
-
-                Warning:
-                    Only one range is supported.
+            ranges_bytes: List of byte ranges to retrieve (bounds included), the contents of the ranges are
+                concatenated.
             kwargs: Additional keyword arguments.
 
         Returns:
@@ -137,6 +179,36 @@ class FileSystemInterface(ABC):
         """
         raise NotImplementedError
 
+    async def stream_object(
+        self,
+        object_id: str,
+        ranges_bytes: list[tuple[int, int]] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: AnyDict,
+    ) -> AsyncIterator[bytes]:
+        """
+        Retrieve the content of a specific object by chunks, *e.g.* to be used as content of a
+        `StreamingResponse`.
+
+        The default implementation splits the content retrieved using
+        :func:`get_object <youwol.utils.clients.file_system.interfaces.FileSystemInterface.get_object>`.
+
+        Parameters:
+            object_id: Unique identifier for the object.
+            ranges_bytes: List of byte ranges to retrieve (bounds included), the contents of the ranges are
+                concatenated.
+            chunk_size: Maximum size of the chunks.
+            kwargs: Additional keyword arguments.
+
+        Returns:
+            Asynchronous iterator over the chunks of the content.
+        """
+        content = await self.get_object(
+            object_id=object_id, ranges_bytes=ranges_bytes, **kwargs
+        )
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def remove_object(self, object_id: str, **kwargs: AnyDict) -> None:
         """
@@ -1,27 +1,41 @@
 # standard library
+import asyncio
 import glob
+import hashlib
 import io
 import os
 import shutil
+import uuid
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 
 # typing
-from typing import cast
+from typing import BinaryIO, cast
 
 # third parties
 from fastapi import HTTPException
 
 # Youwol utilities
 from youwol.utils.clients.file_system.interfaces import (
+    DEFAULT_CHUNK_SIZE,
+    DigestReader,
     FileObject,
     FileSystemInterface,
     Metadata,
 )
+from youwol.utils.types import AnyDict
 from youwol.utils.utils_paths import parse_json, write_json
 
 
+def read_metadata(path: Path) -> AnyDict:
+    try:
+        return parse_json(path)
+    except FileNotFoundError:
+        return {}
+
+
 def create_dir_if_needed(full_path: Path):
     dir_path = full_path.parent
     if not dir_path.exists():
@@ -46,10 +60,13 @@ class LocalFileSystem(FileSystemInterface):
         #  Nothing to do here, the folder will be created on first object creation if needed
         pass
 
+    def get_metadata_path(self, object_id: str) -> Path:
+        return self.get_full_path(f"{object_id}.metadata.json")
+
     async def put_object(
         self,
         object_id: str,
-        data: io.BytesIO,
+        data: io.BytesIO | BinaryIO,
         object_name: str,
         content_type: str,
         content_encoding: str,
@@ -57,31 +74,79 @@ class LocalFileSystem(FileSystemInterface):
     ):
         path = self.get_full_path(object_id)
         create_dir_if_needed(path)
-        content = data.read()
-        path.open("wb").write(content)
-        metadata = {
-            "fileName": object_name,
-            "contentType": content_type,
-            "contentEncoding": content_encoding,
-        }
-        path_metadata = self.get_full_path(f"{object_id}.metadata.json")
-        write_json(metadata, path_metadata)
+        path_metadata = self.get_metadata_path(object_id)
+        # The content is written in a (hidden) file of unique name referenced by the metadata (`blob`), along with its
+        # size & digest computed while streaming: moving the metadata file in place commits both at once.
+        # The content is then linked at the object's path, for the consumers reading the folder directly.
+        token = uuid.uuid4().hex
+        blob = f".{path.name}.{token}.blob"
+        tmp_path = path.parent / f".{path.name}.{token}.tmp"
+        tmp_path_metadata = path.parent / f".{path_metadata.name}.{token}.tmp"
+        reader = data if isinstance(data, DigestReader) else DigestReader(data)
+
+        def write():
+            previous = read_metadata(path_metadata).get("blob")
+            try:
+                with (path.parent / blob).open("wb") as fp:
+                    shutil.copyfileobj(reader, fp, DEFAULT_CHUNK_SIZE)
+                write_json(
+                    {
+                        "fileName": object_name,
+                        "contentType": content_type,
+                        "contentEncoding": content_encoding,
+                        "size": reader.size,
+                        "sha256": reader.hexdigest(),
+                        "blob": blob,
+                    },
+                    tmp_path_metadata,
+                )
+                os.replace(tmp_path_metadata, path_metadata)
+            except BaseException:
+                (path.parent / blob).unlink(missing_ok=True)
+                raise
+            try:
+                os.link(path.parent / blob, tmp_path)
+            except OSError:
+                shutil.copyfile(path.parent / blob, tmp_path)
+            os.replace(tmp_path, path)
+            if previous and previous != blob:
+                (path.parent / previous).unlink(missing_ok=True)
+
+        try:
+            await asyncio.to_thread(write)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+            tmp_path_metadata.unlink(missing_ok=True)
 
     async def get_info(self, object_id: str, **kwargs):
-        self.ensure_object_exist(object_id)
-        path_metadata = self.get_full_path(f"{object_id}.metadata.json")
-        if not path_metadata.exists():
-            return {"metadata": {}}
-        metadata = parse_json(path_metadata)
-        return {"metadata": metadata}
+        with self.open_object(object_id) as fp:
+            stat = os.fstat(fp.fileno())
+        validators = {
+            "etag": hashlib.md5(f"{stat.st_mtime}-{stat.st_size}".encode()).hexdigest(),
+            "lastModified": stat.st_mtime,
+            "size": stat.st_size,
+        }
+        metadata = read_metadata(self.get_metadata_path(object_id))
+        metadata.pop("blob", None)
+        return {"metadata": metadata, **validators}
 
     async def set_metadata(self, object_id: str, metadata: Metadata, **kwargs):
-        info = await self.get_info(object_id=object_id)
-        path_metadata = self.get_full_path(f"{object_id}.metadata.json")
-        write_json(
-            {**info["metadata"], **{k: v for k, v in metadata.dict().items() if v}},
-            path_metadata,
+        self.ensure_object_exist(object_id)
+        path_metadata = self.get_metadata_path(object_id)
+        tmp_path_metadata = (
+            path_metadata.parent / f".{path_metadata.name}.{uuid.uuid4().hex}.tmp"
         )
+        try:
+            write_json(
+                {
+                    **read_metadata(path_metadata),
+                    **{k: v for k, v in metadata.dict().items() if v},
+                },
+                tmp_path_metadata,
+            )
+            os.replace(tmp_path_metadata, path_metadata)
+        finally:
+            tmp_path_metadata.unlink(missing_ok=True)
 
     async def get_object(
         self,
@@ -89,29 +154,61 @@ class LocalFileSystem(FileSystemInterface):
         ranges_bytes: list[tuple[int, int]] | None = None,
         **kwargs,
     ):
-        path = self.ensure_object_exist(object_id)
-        if not path.exists():
-            raise HTTPException(
-                status_code=404,
-                detail=f"LocalFileSystem.get_object: Object '{path}' not found",
-            )
-
-        if not ranges_bytes:
-            return path.read_bytes()
-        acc = b""
-        with open(path, "rb") as fp:
+        with self.open_object(object_id) as fp:
+            if not ranges_bytes:
+                return fp.read()
+            acc = b""
             for range_byte in ranges_bytes:
                 fp.seek(range_byte[0], 0)
                 acc += fp.read(range_byte[1] - range_byte[0] + 1)
-        return acc
+            return acc
+
+    async def stream_object(
+        self,
+        object_id: str,
+        ranges_bytes: list[tuple[int, int]] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        with self.open_object(object_id) as fp:
+            size = os.fstat(fp.fileno()).st_size
+            for start, end in ranges_bytes or [(0, size - 1)]:
+                fp.seek(start, 0)
+                remaining = end - start + 1
+                while remaining > 0 and (chunk := fp.read(min(chunk_size, remaining))):
+                    remaining -= len(chunk)
+                    yield chunk
 
     async def remove_object(self, object_id: str, **kwargs):
         path = self.ensure_object_exist(object_id)
+        path_metadata = self.get_metadata_path(object_id)
+        blob = read_metadata(path_metadata).get("blob")
 
         os.remove(path)
-        path_metadata = self.get_full_path(f"{object_id}.metadata.json")
-        if path_metadata.exists():
-            os.remove(path_metadata)
+        path_metadata.unlink(missing_ok=True)
+        if blob:
+            (path.parent / blob).unlink(missing_ok=True)
+
+    def open_object(self, object_id: str) -> BinaryIO:
+        """
+        Opens the content of an object: the one committed with its metadata, see
+        :meth:`put_object <youwol.utils.clients.file_system.local_file_system.LocalFileSystem.put_object>`.
+
+        Parameters:
+            object_id: Object's ID.
+
+        Returns:
+            The file opened in binary read mode.
+        """
+        path = self.ensure_object_exist(object_id)
+        blob = read_metadata(self.get_metadata_path(object_id)).get("blob")
+        if blob:
+            try:
+                return (path.parent / blob).open("rb")
+            except FileNotFoundError:
+                # Replaced meanwhile (or object written before contents were referenced by the metadata).
+                pass
+        return path.open("rb")
 
     async def remove_folder(self, prefix: str, raise_not_found, **kwargs):
         path = self.get_full_path(prefix)
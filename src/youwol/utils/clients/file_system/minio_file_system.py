@@ -1,9 +1,16 @@
 # standard library
+import asyncio
+import functools
 import io
 
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+# typing
+from typing import Any, BinaryIO, TypeVar
+
 # third parties
 from minio import Minio, S3Error
 from minio.commonconfig import REPLACE, CopySource
@@ -11,18 +18,30 @@ from minio.deleteobjects import DeleteObject
 
 # Youwol utilities
 from youwol.utils.clients.file_system.interfaces import (
+    DEFAULT_CHUNK_SIZE,
     FileObject,
     FileSystemInterface,
     Metadata,
 )
 from youwol.utils.exceptions import ResourcesNotFoundException, ServerError
 
+_T = TypeVar("_T")
+
+minio_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="minio")
+"""
+Default thread pool in which the (synchronous) calls to the Minio client are executed.
+"""
+
 
 @dataclass(frozen=True)
 class MinioFileSystem(FileSystemInterface):
     """
     Implementation of storage for remote usage (connected to a [Minio](https://min.io/ S3 service).
     client.
+
+    The Minio client is synchronous: its calls are executed in the bounded thread pool
+    :attr:`executor <youwol.utils.clients.file_system.minio_file_system.MinioFileSystem.executor>`
+    to not block the event loop.
     """
 
     client: Minio
@@ -37,6 +56,15 @@ class MinioFileSystem(FileSystemInterface):
     """
     Reference path (in the bucket) of all operations in this class.
     """
+    executor: Executor = minio_executor
+    """
+    Executor of the calls to the Minio client.
+    """
+    part_size: int = 16 * 1024 * 1024
+    """
+    Size of the parts when uploading objects (multipart upload is used for objects larger than this size, or with
+    unknown length); it can not be lower than 5MiB.
+    """
 
     metadata_keys = {
         "x-amz-meta-contentencoding": "contentEncoding",
@@ -45,12 +73,12 @@ class MinioFileSystem(FileSystemInterface):
     }
 
     async def ensure_bucket(self):
-        if not self.client.bucket_exists(bucket_name=self.bucket_name):
-            self.client.make_bucket(self.bucket_name)
+        if not await self._run(self.client.bucket_exists, bucket_name=self.bucket_name):
+            await self._run(self.client.make_bucket, self.bucket_name)
 
     async def list_buckets(self):
         try:
-            return self.client.list_buckets()
+            return await self._run(self.client.list_buckets)
         except S3Error as e:
             raise ServerError(
                 status_code=500, detail=f"MinioFileSystem.list_buckets: {e.message}"
@@ -59,7 +87,7 @@ class MinioFileSystem(FileSystemInterface):
     async def put_object(
         self,
         object_id: str,
-        data: io.BytesIO,
+        data: io.BytesIO | BinaryIO,
         object_name: str,
         content_type: str,
         content_encoding: str,
@@ -74,14 +102,17 @@ class MinioFileSystem(FileSystemInterface):
         }
 
         try:
-            length = data.getbuffer().nbytes if length == -1 else length
-            return self.client.put_object(
+            if length == -1 and isinstance(data, io.BytesIO):
+                length = data.getbuffer().nbytes
+            return await self._run(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_path,
                 data=data,
                 length=length,
                 metadata=metadata,
                 content_type=content_type,
+                part_size=self.part_size,
             )
         except S3Error as e:
             raise ServerError(
@@ -91,13 +122,20 @@ class MinioFileSystem(FileSystemInterface):
     async def get_info(self, object_id: str, **kwargs):
         object_id = self.get_object_path(object_id)
         try:
-            stat = self.client.stat_object(self.bucket_name, object_name=object_id)
+            stat = await self._run(
+                self.client.stat_object, self.bucket_name, object_name=object_id
+            )
             return {
                 "metadata": {
                     v: stat.metadata[k]
                     for k, v in self.metadata_keys.items()
                     if k in stat.metadata
-                }
+                },
+                "etag": stat.etag,
+                "lastModified": (
+                    stat.last_modified.timestamp() if stat.last_modified else None
+                ),
+                "size": stat.size,
             }
         except S3Error as e:
             raise ResourcesNotFoundException(
@@ -110,7 +148,8 @@ class MinioFileSystem(FileSystemInterface):
         try:
             info = await self.get_info(object_id=object_id)
 
-            response = self.client.copy_object(
+            response = await self._run(
+                self.client.copy_object,
                 bucket_name=self.bucket_name,
                 object_name=object_id,
                 source=CopySource(self.bucket_name, object_id),
@@ -134,37 +173,70 @@ class MinioFileSystem(FileSystemInterface):
         **kwargs,
     ):
         object_id = self.get_object_path(object_id)
-        if ranges_bytes and len(ranges_bytes) > 1:
-            raise RuntimeError(
-                "Minio file system does not support multiple ranges bytes"
-            )
 
-        try:
-            if ranges_bytes:
-                first_range = ranges_bytes[0]
-                response = self.client.get_object(
-                    bucket_name=self.bucket_name,
-                    object_name=object_id,
-                    offset=first_range[0],
-                    length=first_range[1] - first_range[0] + 1,
-                )
+        def read(offset: int, length: int) -> bytes:
+            response = self.client.get_object(
+                bucket_name=self.bucket_name,
+                object_name=object_id,
+                offset=offset,
+                length=length,
+            )
+            try:
                 return response.read()
+            finally:
+                response.close()
+                response.release_conn()
 
-            response = self.client.get_object(
-                bucket_name=self.bucket_name, object_name=object_id
+        try:
+            contents = await asyncio.gather(
+                *[
+                    self._run(read, offset, length)
+                    for offset, length in self._offsets(ranges_bytes)
+                ]
             )
-            return response.read()
+            return b"".join(contents)
         except S3Error as e:
             raise ResourcesNotFoundException(
                 path=f"{self.bucket_name}:{object_id}",
                 detail=f"MinioFileSystem.get_object: {e.message}",
             ) from e
 
+    async def stream_object(
+        self,
+        object_id: str,
+        ranges_bytes: list[tuple[int, int]] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        object_id = self.get_object_path(object_id)
+        for offset, length in self._offsets(ranges_bytes):
+            try:
+                response = await self._run(
+                    self.client.get_object,
+                    bucket_name=self.bucket_name,
+                    object_name=object_id,
+                    offset=offset,
+                    length=length,
+                )
+            except S3Error as e:
+                raise ResourcesNotFoundException(
+                    path=f"{self.bucket_name}:{object_id}",
+                    detail=f"MinioFileSystem.stream_object: {e.message}",
+                ) from e
+            try:
+                while chunk := await self._run(response.read, chunk_size):
+                    yield chunk
+            finally:
+                response.close()
+                response.release_conn()
+
     async def remove_object(self, object_id: str, **kwargs):
         object_id = self.get_object_path(object_id)
         try:
-            self.client.remove_object(
-                bucket_name=self.bucket_name, object_name=object_id
+            await self._run(
+                self.client.remove_object,
+                bucket_name=self.bucket_name,
+                object_name=object_id,
             )
         except S3Error as e:
             raise ServerError(
@@ -173,23 +245,28 @@ class MinioFileSystem(FileSystemInterface):
 
     async def remove_folder(self, prefix: str, raise_not_found: bool, **kwargs):
         prefix = self.get_object_path(prefix)
-        try:
-            delete_object_list = map(
-                lambda x: DeleteObject(x.object_name),
-                self.client.list_objects(
+
+        def remove():
+            delete_object_list = [
+                DeleteObject(o.object_name)
+                for o in self.client.list_objects(
                     bucket_name=self.bucket_name, prefix=prefix, recursive=True
-                ),
-            )
+                )
+            ]
             if raise_not_found and not delete_object_list:
                 raise ResourcesNotFoundException(
                     path=f"{self.bucket_name}:{prefix}",
                     detail="MinioFileSystem.remove_folder",
                 )
-
-            response = self.client.remove_objects(
-                bucket_name=self.bucket_name, delete_object_list=delete_object_list
+            # The deletion is lazy: it happens while iterating over the errors.
+            return list(
+                self.client.remove_objects(
+                    bucket_name=self.bucket_name, delete_object_list=delete_object_list
+                )
             )
-            return response
+
+        try:
+            return await self._run(remove)
         except S3Error as e:
             raise ServerError(
                 status_code=500, detail=f"MinioFileSystem.remove_folder: {e.message}"
@@ -199,9 +276,26 @@ class MinioFileSystem(FileSystemInterface):
         return f"{str(self.root_path).strip('/')}/{object_id}"
 
     async def list_objects(self, prefix: str, recursive: bool, **kwargs):
+        objects = await self._run(
+            lambda: list(
+                self.client.list_objects(
+                    bucket_name=self.bucket_name, prefix=prefix, recursive=recursive
+                )
+            )
+        )
         return (
             FileObject(bucket_name=o.bucket_name, object_id=o.object_name)
-            for o in self.client.list_objects(
-                bucket_name=self.bucket_name, prefix=prefix, recursive=recursive
-            )
+            for o in objects
         )
+
+    async def _run(self, fct: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, functools.partial(fct, *args, **kwargs)
+        )
+
+    @staticmethod
+    def _offsets(ranges_bytes: list[tuple[int, int]] | None) -> list[tuple[int, int]]:
+        # Minio's convention: a length of 0 means 'up to the end of the object'.
+        if not ranges_bytes:
+            return [(0, 0)]
+        return [(start, end - start + 1) for start, end in ranges_bytes]
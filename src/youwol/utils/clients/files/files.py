@@ -77,7 +77,7 @@ class FilesClient:
         url = f"{self.url_base}/files/{file_id}"
 
         async def _reader(resp):
-            if resp.status == 200:
+            if resp.status in [200, 304]:
                 if reader:
                     return await reader(resp)
                 return await resp.read()
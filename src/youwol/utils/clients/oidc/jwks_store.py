@@ -0,0 +1,153 @@
+# standard library
+import asyncio
+import time
+
+# typing
+from typing import Any
+
+# third parties
+import aiohttp
+import jwt
+
+from jwt import (
+    PyJWK,
+    PyJWKClientConnectionError,
+    PyJWKClientError,
+    PyJWKSet,
+    PyJWKSetError,
+)
+
+# Youwol utilities
+from youwol.utils.coalescer import Coalescer
+
+
+class JwksStore:
+    """
+    Asynchronous store of the JSON Web Keys published by an authorization server, indexed by key ID (`kid`).
+
+    Keys are fetched without blocking the event loop:
+    *  when older than `refresh_interval`, they are refreshed in the background while the known keys are served.
+    *  when a token references an unknown key (*e.g.* after a keys rotation), they are re-fetched, at most once
+    every `min_refetch_interval` seconds.
+    Concurrent fetches are executed once.
+    """
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        refresh_interval: float = 3600,
+        min_refetch_interval: float = 30,
+        timeout: float = 30,
+    ):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            jwks_uri: URL of the JSON Web Key Set.
+            refresh_interval: Duration (in seconds) after which the keys are refreshed in the background.
+            min_refetch_interval: Minimum duration (in seconds) between two fetches triggered by unknown keys.
+            timeout: Timeout (in seconds) of the request fetching the keys.
+        """
+        self.jwks_uri = jwks_uri
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+        self.__keys: dict[str, PyJWK] = {}
+        self.__fetched_at: float | None = None
+        self.__fetches: Coalescer[None] = Coalescer()
+
+    async def get_signing_key(self, kid: str) -> PyJWK:
+        """
+        Retrieves a signing key.
+
+        Parameters:
+            kid: ID of the key.
+
+        Returns:
+            The key.
+
+        Raises:
+            PyJWKClientError: If the key is not found.
+        """
+        key = self.__keys.get(kid)
+        if key:
+            if self.__elapsed() > self.refresh_interval:
+                self.__fetch_keys()
+            return key
+
+        if self.__fetched_at is None or self.__elapsed() > self.min_refetch_interval:
+            await asyncio.shield(self.__fetch_keys())
+        elif self.jwks_uri in self.__fetches:
+            await asyncio.shield(self.__fetch_keys())
+
+        key = self.__keys.get(kid)
+        if not key:
+            raise PyJWKClientError(
+                f'Unable to find a signing key that matches: "{kid}"'
+            )
+        return key
+
+    async def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        """
+        Retrieves the signing key of a token.
+
+        Parameters:
+            token: The token.
+
+        Returns:
+            The key.
+
+        Raises:
+            PyJWKClientError: If the key is not found.
+        """
+        header = jwt.get_unverified_header(token)
+        kid = header.get("kid")
+        if not kid:
+            raise PyJWKClientError("The token has no 'kid' in its header")
+        return await self.get_signing_key(kid)
+
+    def __elapsed(self) -> float:
+        return time.monotonic() - (self.__fetched_at or 0)
+
+    def __fetch_keys(self) -> "asyncio.Future[None]":
+        joined = self.jwks_uri in self.__fetches
+        future = self.__fetches.start(self.jwks_uri, self.__fetch_impl)
+        if not joined:
+            future.add_done_callback(self.__fetch_done)
+        return future
+
+    @staticmethod
+    def __fetch_done(future: "asyncio.Future[None]") -> None:
+        if not future.cancelled():
+            # Failures are raised to the callers awaiting the fetch, the known keys remain in use.
+            future.exception()
+
+    async def __fetch_impl(self) -> None:
+        # The timestamp is set whatever the outcome: re-fetches remain rate-limited if the server is failing.
+        self.__fetched_at = time.monotonic()
+        try:
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as session:
+                async with session.get(self.jwks_uri) as resp:
+                    if resp.status != 200:
+                        raise PyJWKClientError(
+                            f"Fetch of JWKS at '{self.jwks_uri}' failed with status {resp.status}"
+                        )
+                    data: Any = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise PyJWKClientConnectionError(
+                f"Fetch of JWKS at '{self.jwks_uri}' failed: {type(e).__name__} {e}"
+            ) from e
+        try:
+            jwk_set = PyJWKSet.from_dict(data)
+        except PyJWKSetError as e:
+            raise PyJWKClientError(
+                f"No usable key in JWKS at '{self.jwks_uri}': {e}"
+            ) from e
+        # Like 'PyJWKClient.get_signing_keys': keys dedicated to encryption are not used to verify signatures.
+        self.__keys = {
+            key.key_id: key
+            for key in jwk_set.keys
+            if key.key_id and key.public_key_use in ("sig", None)
+        }
@@ -1,4 +1,5 @@
 # standard library
+import asyncio
 import base64
 import datetime
 import hashlib
@@ -18,6 +19,9 @@ from jwt import PyJWKClient
 from pydantic import BaseModel
 from starlette.datastructures import URL
 
+# relative
+from .jwks_store import JwksStore
+
 DEFAULT_LENGTH_RANDOM_TOKEN = 64
 EXPIRATION_THRESHOLD = 60
 
@@ -241,6 +245,20 @@ class OidcConfig:
     :meth:`jwks_client <youwol.utils.clients.oidc.oidc_config.OidcConfig.jwks_client>`
     """
 
+    _jwks_store: JwksStore | None
+    """
+    JSON Web Key Set (JWKS) store.
+    Initialized at first call of
+    :meth:`jwks_store <youwol.utils.clients.oidc.oidc_config.OidcConfig.jwks_store>`
+    """
+
+    _jwt_algos: list[str] | None
+    """
+    Supported JSON Web Token (JWT) algorithms.
+    Initialized at first call of
+    :meth:`jwt_algos <youwol.utils.clients.oidc.oidc_config.OidcConfig.jwt_algos>`
+    """
+
     def __init__(self, base_url: str):
         """
         Initialize the OidcConfig instance with the specified base URL.
@@ -250,7 +268,10 @@ class OidcConfig:
         """
         self.base_url = base_url
         self._jwks_client = None
+        self._jwks_store = None
+        self._jwt_algos = None
         self._openid_configuration = None
+        self._openid_configuration_lock = asyncio.Lock()
 
     def for_client(self, client: Client) -> "OidcForClient":
         """
@@ -268,17 +289,22 @@ class OidcConfig:
         """
         Decode a token and return its JSON representation.
 
+        The signing key is retrieved from the
+        :meth:`jwks_store <youwol.utils.clients.oidc.oidc_config.OidcConfig.jwks_store>` without blocking the event
+        loop.
+
         Args:
             token: The token to decode.
 
         Returns:
             The JSON representation of the token.
         """
-        jwks_client = await self.jwks_client()
+        jwks_store = self._jwks_store or await self.jwks_store()
+        signing_key = await jwks_store.get_signing_key_from_jwt(token)
         token_data = jwt.decode(
             jwt=token,
-            key=jwks_client.get_signing_key_from_jwt(token).key,
-            algorithms=await self.jwt_algos(),
+            key=signing_key.key,
+            algorithms=self._jwt_algos or await self.jwt_algos(),
             options={"verify_aud": False},
         )
         return token_data
@@ -290,8 +316,10 @@ class OidcConfig:
         Returns:
             A list of supported JWT algorithms.
         """
-        conf = await self.openid_configuration()
-        return conf.token_endpoint_auth_signing_alg_values_supported
+        if self._jwt_algos is None:
+            conf = await self.openid_configuration()
+            self._jwt_algos = conf.token_endpoint_auth_signing_alg_values_supported
+        return self._jwt_algos
 
     async def jwks_client(self) -> PyJWKClient:
         """
@@ -305,6 +333,19 @@ class OidcConfig:
             self._jwks_client = PyJWKClient(conf.jwks_uri)
         return self._jwks_client
 
+    async def jwks_store(self) -> JwksStore:
+        """
+        Retrieve or create the JSON Web Key Set (JWKS) store.
+
+        Returns:
+            The JWKS store.
+        """
+        if self._jwks_store is None:
+            conf = await self.openid_configuration()
+            # Concurrent callers may have created the store meanwhile.
+            self._jwks_store = self._jwks_store or JwksStore(conf.jwks_uri)
+        return self._jwks_store
+
     async def openid_configuration(self) -> OpenIdConfiguration:
         """
         Retrieve or fetch the OpenID Configuration.
@@ -313,18 +354,22 @@ class OidcConfig:
             OpenIdConfiguration: The OpenID Configuration.
 
         """
-        if self._openid_configuration is None:
-            well_known_url = (
-                f"{self.base_url.rstrip('/')}/.well-known/openid-configuration"
-            )
-            async with aiohttp.ClientSession() as session:
-                async with session.get(well_known_url) as resp:
-                    if resp.status != 200:
-                        raise RuntimeError(
-                            f"Cannot fetch OpenId configuration at well-known URL '{well_known_url}'"
-                        )
-                    json = await resp.json()
-            self._openid_configuration = OpenIdConfiguration.parse_obj(json)
+        if self._openid_configuration is not None:
+            return self._openid_configuration
+
+        async with self._openid_configuration_lock:
+            if self._openid_configuration is None:
+                well_known_url = (
+                    f"{self.base_url.rstrip('/')}/.well-known/openid-configuration"
+                )
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(well_known_url) as resp:
+                        if resp.status != 200:
+                            raise RuntimeError(
+                                f"Cannot fetch OpenId configuration at well-known URL '{well_known_url}'"
+                            )
+                        json = await resp.json()
+                self._openid_configuration = OpenIdConfiguration.parse_obj(json)
 
         return self._openid_configuration
 
@@ -1,13 +1,22 @@
 # standard library
+import asyncio
 import datetime
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+# typing
+from typing import Any, TypeVar
 
 # Youwol utilities
 from youwol.utils import AT, CacheClient
 from youwol.utils.clients.oidc.oidc_config import OidcForClient, TokensData
+from youwol.utils.clients.utils import log_error
+from youwol.utils.coalescer import Coalescer
 from youwol.utils.crypto.digest import DigestExclude
 
+_T = TypeVar("_T")
+
 
 class TokensExpiredError(RuntimeError):
     """
@@ -74,6 +83,74 @@ class TokensStorage(ABC, DigestExclude):
         """
 
 
+class TokensRefresher:
+    """
+    Coordinates the refreshes of tokens within the process:
+
+    *  Refreshes are single-flight: concurrent refreshes of the same tokens result in a single request to the
+    authorization server, all callers get its result.
+    *  Tokens are refreshed proactively, in the background, when used less than
+    :attr:`margin <youwol.utils.clients.oidc.tokens_manager.TokensRefresher.margin>` seconds before expiry;
+    meanwhile, the current (still valid) token is served without waiting.
+    """
+
+    def __init__(self, margin: float = 30):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            margin: Duration (in seconds) before the expiry of an access token from which it is refreshed
+                in the background.
+        """
+        self.margin = margin
+        self.__coalescer: Coalescer[Any] = Coalescer()
+
+    def needs_refresh(self, expires_at: float, now: float) -> bool:
+        """
+        Parameters:
+            expires_at: Expiry (EPOCH, in seconds) of an access token.
+            now: Current time (EPOCH, in seconds).
+
+        Returns:
+            Whether the access token should be refreshed in the background.
+        """
+        return expires_at - self.margin < now
+
+    def refresh(
+        self, key: str, refresh: Callable[[], Awaitable[_T]]
+    ) -> "asyncio.Future[_T]":
+        """
+        Starts a refresh, or joins the one in progress for the same key.
+
+        The returned future can be awaited (preferably shielded) or not, in which case the refresh continues in
+        the background; failures of background refreshes are logged.
+
+        Parameters:
+            key: Identifier of the tokens refreshed.
+            refresh: Executes the refresh.
+
+        Returns:
+            The future of the refresh.
+        """
+        joined = key in self.__coalescer
+        future = self.__coalescer.start(key, refresh)
+        if not joined:
+            future.add_done_callback(lambda f: self.__done(key, f))
+        return future
+
+    @staticmethod
+    def __done(key: str, future: "asyncio.Future[Any]") -> None:
+        if not future.cancelled() and future.exception():
+            log_error(f"Failed to refresh tokens '{key}': {future.exception()}")
+
+
+default_tokens_refresher = TokensRefresher()
+"""
+Refresher shared by the tokens managers of the process: refreshes of the same tokens are executed once, whatever
+the manager they are retrieved from.
+"""
+
+
 class Tokens:
     """
     Represents tokens used in the OIDC (OpenID Connect) protocol.
@@ -89,6 +166,7 @@ class Tokens:
         storage: TokensStorage,
         oidc_client: OidcForClient,
         tokens_data: TokensData,
+        refresher: TokensRefresher = default_tokens_refresher,
     ):
         """
         Initializes the instance with provided arguments.
@@ -98,11 +176,13 @@ class Tokens:
             storage: An instance of TokensStorage for persisting token data.
             oidc_client: An instance of OidcForClient for OIDC-related operations.
             tokens_data: An instance of TokensData containing token information.
+            refresher: Coordinates the refreshes of the tokens.
         """
         self.__id = tokens_id
         self.__storage = storage
         self.__oidc_client = oidc_client
         self.__data = tokens_data
+        self.__refresher = refresher
 
     def id(self) -> str:
         """
@@ -146,13 +226,21 @@ class Tokens:
         """
         Returns the access token, refreshing it if necessary.
 
+        If the access token expires soon, it is returned while being refreshed in the background (see
+        :class:`TokensRefresher <youwol.utils.clients.oidc.tokens_manager.TokensRefresher>`).
+
         Returns:
             The access token.
         """
         self.__assert_refresh_not_expired()
 
-        if self.__data.expires_at < self.__now():
+        now = self.__now()
+        if self.__data.expires_at < now:
             await self.refresh()
+        elif self.__refresher.needs_refresh(self.__data.expires_at, now):
+            self.__refresher.refresh(self.id(), self.__refresh_data).add_done_callback(
+                self.__refreshed
+            )
 
         return self.__data.access_token
 
@@ -203,14 +291,25 @@ class Tokens:
     async def refresh(self) -> None:
         """
         Refreshes the access and refresh tokens and updates the stored data.
+        Concurrent refreshes of the same tokens are executed once.
 
         Raises:
             TokensExpiredError: Raised if attempting to refresh expired tokens.
         """
         self.__assert_refresh_not_expired()
+        self.__data = await asyncio.shield(
+            self.__refresher.refresh(self.id(), self.__refresh_data)
+        )
+
+    def __refreshed(self, future: "asyncio.Future[TokensData]") -> None:
+        # Failures of background refreshes are logged by the refresher.
+        if not future.cancelled() and not future.exception():
+            self.__data = future.result()
+
+    async def __refresh_data(self) -> TokensData:
         tokens_data = await self.__oidc_client.refresh(self.__data.refresh_token)
-        self.__data = tokens_data
-        await self.save()
+        await self.__storage.store(tokens_id=self.id(), data=tokens_data)
+        return tokens_data
 
     @staticmethod
     def __now() -> float:
@@ -222,16 +321,23 @@ class TokensManager:
     Manager class for handling operations related to user tokens.
     """
 
-    def __init__(self, storage: TokensStorage, oidc_client: OidcForClient):
+    def __init__(
+        self,
+        storage: TokensStorage,
+        oidc_client: OidcForClient,
+        refresher: TokensRefresher = default_tokens_refresher,
+    ):
         """
         Initializes a new instance of TokensManager.
 
         Parameters:
             storage: The storage mechanism for tokens.
             oidc_client: The OIDC client used for token operations.
+            refresher: Coordinates the refreshes of the tokens.
         """
         self.__storage = storage
         self.__oidc_client = oidc_client
+        self.__refresher = refresher
 
     async def save_tokens(self, tokens_id: str, tokens_data: TokensData) -> Tokens:
         """
@@ -249,6 +355,7 @@ class TokensManager:
             storage=self.__storage,
             oidc_client=self.__oidc_client,
             tokens_data=tokens_data,
+            refresher=self.__refresher,
         )
         await tokens.save()
         return tokens
@@ -277,6 +384,7 @@ class TokensManager:
             storage=self.__storage,
             oidc_client=self.__oidc_client,
             tokens_data=tokens_data,
+            refresher=self.__refresher,
         )
 
         try:
@@ -457,6 +565,7 @@ class SessionLessTokenManager:
         cache: CacheClient,
         oidc_client: OidcForClient,
         expires_at_threshold: int = __TOKEN_EXPIRES_AT_THRESHOLD,
+        refresher: TokensRefresher = default_tokens_refresher,
     ) -> None:
         """
         Initializes a new instance.
@@ -466,17 +575,23 @@ class SessionLessTokenManager:
             cache: The cache client used for storing and retrieving data.
             oidc_client: The OIDC client for obtaining access tokens.
             expires_at_threshold: Threshold value to consider an access token as expired.
+            refresher: Coordinates the requests of new access tokens.
         """
 
         self.__cache_key = cache_key
         self.__cache = cache
         self.__oidc_client = oidc_client
         self.__expires_at_threshold = expires_at_threshold
+        self.__refresher = refresher
 
     async def get_access_token(self) -> str:
         """
         Retrieves a session-less access token from the cache or OIDC client.
 
+        Concurrent requests of a new access token are executed once; if the cached access token expires soon,
+        it is returned while a new one is requested in the background (see
+        :class:`TokensRefresher <youwol.utils.clients.oidc.tokens_manager.TokensRefresher>`).
+
         Returns
             The session-less access token.
         """
@@ -486,20 +601,28 @@ class SessionLessTokenManager:
         if token_data is not None and not isinstance(token_data, dict):
             raise ValueError(f"Cached value for key {self.__cache_key} is not a `dict`")
         if token_data is None or int(token_data["expires_at"]) < int(now):
-            sessionless_tokens_data = await self.__oidc_client.client_credentials_flow()
-            expires_at = (
-                int(now)
-                + sessionless_tokens_data.expires_in
-                - self.__expires_at_threshold
-            )
-            token_data = {
-                "access_token": sessionless_tokens_data.access_token,
-                "expires_at": expires_at,
-            }
-            self.__cache.set(
-                self.__cache_key,
-                token_data,
-                AT(expires_at),
+            new_token_data = await asyncio.shield(
+                self.__refresher.refresh(self.__cache_key, self.__request_token)
             )
+            return str(new_token_data["access_token"])
+        if self.__refresher.needs_refresh(int(token_data["expires_at"]), now):
+            self.__refresher.refresh(self.__cache_key, self.__request_token)
 
         return str(token_data["access_token"])
+
+    async def __request_token(self) -> dict[str, str | int]:
+        now = datetime.datetime.now().timestamp()
+        sessionless_tokens_data = await self.__oidc_client.client_credentials_flow()
+        expires_at = (
+            int(now) + sessionless_tokens_data.expires_in - self.__expires_at_threshold
+        )
+        token_data: dict[str, str | int] = {
+            "access_token": sessionless_tokens_data.access_token,
+            "expires_at": expires_at,
+        }
+        self.__cache.set(
+            self.__cache_key,
+            token_data,
+            AT(expires_at),
+        )
+        return token_data
@@ -1,11 +1,13 @@
 # standard library
+import asyncio
 import itertools
 import json as _json
 import os
 import shutil
+import uuid
 
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from os import PathLike
 from pathlib import Path
 
@@ -27,17 +29,82 @@ flatten = itertools.chain.from_iterable
 def create_dir_if_needed(full_path: Path):
     dir_path = full_path.parent
     if not dir_path.exists():
-        os.makedirs(cast(PathLike, dir_path))
+        os.makedirs(cast(PathLike, dir_path), exist_ok=True)
+
+
+FileContent = bytes | Callable[[], bytes]
+"""
+Content of a file written by
+:class:`LocalStorageClient <youwol.utils.clients.storage.local_storage.LocalStorageClient>`:
+either the bytes, or a function serializing them (called in a worker thread).
+"""
+
+
+def write_atomic(full_path: Path, content: FileContent):
+    """
+    Writes a file through a temporary file renamed afterward: readers (or a crash) never observe a partially
+    written file.
+
+    Parameters:
+        full_path: Path of the file.
+        content: Content of the file.
+    """
+    if callable(content):
+        content = content()
+    create_dir_if_needed(full_path)
+    tmp_path = full_path.parent / f".{full_path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        with tmp_path.open("wb") as fp:
+            fp.write(content)
+        os.replace(tmp_path, full_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def read_file(full_path: Path) -> bytes | None:
+    """
+    Reads a file.
+
+    Parameters:
+        full_path: Path of the file.
+
+    Returns:
+        The content, `None` if the file does not exist.
+    """
+    try:
+        with full_path.open("rb") as fp:
+            return fp.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+@dataclass
+class _PendingWrite:
+    """
+    Latest content submitted for a file while a previous write is in progress.
+    """
+
+    content: FileContent | None = None
+    done: "asyncio.Future[None] | None" = None
+    flush: "asyncio.Future[None] | None" = None
 
 
 @dataclass(frozen=True)
 class LocalStorageClient:
     """
     Client for the storage service used in the local YouWol server.
+
+    File I/O is executed in worker threads, and files are written atomically
+    (see :func:`write_atomic <youwol.utils.clients.storage.local_storage.write_atomic>`).
+    Writes submitted for a file while a previous one is in progress are coalesced: only the latest content is
+    written once the previous write completes.
     """
 
     root_path: Path
     bucket_name: str
+    _pending_writes: dict[Path, _PendingWrite] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def bucket_path(self) -> Path:
@@ -46,13 +113,45 @@ class LocalStorageClient:
     def get_full_path(self, owner: str, path: str | Path) -> Path:
         return self.bucket_path / owner[1:] / path
 
+    async def write(self, full_path: Path, content: FileContent):
+        """
+        Writes a file, coalesced with the other writes of the same file submitted while one is in progress.
+
+        Parameters:
+            full_path: Path of the file.
+            content: Content of the file, when provided as a function it is not called if a later write
+                supersedes it.
+        """
+        pending = self._pending_writes.get(full_path)
+        if pending is None:
+            pending = _PendingWrite()
+            self._pending_writes[full_path] = pending
+            pending.flush = asyncio.ensure_future(self.__flush(full_path, pending))
+        pending.content = content
+        pending.done = pending.done or asyncio.get_running_loop().create_future()
+        # The write continues if the caller is cancelled.
+        await asyncio.shield(pending.done)
+
+    async def __flush(self, full_path: Path, pending: _PendingWrite):
+        try:
+            while pending.content is not None and pending.done is not None:
+                content, done = pending.content, pending.done
+                pending.content, pending.done = None, None
+                try:
+                    await asyncio.to_thread(write_atomic, full_path, content)
+                    done.set_result(None)
+                except Exception as e:
+                    done.set_exception(e)
+        finally:
+            del self._pending_writes[full_path]
+
     async def delete_bucket(self, **_kwargs):
-        if self.bucket_path.exists():
-            shutil.rmtree(self.bucket_path)
+        await asyncio.to_thread(shutil.rmtree, self.bucket_path, ignore_errors=True)
 
     async def ensure_bucket(self, **_kwargs):
-        if not self.bucket_path.exists():
-            os.makedirs(cast(PathLike, self.bucket_path))
+        await asyncio.to_thread(
+            os.makedirs, cast(PathLike, self.bucket_path), exist_ok=True
+        )
 
         return True
 
@@ -65,8 +164,7 @@ class LocalStorageClient:
             form.owner if form.owner else get_default_owner(headers), form.objectName
         )
 
-        create_dir_if_needed(full_path)
-        full_path.open("wb").write(form.objectData)
+        await self.write(full_path, form.objectData)
         return {}
 
     async def post_object(
@@ -87,8 +185,7 @@ class LocalStorageClient:
         full_path = self.get_full_path(
             owner if owner else get_default_owner(headers), path
         )
-        create_dir_if_needed(full_path)
-        full_path.open("wb").write(data)
+        await self.write(full_path, data)
 
     async def post_json(
         self,
@@ -104,8 +201,7 @@ class LocalStorageClient:
         full_path = self.get_full_path(
             owner if owner else get_default_owner(headers), path
         )
-        create_dir_if_needed(full_path)
-        full_path.open("w").write(_json.dumps(json, indent=4))
+        await self.write(full_path, lambda: _json.dumps(json, indent=4).encode())
         return {}
 
     async def post_text(
@@ -122,8 +218,7 @@ class LocalStorageClient:
         full_path = self.get_full_path(
             owner if owner else get_default_owner(headers), path
         )
-        create_dir_if_needed(full_path)
-        full_path.open("w").write(text)
+        await self.write(full_path, text.encode())
         return {}
 
     async def delete_group(
@@ -139,8 +234,7 @@ class LocalStorageClient:
         path = self.get_full_path(
             owner if owner else get_default_owner(headers), prefix
         )
-        if path.exists():
-            shutil.rmtree(path)
+        await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
 
     async def delete(
         self,
@@ -155,15 +249,16 @@ class LocalStorageClient:
         full_path = self.get_full_path(
             owner if owner else get_default_owner(headers), path
         )
-        if full_path.is_dir():
-            shutil.rmtree(full_path)
+        if await asyncio.to_thread(full_path.is_dir):
+            await asyncio.to_thread(shutil.rmtree, full_path)
             return
 
-        if not full_path.exists():
+        try:
+            await asyncio.to_thread(os.remove, full_path)
+        except FileNotFoundError as e:
             raise HTTPException(
                 status_code=404, detail=f"File {full_path.name} not found"
-            )
-        os.remove(full_path)
+            ) from e
 
         return {}
 
@@ -177,12 +272,22 @@ class LocalStorageClient:
         if not headers:
             headers = {}
 
-        path_owner = (owner if owner else get_default_owner(headers))[1:]
-        results = [
-            [(Path(root) / f).relative_to(self.bucket_path / path_owner) for f in files]
-            for root, _, files in os.walk(self.bucket_path / path_owner / prefix)
-        ]
+        owner_path = (
+            self.bucket_path / (owner if owner else get_default_owner(headers))[1:]
+        )
 
+        def walk():
+            return [
+                [
+                    (Path(root) / f).relative_to(owner_path)
+                    for f in files
+                    # Temporary files of in-progress writes
+                    if not (f.startswith(".") and f.endswith(".tmp"))
+                ]
+                for root, _, files in os.walk(owner_path / prefix)
+            ]
+
+        results = await asyncio.to_thread(walk)
         return [{"name": str(r)} for r in flatten(results)]
 
     async def get_bytes(
@@ -198,10 +303,11 @@ class LocalStorageClient:
         full_path = self.get_full_path(
             owner if owner else get_default_owner(headers), path
         )
-        if not full_path.is_file():
+        content = await asyncio.to_thread(read_file, full_path)
+        if content is None:
             raise ResourcesNotFoundException(path=str(full_path))
 
-        return full_path.open("rb").read()
+        return content
 
     async def get_json(
         self,
@@ -0,0 +1,65 @@
+# standard library
+import asyncio
+
+from collections.abc import Awaitable, Callable
+
+# typing
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Coalescer(Generic[_T]):
+    """
+    Coalesces concurrent executions of coroutines sharing the same key (single-flight): only the first one is
+    executed, the others join it and get its result.
+    """
+
+    def __init__(self) -> None:
+        self.__inflight: dict[str, asyncio.Future[_T]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Parameters:
+            key: Key of the execution.
+
+        Returns:
+            Whether an execution is in progress for the key.
+        """
+        return key in self.__inflight
+
+    def start(self, key: str, fct: Callable[[], Awaitable[_T]]) -> "asyncio.Future[_T]":
+        """
+        Starts an execution, or joins the one in progress for the same key.
+
+        The returned future can be awaited (preferably shielded, it is shared) or not, in which case the execution
+        continues in the background: its failure is then expected to be handled by the caller (*e.g.* using a
+        done callback).
+
+        Parameters:
+            key: Key of the execution.
+            fct: Starts the execution, called only if none is in progress for the key.
+
+        Returns:
+            The future of the execution.
+        """
+        if key not in self.__inflight:
+            future = asyncio.ensure_future(fct())
+            self.__inflight[key] = future
+            future.add_done_callback(lambda _: self.__inflight.pop(key, None))
+        return self.__inflight[key]
+
+    async def run(self, key: str, fct: Callable[[], Awaitable[_T]]) -> tuple[_T, bool]:
+        """
+        Executes, or joins the execution in progress for the same key, and waits for its result.
+        The execution is shielded: it continues if the caller is cancelled, other callers may wait for it.
+
+        Parameters:
+            key: Key of the execution.
+            fct: Starts the execution, called only if none is in progress for the key.
+
+        Returns:
+            The result & whether the execution has been joined (coalesced with an ongoing one).
+        """
+        coalesced = key in self.__inflight
+        return await asyncio.shield(self.start(key, fct)), coalesced
@@ -2,7 +2,9 @@
 import asyncio
 import json
 import time
+import weakref
 
+from collections import deque
 from collections.abc import Callable
 
 # typing
@@ -14,7 +16,137 @@ import aiohttp
 from starlette.websockets import WebSocket
 
 # relative
-from .models import ContextReporter, Label, LogEntry, format_message
+from .models import ContextReporter, Label, LogEntry, LogLevel, format_message
+
+
+class WebSocketSender:
+    """
+    Outbound queue of a web socket: messages are pushed without waiting, and sent by a background task.
+
+    *  Messages pushed within `batch_delay` are sent together: in a single frame including the JSON array of the
+       messages if `batched` is `True`, in consecutive frames otherwise.
+    *  If `max_pending` is provided, at most `max_pending` messages are queued: when the client falls behind,
+       the oldest ones are dropped, and a warning log message reporting their count is sent in place. It is only
+       relevant for channels of logs, messages conveying data are not expected to be lost.
+    *  Once a send fails (*e.g.* the client disconnected), the sender stops and pushed messages are ignored.
+
+    Use :func:`websocket_sender <youwol.utils.context.reporter.websocket_sender>` to retrieve the sender
+    of a web socket.
+    """
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        batched: bool = False,
+        max_pending: int | None = 10000,
+        batch_delay: float = 0.005,
+        mute_exceptions: bool = True,
+    ):
+        """
+        Initializes a new instance, the background task is started on first push.
+
+        Parameters:
+            ws: The web socket.
+            batched: Whether messages are sent in JSON arrays.
+            max_pending: Maximum count of messages queued, unbounded if `None`.
+            batch_delay: Duration (in seconds) during which pushed messages are gathered before being sent.
+            mute_exceptions: If `False`, failures to send messages are reported in the standard output.
+        """
+        self.ws = ws
+        self.batched = batched
+        self.max_pending = max_pending
+        self.batch_delay = batch_delay
+        self.mute_exceptions = mute_exceptions
+        self.dropped = 0
+        self.closed = False
+        self.__pending: deque[str] = deque()
+        self.__wake_up = asyncio.Event()
+        self.__task: asyncio.Future[None] | None = None
+
+    def push(self, message: str) -> None:
+        """
+        Queues a message.
+
+        Parameters:
+            message: The message, serialized.
+        """
+        if self.closed:
+            return
+        if self.max_pending is not None and len(self.__pending) >= self.max_pending:
+            self.__pending.popleft()
+            self.dropped += 1
+        self.__pending.append(message)
+        self.__wake_up.set()
+        if not self.__task:
+            self.__task = asyncio.ensure_future(self.__send_loop())
+
+    def close(self) -> None:
+        """
+        Stops the sender, queued messages are discarded.
+        """
+        self.closed = True
+        self.__pending.clear()
+        if self.__task:
+            self.__task.cancel()
+
+    async def __send_loop(self) -> None:
+        try:
+            while True:
+                await self.__wake_up.wait()
+                await asyncio.sleep(self.batch_delay)
+                self.__wake_up.clear()
+                messages = list(self.__pending)
+                self.__pending.clear()
+                if self.dropped:
+                    messages.insert(0, self.__dropped_message())
+                    self.dropped = 0
+                if self.batched:
+                    await self.ws.send_text(f"[{','.join(messages)}]")
+                    continue
+                for message in messages:
+                    await self.ws.send_text(message)
+        except Exception as e:
+            self.closed = True
+            self.__pending.clear()
+            if not self.mute_exceptions:
+                print(f"Error while sending in web socket, sender stopped: {e}")
+
+    def __dropped_message(self) -> str:
+        return json.dumps(
+            {
+                "level": LogLevel.WARNING.name,
+                "attributes": {},
+                "labels": [str(Label.LOG_WARNING)],
+                "text": f"{self.dropped} messages dropped: the client is too slow",
+                "data": {"droppedCount": self.dropped},
+                "contextId": "",
+                "parentContextId": None,
+            }
+        )
+
+
+_websocket_senders: "weakref.WeakKeyDictionary[WebSocket, WebSocketSender]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def websocket_sender(ws: WebSocket, **kwargs) -> WebSocketSender:
+    """
+    Returns the sender of a web socket, it is created if needed.
+
+    Parameters:
+        ws: The web socket.
+        kwargs: Arguments forwarded to
+            :class:`WebSocketSender <youwol.utils.context.reporter.WebSocketSender>` when the sender is created.
+
+    Returns:
+        The sender.
+    """
+    sender = _websocket_senders.get(ws)
+    if not sender:
+        sender = WebSocketSender(ws, **kwargs)
+        _websocket_senders[ws] = sender
+    return sender
 
 
 class WsContextReporter(ContextReporter):
@@ -54,23 +186,21 @@ class WsContextReporter(ContextReporter):
         """
         Send a :class:`LogEntry <youwol.utils.context.models.LogEntry>` in the web-socket channels.
 
+        The entry is serialized once and queued in the
+        :class:`sender <youwol.utils.context.reporter.WebSocketSender>` of each channel: it does not wait
+        for the messages to be sent.
+
         Parameters:
             entry: log to process.
         """
-        message = format_message(entry)
-        websockets = self.websockets_getter()
-
-        async def dispatch():
-            try:
-                text = json.dumps(message)
-                await asyncio.gather(
-                    *[ws.send_text(text) for ws in websockets if ws],
-                    return_exceptions=self.mute_exceptions,
-                )
-            except (TypeError, OverflowError):
-                print(f"Error in JSON serialization ({__file__})")
-
-        await dispatch()
+        try:
+            text = json.dumps(format_message(entry))
+        except (TypeError, OverflowError, ValueError):
+            print(f"Error in JSON serialization ({__file__})")
+            return
+        for ws in self.websockets_getter():
+            if ws:
+                websocket_sender(ws, mute_exceptions=self.mute_exceptions).push(text)
 
 
 class DeployedContextReporter(ContextReporter):
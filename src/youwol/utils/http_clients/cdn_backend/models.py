@@ -186,6 +186,29 @@ class DeleteLibraryResponse(BaseModel):
     deletedVersionsCount: int
 
 
+class ResolutionsTableStatus(BaseModel):
+    """
+    Describes the status of the table of versions resolved from semantic versioning ranges.
+    """
+
+    entriesCount: int
+    """
+    Number of entries in the table.
+    """
+    hits: int
+    """
+    Number of lookups resolved from the table.
+    """
+    misses: int
+    """
+    Number of lookups not resolved from the table.
+    """
+    hitRatio: float
+    """
+    Ratio of lookups resolved from the table.
+    """
+
+
 class LoadingGraphResponse(BaseModel):
     graphType: str
     definition: list[list[Url]]
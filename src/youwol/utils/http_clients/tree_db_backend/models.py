@@ -465,7 +465,7 @@ class GetRecordsBody(BaseModel):
 
 FILES_TABLE = TableBody(
     name="items",
-    version="0.0",
+    version="0.1",
     columns=[
         Column(name="item_id", type="text"),
         Column(name="folder_id", type="text"),
@@ -475,6 +475,7 @@ FILES_TABLE = TableBody(
         Column(name="name", type="text"),
         Column(name="type", type="text"),
         Column(name="metadata", type="text"),
+        Column(name="path", type="text"),
     ],
     partition_key=["item_id"],
     clustering_columns=[],
@@ -482,6 +483,9 @@ FILES_TABLE = TableBody(
 """
 Table definition for the :mod:`tree_db <youwol.backends.tree_db>` service regarding the indexation
  of files (e.g. items).
+
+The column `path` is the materialized path of the parent folder (see
+:func:`folder_path <youwol.backends.tree_db.utils.folder_path>`).
 """
 
 FILES_TABLE_PARENT_INDEX = SecondaryIndex(
@@ -501,9 +505,17 @@ Secondary index for :glob:`FILES_TABLE <youwol.utils.http_clients.tree_db_backen
 related id (i.e. asset id).
 """
 
+FILES_TABLE_DRIVE_INDEX = SecondaryIndex(
+    name="items_by_drive", identifier=IdentifierSI(column_name="drive_id")
+)
+"""
+Secondary index for :glob:`FILES_TABLE <youwol.utils.http_clients.tree_db_backend.models.FILES_TABLE>` to query by
+drive's ID (e.g. when querying a subtree by materialized path).
+"""
+
 FOLDERS_TABLE = TableBody(
     name="folders",
-    version="0.0",
+    version="0.1",
     columns=[
         Column(name="folder_id", type="text"),
         Column(name="parent_folder_id", type="text"),
@@ -512,12 +524,16 @@ FOLDERS_TABLE = TableBody(
         Column(name="name", type="text"),
         Column(name="type", type="text"),
         Column(name="metadata", type="text"),
+        Column(name="path", type="text"),
     ],
     partition_key=["folder_id"],
     clustering_columns=[],
 )
 """
 Table definition for the :mod:`tree_db <youwol.backends.tree_db>` service regarding the indexation of folders.
+
+The column `path` is the materialized path of the folder (see
+:func:`folder_path <youwol.backends.tree_db.utils.folder_path>`).
 """
 
 FOLDERS_TABLE_PARENT_INDEX = SecondaryIndex(
@@ -528,6 +544,14 @@ Secondary index for :glob:`FOLDERS_TABLE <youwol.utils.http_clients.tree_db_back
 to query by parent's folder ID.
 """
 
+FOLDERS_TABLE_DRIVE_INDEX = SecondaryIndex(
+    name="folders_by_drive", identifier=IdentifierSI(column_name="drive_id")
+)
+"""
+Secondary index for :glob:`FOLDERS_TABLE <youwol.utils.http_clients.tree_db_backend.models.FOLDERS_TABLE>`
+to query by drive's ID (e.g. when querying a subtree by materialized path).
+"""
+
 DRIVES_TABLE = TableBody(
     name="drives",
     version="0.0",
@@ -589,14 +613,18 @@ def create_doc_dbs(factory_db: Any, **kwargs) -> DocDbs:
     files_db = factory_db(
         keyspace_name=KEYSPACE_NAME,
         table_body=FILES_TABLE,
-        secondary_indexes=[FILES_TABLE_PARENT_INDEX, FILES_TABLE_RELATED_INDEX],
+        secondary_indexes=[
+            FILES_TABLE_PARENT_INDEX,
+            FILES_TABLE_RELATED_INDEX,
+            FILES_TABLE_DRIVE_INDEX,
+        ],
         **kwargs,
     )
 
     folders_db = factory_db(
         keyspace_name=KEYSPACE_NAME,
         table_body=FOLDERS_TABLE,
-        secondary_indexes=[FOLDERS_TABLE_PARENT_INDEX],
+        secondary_indexes=[FOLDERS_TABLE_PARENT_INDEX, FOLDERS_TABLE_DRIVE_INDEX],
         **kwargs,
     )
 
@@ -0,0 +1,210 @@
+# standard library
+import asyncio
+
+from collections.abc import AsyncIterator, Mapping
+
+# typing
+from typing import Any
+
+# third parties
+import yarl
+
+from aiohttp import ClientResponse, ClientSession, DummyCookieJar, TCPConnector
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+HOP_BY_HOP_HEADERS = frozenset(
+    [
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    ]
+)
+"""
+Headers meaningful only for a single transport-level connection, they are not forwarded by proxies
+(see [RFC 9110](https://www.rfc-editor.org/rfc/rfc9110#section-7.6.1)).
+"""
+
+
+def end_to_end_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """
+    Removes the hop-by-hop headers, including the ones listed by the `Connection` header.
+
+    Parameters:
+        headers: Headers of a request or a response.
+
+    Returns:
+        The end-to-end headers.
+    """
+    connection = next((v for k, v in headers.items() if k.lower() == "connection"), "")
+    excluded = HOP_BY_HOP_HEADERS.union(
+        token.strip().lower() for token in connection.split(",") if token.strip()
+    )
+    return {k: v for k, v in headers.items() if k.lower() not in excluded}
+
+
+class ReverseProxy:
+    """
+    Streaming reverse proxy.
+
+    It maintains one pooled (keep-alive) client session per destination's origin, and forwards
+    requests and responses bodies chunk by chunk: memory usage does not depend on the payloads size.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = 32,
+        keepalive_timeout: float = 30.0,
+        chunk_size: int = 2**16,
+    ):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            limit_per_host: Maximum count of simultaneous connections to a destination.
+            keepalive_timeout: Duration (in seconds) an idle connection is kept open.
+            chunk_size: Maximum size of the chunks when streaming a response's body.
+        """
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.chunk_size = chunk_size
+        self._sessions: dict[
+            yarl.URL, tuple[asyncio.AbstractEventLoop, ClientSession]
+        ] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Any = None,
+        data: AsyncIterator[bytes] | bytes | None = None,
+    ) -> ClientResponse:
+        """
+        Sends a request, hop-by-hop headers are removed.
+
+        The returned response is not read: it is the responsibility of the caller to consume it
+        (*e.g.* using :meth:`streaming_response <youwol.utils.reverse_proxy.ReverseProxy.streaming_response>`)
+        or to release it.
+
+        Parameters:
+            method: HTTP method.
+            url: Destination's URL.
+            headers: Headers of the request.
+            params: Query parameters.
+            data: Body of the request.
+
+        Returns:
+            The response.
+        """
+        session = self._session(yarl.URL(url))
+        return await session.request(
+            method=method,
+            url=url,
+            headers=end_to_end_headers(headers),
+            params=params,
+            data=data,
+            allow_redirects=False,
+        )
+
+    async def forward(
+        self,
+        incoming_request: Request,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> ClientResponse:
+        """
+        Forwards an incoming request (whatever its method) to a destination, streaming its body.
+
+        Parameters:
+            incoming_request: The incoming request.
+            url: Destination's URL.
+            headers: Headers of the forwarded request, default to the ones of the incoming request.
+
+        Returns:
+            The response, see :meth:`request <youwol.utils.reverse_proxy.ReverseProxy.request>`.
+        """
+        headers = dict(incoming_request.headers.items()) if not headers else headers
+        has_body = any(k.lower() == "transfer-encoding" for k in headers) or any(
+            k.lower() == "content-length" and v != "0" for k, v in headers.items()
+        )
+        return await self.request(
+            method=incoming_request.method,
+            url=url,
+            headers=headers,
+            params=incoming_request.query_params,
+            data=self._body(incoming_request) if has_body else None,
+        )
+
+    def streaming_response(self, response: ClientResponse) -> StreamingResponse:
+        """
+        Converts a response into a `StreamingResponse` forwarding its body chunk by chunk, hop-by-hop
+        headers are removed.
+
+        Parameters:
+            response: The response.
+
+        Returns:
+            The streaming response.
+        """
+
+        async def content() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    yield chunk
+            finally:
+                response.release()
+
+        return StreamingResponse(
+            content=content(),
+            status_code=response.status,
+            headers=end_to_end_headers(response.headers),
+            background=BackgroundTask(response.release),
+        )
+
+    async def close(self) -> None:
+        """
+        Closes the pooled sessions.
+        """
+        sessions = [session for _, session in self._sessions.values()]
+        self._sessions.clear()
+        await asyncio.gather(*[session.close() for session in sessions])
+
+    def _session(self, url: yarl.URL) -> ClientSession:
+        origin = url.origin()
+        loop = asyncio.get_running_loop()
+        session_loop, session = self._sessions.get(origin, (None, None))
+        if session and not session.closed and session_loop is loop:
+            return session
+        session = ClientSession(
+            connector=TCPConnector(
+                ssl=False,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            ),
+            # Incoming requests carry their own cookies: nothing is kept between requests.
+            cookie_jar=DummyCookieJar(),
+            auto_decompress=False,
+        )
+        self._sessions[origin] = (loop, session)
+        return session
+
+    @staticmethod
+    async def _body(incoming_request: Request) -> AsyncIterator[bytes]:
+        async for chunk in incoming_request.stream():
+            if chunk:
+                yield chunk
+
+
+reverse_proxy = ReverseProxy()
+"""
+Proxy shared by the redirections of the flow switches and the CDN apps server: connections to an origin are pooled
+across them, they are closed when the application shuts down.
+"""
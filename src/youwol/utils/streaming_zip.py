@@ -0,0 +1,167 @@
+# standard library
+import asyncio
+import io
+import json
+import time
+import zipfile
+
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+# third parties
+from starlette.responses import StreamingResponse
+
+# relative
+from .types import JSON
+
+ZipEntryContent = bytes | AsyncIterable[bytes]
+"""
+Content of a zip entry: either the bytes, or an iterable over its chunks.
+"""
+
+
+@dataclass(frozen=True)
+class ZipEntry:
+    """
+    Entry of a zip archive created by
+    :func:`stream_zip <youwol.utils.streaming_zip.stream_zip>`.
+    """
+
+    arcname: str
+    """
+    Name of the file within the archive.
+    """
+
+    content: Callable[[], Awaitable[ZipEntryContent]]
+    """
+    Fetches the content of the entry, eventually concurrently with the one of other entries.
+    """
+
+
+def json_bytes(data: JSON) -> bytes:
+    """
+    Serializes a JSON content like :func:`write_json <youwol.utils.utils_paths.write_json>` does.
+
+    Parameters:
+        data: The content.
+
+    Returns:
+        The serialized content.
+    """
+    return f"{json.dumps(data, indent=4)}\n".encode()
+
+
+def json_entry(arcname: str, data: JSON) -> ZipEntry:
+    """
+    Creates a zip entry from a JSON content, see :func:`json_bytes <youwol.utils.streaming_zip.json_bytes>`.
+
+    Parameters:
+        arcname: Name of the file within the archive.
+        data: The content.
+
+    Returns:
+        The entry.
+    """
+
+    async def content() -> bytes:
+        return json_bytes(data)
+
+    return ZipEntry(arcname=arcname, content=content)
+
+
+class _ZipSink(io.RawIOBase):
+    """
+    Unseekable output of a `zipfile.ZipFile`, the bytes written are collected until drained.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    entries: list[ZipEntry],
+    parallelism: int = 8,
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> AsyncIterator[bytes]:
+    """
+    Generates a zip archive incrementally.
+
+    The entries are written in order, while up to `parallelism` of them are fetched ahead concurrently.
+    Compression is executed in a worker thread. Peak memory usage depends on the size of the entries fetched
+    ahead, not on the size of the archive.
+
+    Parameters:
+        entries: Entries of the archive.
+        parallelism: Maximum count of entries fetched concurrently.
+        compression: Compression method.
+
+    Returns:
+        Iterator over the bytes of the archive.
+    """
+    sink = _ZipSink()
+    fetches: dict[int, asyncio.Future[ZipEntryContent]] = {}
+
+    def schedule(index: int):
+        if index < len(entries) and index not in fetches:
+            fetches[index] = asyncio.ensure_future(entries[index].content())
+
+    try:
+        for index in range(min(parallelism, len(entries))):
+            schedule(index)
+        with zipfile.ZipFile(sink, "w", compression) as zipper:
+            for index, entry in enumerate(entries):
+                content = await fetches.pop(index)
+                schedule(index + parallelism)
+                info = zipfile.ZipInfo(
+                    filename=entry.arcname, date_time=time.localtime()[0:6]
+                )
+                info.compress_type = compression
+                if isinstance(content, bytes):
+                    await asyncio.to_thread(zipper.writestr, info, content)
+                else:
+                    # The size is not known in advance: ZIP64 extensions are required for entries larger than 2 GiB.
+                    with zipper.open(info, "w", force_zip64=True) as fp:
+                        async for chunk in content:
+                            await asyncio.to_thread(fp.write, chunk)
+                            if data := sink.drain():
+                                yield data
+                if data := sink.drain():
+                    yield data
+        # The central directory is written when closing the archive.
+        yield sink.drain()
+    finally:
+        for task in fetches.values():
+            task.cancel()
+
+
+def zip_streaming_response(
+    entries: list[ZipEntry], parallelism: int = 8
+) -> StreamingResponse:
+    """
+    Creates a `StreamingResponse` of a zip archive, see
+    :func:`stream_zip <youwol.utils.streaming_zip.stream_zip>`.
+
+    Parameters:
+        entries: Entries of the archive.
+        parallelism: Maximum count of entries fetched concurrently.
+
+    Returns:
+        The response.
+    """
+    return StreamingResponse(
+        content=stream_zip(entries=entries, parallelism=parallelism),
+        media_type="application/zip",
+    )
@@ -1,6 +1,12 @@
 # standard library
+import asyncio
 import json
+import time
 
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
 from socket import AF_INET, SOCK_STREAM, socket
 from urllib.error import URLError
 from urllib.request import urlopen
@@ -9,7 +15,13 @@ from urllib.request import urlopen
 from typing import Any
 
 # third parties
-from aiohttp import ClientResponse, ClientSession, FormData, TCPConnector
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    FormData,
+)
 from pydantic import BaseModel
 from starlette.requests import Request
 from starlette.responses import Response
@@ -18,6 +30,7 @@ from starlette.responses import Response
 from youwol.utils.context import Context
 from youwol.utils.context.models import TContextAttr
 from youwol.utils.exceptions import upstream_exception_from_response
+from youwol.utils.reverse_proxy import reverse_proxy
 
 
 async def redirect_request(
@@ -26,61 +39,36 @@ async def redirect_request(
     destination_base_path: str,
     headers=None,
 ) -> Response:
+    """
+    Redirects an incoming request using the
+    :glob:`reverse_proxy <youwol.utils.reverse_proxy.reverse_proxy>`: bodies of the request and of the response
+    are streamed.
+
+    Parameters:
+        incoming_request: The incoming request.
+        origin_base_path: Base path of the incoming request, replaced by `destination_base_path`.
+        destination_base_path: Base URL of the destination.
+        headers: Headers of the redirected request, default to the ones of the incoming request.
+
+    Returns:
+        The response, if its status is lower than 400 (an exception is raised otherwise).
+    """
     rest_of_path = incoming_request.url.path.split(origin_base_path)[1].strip("/")
-    cookies = incoming_request.cookies
-    headers = dict(incoming_request.headers.items()) if not headers else headers
     redirect_url = f"{destination_base_path}/{rest_of_path}"
 
-    async def forward_response(response):
-        if response.status >= 400:
-            raise await upstream_exception_from_response(response)
-        headers_resp = dict(response.headers.items())
-        content = await response.read()
-        return Response(
-            status_code=response.status, content=content, headers=headers_resp
-        )
-
-    params = incoming_request.query_params
-    # after this eventual call, a subsequent call to 'body()' will hang forever
-    data = (
-        await incoming_request.body()
-        if incoming_request.method in ["POST", "PUT", "DELETE"]
-        else None
+    response = await reverse_proxy.forward(
+        incoming_request=incoming_request, url=redirect_url, headers=headers
     )
-
-    async with ClientSession(
-        connector=TCPConnector(verify_ssl=False),
-        auto_decompress=False,
-        cookies=cookies,
-        headers=headers,
-    ) as session:
-        if incoming_request.method == "GET":
-            async with await session.get(url=redirect_url, params=params) as resp:
-                return await forward_response(resp)
-
-        if incoming_request.method == "POST":
-            async with await session.post(
-                url=redirect_url, data=data, params=params
-            ) as resp:
-                return await forward_response(resp)
-
-        if incoming_request.method == "PUT":
-            async with await session.put(
-                url=redirect_url, data=data, params=params
-            ) as resp:
-                return await forward_response(resp)
-
-        if incoming_request.method == "DELETE":
-            async with await session.delete(
-                url=redirect_url, data=data, params=params
-            ) as resp:
-                return await forward_response(resp)
-
-        raise ValueError(f"Unexpected method {incoming_request.method}")
+    if response.status >= 400:
+        try:
+            raise await upstream_exception_from_response(response)
+        finally:
+            response.release()
+    return reverse_proxy.streaming_response(response)
 
 
 async def aiohttp_to_starlette_response(resp: ClientResponse) -> Response:
-    if resp.status < 300:
+    if resp.status < 300 or resp.status == 304:
         return Response(
             status_code=resp.status,
             content=await resp.read(),
@@ -103,6 +91,86 @@ def extract_bytes_ranges(request: Request) -> list[tuple[int, int]] | None:
     return [to_range_number(r) for r in ranges_str]
 
 
+def validators_headers(etag: str | None, last_modified: float | None) -> dict[str, str]:
+    """
+    Formats the validators of a representation into the `ETag` & `Last-Modified` headers.
+
+    Parameters:
+        etag: Opaque tag identifying the content of the representation (not quoted).
+        last_modified: Last modification time (EPOCH).
+
+    Returns:
+        The headers, only including the validators provided.
+    """
+    headers = {}
+    if etag:
+        headers["ETag"] = f'"{etag}"'
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, headers: Mapping[str, str]) -> bool:
+    """
+    Evaluates the conditional headers `If-None-Match` & `If-Modified-Since` of a `GET` (or `HEAD`) request
+    against the validators of the targeted representation, following
+    [RFC 9110](https://www.rfc-editor.org/rfc/rfc9110#section-13.2.2).
+
+    Parameters:
+        request: The incoming request.
+        headers: The headers of the representation, the validators `ETag` & `Last-Modified` are used if included.
+
+    Returns:
+        `True` if a `304 Not Modified` response can be returned, `False` otherwise.
+    """
+    if request.method not in ["GET", "HEAD"]:
+        return False
+
+    validators = {k.lower(): v for k, v in headers.items()}
+    etag = validators.get("etag")
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if not etag:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison is used for `If-None-Match`.
+        candidates = [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+        return etag.removeprefix("W/") in candidates
+
+    last_modified = validators.get("last-modified")
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return (
+            parsedate_to_datetime(last_modified).timestamp()
+            <= parsedate_to_datetime(if_modified_since).timestamp()
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    """
+    Creates a `304 Not Modified` response from the headers of the representation:
+    only validators & caching related headers are kept.
+
+    Parameters:
+        headers: The headers of the representation.
+
+    Returns:
+        The response.
+    """
+    kept = ["etag", "last-modified", "cache-control", "expires", "vary"]
+    return Response(
+        status_code=304,
+        headers={k: v for k, v in headers.items() if k.lower() in kept},
+    )
+
+
 def is_server_http_alive(url: str):
     try:
         with urlopen(url):
@@ -111,6 +179,154 @@ def is_server_http_alive(url: str):
         return False
 
 
+async def probe_server_http(url: str, timeout: float = 1.0) -> bool:
+    """
+    Asynchronously probes an HTTP server.
+
+    Parameters:
+        url: URL of the server.
+        timeout: Timeout (in seconds) of the probe.
+
+    Returns:
+        `True` if the server answered (whatever the status code), `False` otherwise.
+    """
+    try:
+        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
+            async with session.head(url, allow_redirects=False):
+                return True
+    except (ClientError, asyncio.TimeoutError):
+        return False
+
+
+@dataclass
+class LivenessEntry:
+    """
+    Liveness state of a destination monitored by
+    :class:`LivenessRegistry <youwol.utils.utils_requests.LivenessRegistry>`.
+    """
+
+    alive: bool = False
+    """
+    Result of the last probe.
+    """
+    failures: int = 0
+    """
+    Count of consecutive failed probes.
+    """
+    last_read: float = field(default_factory=time.monotonic)
+    """
+    Last time (monotonic clock) the state has been read.
+    """
+    probed: asyncio.Event = field(default_factory=asyncio.Event)
+    """
+    Set once the first probe completed.
+    """
+    refresh: asyncio.Event = field(default_factory=asyncio.Event)
+    """
+    Set to trigger a probe without waiting for the end of the current delay.
+    """
+
+
+class LivenessRegistry:
+    """
+    Registry of the liveness of HTTP destinations (*e.g.* dev-servers), probed in the background.
+
+    A destination is monitored from its first read: it is probed every `ttl` seconds while alive,
+    and with an exponential backoff (from `backoff_base` up to `backoff_max` seconds) while not.
+    A destination not read for `idle_timeout` seconds stops being monitored.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        idle_timeout: float = 600.0,
+        probe: Callable[[str], Awaitable[bool]] = probe_server_http,
+    ):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            ttl: Delay (in seconds) between two probes of an alive destination.
+            backoff_base: Initial delay (in seconds) between two probes of a dead destination.
+            backoff_max: Maximum delay (in seconds) between two probes of a dead destination.
+            idle_timeout: Duration (in seconds) without read after which a destination is not monitored anymore.
+            probe: Asynchronous probe of a destination.
+        """
+        self.ttl = ttl
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.idle_timeout = idle_timeout
+        self.probe = probe
+        self._entries: dict[str, LivenessEntry] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def is_alive(self, url: str) -> bool:
+        """
+        Returns the cached liveness of a destination.
+
+        The first read of a destination starts its monitoring and waits for the completion of the first
+        (asynchronous) probe; subsequent reads do not wait.
+
+        Parameters:
+            url: URL of the destination.
+
+        Returns:
+            Whether the destination answered the last probe.
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            entry = self._entries[url] = LivenessEntry()
+            task = asyncio.create_task(self._monitor(url=url, entry=entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        entry.last_read = time.monotonic()
+        await entry.probed.wait()
+        return entry.alive
+
+    def report_failure(self, url: str) -> None:
+        """
+        Reports a failure when connecting to a destination: it is considered dead and probed again immediately.
+
+        Parameters:
+            url: URL of the destination.
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            return
+        entry.alive = False
+        entry.failures = 0
+        entry.refresh.set()
+
+    async def _monitor(self, url: str, entry: LivenessEntry) -> None:
+        try:
+            while time.monotonic() - entry.last_read < self.idle_timeout:
+                entry.refresh.clear()
+                entry.alive = await self.probe(url)
+                entry.failures = 0 if entry.alive else entry.failures + 1
+                entry.probed.set()
+                delay = (
+                    self.ttl
+                    if entry.alive
+                    else min(
+                        self.backoff_base * 2 ** (entry.failures - 1), self.backoff_max
+                    )
+                )
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(entry.refresh.wait(), timeout=delay)
+        finally:
+            entry.probed.set()
+            if self._entries.get(url) is entry:
+                del self._entries[url]
+
+
+liveness_registry = LivenessRegistry()
+"""
+Registry used by the flow switches to know whether their destinations (*e.g.* dev servers) are listening.
+"""
+
+
 def aiohttp_file_form(
     filename: str, content_type: str, content: Any, file_id: str | None = None
 ) -> FormData:
@@ -3,13 +3,12 @@ import asyncio
 import os
 
 from asyncio.subprocess import Process
+from collections import deque
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 
 # typing
-from typing import cast
-
-# third parties
-from aiostream import stream
+from typing import TextIO, cast
 
 # Youwol utilities
 from youwol.utils.context import Context
@@ -28,13 +27,150 @@ def clone_environ(env_variables: dict[str, str]) -> dict[str, str]:
     return {**env, **env_variables}
 
 
+class OutputCapture:
+    """
+    Captures the output lines of a command with a bounded memory usage, see
+    :func:`execute_shell_cmd <youwol.utils.utils_shell.execute_shell_cmd>`.
+
+    *  The first `head_size` and last `tail_size` lines are kept in memory, the lines in between are omitted from
+       :meth:`outputs <youwol.utils.utils_shell.OutputCapture.outputs>`.
+    *  If `spill_path` is provided, all the lines are also appended to this file; it can be read incrementally
+       (while the command runs) using :func:`tail_file <youwol.utils.utils_shell.tail_file>`.
+    *  Lines are logged by batches: when `batch_size` lines are pending or every `batch_period` seconds.
+    """
+
+    def __init__(
+        self,
+        head_size: int = 1000,
+        tail_size: int = 10000,
+        spill_path: Path | None = None,
+        batch_size: int = 1000,
+        batch_period: float = 0.1,
+    ):
+        """
+        Initializes a new instance.
+
+        Parameters:
+            head_size: Count of first lines kept in memory.
+            tail_size: Count of last lines kept in memory.
+            spill_path: If provided, path of the file in which all the lines are appended.
+            batch_size: Maximum count of lines per log entry.
+            batch_period: Maximum duration (in seconds) a line waits before being logged.
+        """
+        self.head_size = head_size
+        self.tail_size = tail_size
+        self.spill_path = spill_path
+        self.batch_size = batch_size
+        self.batch_period = batch_period
+        self.lines_count = 0
+        self.__head: list[str] = []
+        self.__tail: deque[str] = deque(maxlen=tail_size)
+        self.__pending: list[str] = []
+        self.__spill: TextIO | None = None
+
+    def append(self, line: str) -> None:
+        """
+        Captures a line.
+
+        Parameters:
+            line: The line.
+        """
+        self.lines_count += 1
+        if len(self.__head) < self.head_size:
+            self.__head.append(line)
+        else:
+            self.__tail.append(line)
+        self.__pending.append(line)
+        if self.spill_path:
+            if not self.__spill:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self.__spill = self.spill_path.open("w", encoding="utf-8")
+            self.__spill.write(line)
+
+    def pending(self, force: bool = False) -> list[str]:
+        """
+        Retrieves the lines to log.
+
+        Parameters:
+            force: If `False`, lines are returned only if `batch_size` of them are pending.
+
+        Returns:
+            The lines, they are not pending anymore.
+        """
+        if not force and len(self.__pending) < self.batch_size:
+            return []
+        lines = self.__pending
+        self.__pending = []
+        return lines
+
+    def outputs(self) -> list[str]:
+        """
+        Returns:
+            The lines captured: the first and last ones, separated by a line reporting the count of lines omitted
+            if any.
+        """
+        omitted = self.lines_count - len(self.__head) - len(self.__tail)
+        if not omitted:
+            return [*self.__head, *self.__tail]
+        where = f" (see '{self.spill_path}')" if self.spill_path else ""
+        return [*self.__head, f"... {omitted} lines omitted{where} ...\n", *self.__tail]
+
+    def close(self) -> None:
+        """
+        Closes the spill file, if any.
+        """
+        if self.__spill:
+            self.__spill.close()
+            self.__spill = None
+
+
+def tail_file(path: Path, offset: int = 0) -> tuple[list[str], int]:
+    """
+    Reads the complete lines appended to a file from an offset, *e.g.* the spill file of an
+    :class:`OutputCapture <youwol.utils.utils_shell.OutputCapture>`.
+
+    Parameters:
+        path: Path of the file.
+        offset: Offset (in bytes) to start reading from, `0` on the first call then the offset returned by the
+            previous call.
+
+    Returns:
+        The lines read and the offset to use for the next call.
+    """
+    if not path.exists():
+        return [], offset
+    with path.open("rb") as fp:
+        fp.seek(offset)
+        content = fp.read()
+    end = content.rfind(b"\n") + 1
+    lines = content[:end].decode("utf-8", errors="replace").splitlines(keepends=True)
+    return lines, offset + end
+
+
 async def execute_shell_cmd(
     cmd: str,
     context: Context,
     log_outputs=True,
     on_executed: Callable[[Process, Context], Awaitable[None]] | None = None,
+    capture: OutputCapture | None = None,
     **kwargs,
 ) -> tuple[int, list[str]]:
+    """
+    Executes a shell command.
+
+    Parameters:
+        cmd: The command.
+        context: Current context.
+        log_outputs: Whether the output lines are logged, by batches.
+        on_executed: Callback called once the process is started.
+        capture: Capture of the output lines, default to an
+            :class:`OutputCapture <youwol.utils.utils_shell.OutputCapture>` with default parameters.
+        kwargs: Forwarded to `asyncio.create_subprocess_shell`.
+
+    Returns:
+        The return code and the output lines (stdout & stderr), see
+        :meth:`OutputCapture.outputs <youwol.utils.utils_shell.OutputCapture.outputs>`.
+    """
 
     async with context.start(
         action="execute 'shell' command",
@@ -52,13 +188,36 @@ async def execute_shell_cmd(
         )
         if on_executed:
             await on_executed(p, ctx)
-        outputs = []
-        async with stream.merge(p.stdout, p.stderr).stream() as messages_stream:
-            async for message in messages_stream:
-                outputs.append(message.decode("utf-8"))
-                if log_outputs:
-                    await ctx.info(text=outputs[-1])
-        await p.communicate()
+        capture = capture or OutputCapture()
+
+        async def log(lines: list[str]):
+            if log_outputs and lines:
+                await ctx.info(text="".join(lines))
+
+        async def log_periodically():
+            while True:
+                await asyncio.sleep(capture.batch_period)
+                await log(capture.pending(force=True))
+
+        async def read(pipe: asyncio.StreamReader | None):
+            # Reading chunks (split in lines here) is much faster than reading line by line.
+            remaining = b""
+            while pipe and (chunk := await pipe.read(2**16)):
+                *lines, remaining = (remaining + chunk).split(b"\n")
+                for line in lines:
+                    capture.append(line.decode("utf-8") + "\n")
+                await log(capture.pending())
+            if remaining:
+                capture.append(remaining.decode("utf-8"))
+
+        logger = asyncio.ensure_future(log_periodically())
+        try:
+            await asyncio.gather(read(p.stdout), read(p.stderr))
+            await p.communicate()
+        finally:
+            logger.cancel()
+            capture.close()
+        await log(capture.pending(force=True))
         # p.returncode can not be 'None' as the process has terminated
         return_code = cast(int, p.returncode)
-        return return_code, outputs
+        return return_code, capture.outputs()